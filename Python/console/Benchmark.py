@@ -0,0 +1,121 @@
+"""
+Wordle Benchmarks
+Author: Jace
+
+Description:
+Micro-benchmarks for the hot paths of the console game, run at several
+dictionary sizes with synthetic word lists:
+    check_guess          - scoring one guess (including keyboard tracking)
+    reset_game           - starting a new round
+    load_word_list       - parsing a word file from disk (no sidecar cache)
+    load_word_list_warm  - loading the same file from a fresh binary sidecar
+
+Each case is timed over several rounds, pytest-benchmark style (min, mean,
+stddev, ops/sec), and compared against the numbers stored in
+benchmark_baseline.json.
+
+Usage:
+    python Benchmark.py           # run and compare against the baseline
+    python Benchmark.py --save    # record the current numbers as the baseline
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import string
+import tempfile
+import timeit
+
+from Wordle import Wordle
+from wordle_core.words import load_word_list
+
+SIZES = (1_000, 10_000, 100_000)
+ROUNDS = 5
+GUESS_POOL = 10_000  # Distinct guesses, cycled so fast machines never run out
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+
+def synthetic_words(count, seed=0):
+    """Return count random lowercase 5-letter words (reproducible)."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(string.ascii_lowercase, k=5)) for _ in range(count)]
+
+
+def measure(func):
+    """
+    Time func over ROUNDS rounds, each long enough to be measurable.
+
+    Returns:
+        dict: min/mean/stddev seconds per call and ops per second.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    per_call = [t / number for t in timer.repeat(repeat=ROUNDS, number=number)]
+    mean = statistics.mean(per_call)
+    return {
+        "min": min(per_call),
+        "mean": mean,
+        "stddev": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "ops": 1.0 / mean,
+    }
+
+
+def run_benchmarks(sizes=SIZES):
+    """Run every case at every size and return {case name: stats}."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            words = synthetic_words(size)
+            game = Wordle(words)
+            guesses = itertools.cycle(synthetic_words(GUESS_POOL, seed=1))
+
+            results[f"check_guess[{size}]"] = measure(lambda: game.check_guess(next(guesses)))
+            results[f"reset_game[{size}]"] = measure(game.reset_game)
+
+            path = os.path.join(tmp, f"words_{size}.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(words))
+            results[f"load_word_list[{size}]"] = measure(
+                lambda: load_word_list(path, cache_dir=None))
+            # The sidecar lives in the temporary directory, so runs leave nothing behind
+            cache_dir = os.path.join(tmp, "cache")
+            load_word_list(path, cache_dir=cache_dir)
+            results[f"load_word_list_warm[{size}]"] = measure(
+                lambda: load_word_list(path, cache_dir=cache_dir))
+    return results
+
+
+def print_results(results, baseline):
+    """Print a results table, with the change in mean against the baseline."""
+    print(f"{'case':<28}{'min (us)':>12}{'mean (us)':>12}{'stddev':>10}{'ops/sec':>14}{'vs base':>10}")
+    for name, stats in results.items():
+        base = baseline.get(name)
+        change = f"{stats['mean'] / base['mean']:.2f}x" if base else "-"
+        print(f"{name:<28}{stats['min'] * 1e6:>12.2f}{stats['mean'] * 1e6:>12.2f}"
+              f"{stats['stddev'] * 1e6:>10.2f}{stats['ops']:>14,.0f}{change:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Wordle hot paths.")
+    parser.add_argument("--save", action="store_true", help="save results as the new baseline")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, "r") as f:
+            baseline = json.load(f)
+
+    results = run_benchmarks()
+    print_results(results, baseline)
+
+    if args.save:
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {BASELINE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,41 @@
+import argparse
+
 from Wordle import Wordle
+from wordle_core.difficulty import TIERS
+from wordle_core.scoring import MAX_WORD_LENGTH, MIN_WORD_LENGTH, WORD_LENGTH
+from wordle_core.words import load_word_list
 
 """
 Main Class that runs console based wordle game.
  """
 def main():
-    game = Wordle()
+    parser = argparse.ArgumentParser(description="Play Wordle in the console.")
+    parser.add_argument("--hard", action="store_true",
+                        help="hard mode: every guess must use all revealed hints")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH,
+                        choices=range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1),
+                        help="letters per word")
+    parser.add_argument("--attempts", type=int, default=6, help="guesses per game")
+    parser.add_argument("--dictionary", metavar="FILE",
+                        help="word file of allowed guesses (default: accept any word)")
+    parser.add_argument("--difficulty", choices=TIERS,
+                        help="only draw words from this difficulty tier")
+    start = parser.add_mutually_exclusive_group()
+    start.add_argument("--daily", action="store_true", help="start with today's puzzle")
+    start.add_argument("--puzzle", type=int, help="start with puzzle #N")
+    start.add_argument("--seed", type=int, help="start with a reproducible random word")
+    args = parser.parse_args()
+
+    if args.attempts < 1:
+        parser.error("--attempts must be at least 1")
+    if args.difficulty and (args.daily or args.puzzle is not None):
+        parser.error("--difficulty does not apply to scheduled puzzles")
+    dictionary = load_word_list(args.dictionary, args.length) if args.dictionary else None
+    game = Wordle(max_attempts=args.attempts, dictionary=dictionary, hard_mode=args.hard,
+                  length=args.length)
+    if args.daily or args.puzzle is not None or args.seed is not None or args.difficulty:
+        game.reset_game(seed=args.seed, puzzle=args.puzzle, daily=args.daily,
+                        difficulty=args.difficulty)
     game.play()
 
 if __name__ == "__main__":
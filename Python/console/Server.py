@@ -0,0 +1,165 @@
+"""
+Wordle Line Server
+Author: Jace
+
+Description:
+Hosts many Wordle games over a plain-text line protocol, one game per
+connection, on a single asyncio event loop. All rules live in the shared
+wordle_core.engine, so each connection costs one small Session object.
+
+Protocol (one command per line, lowercase or uppercase):
+    <word>         play a guess
+    NEW [N]        start a new game (puzzle #N if given)
+    QUIT           close the connection
+
+Replies (one line each):
+    WORDLE <length> <max attempts>   greeting, a game has started
+    OK <feedback> <attempt>/<max>    feedback: G correct, Y present, . absent
+    WIN <feedback> <attempts>
+    LOSE <feedback> <answer>
+    ERR <message>                    (ERR line too long also closes the connection)
+
+Usage:
+    python Server.py --port 7777                     # TCP
+    python Server.py --unix /tmp/wordle.sock         # local socket
+    python Server.py --length 6 --attempts 7         # 6-letter games
+    python Server.py --dictionary allowed.txt        # only accept listed guesses
+    nc 127.0.0.1 7777
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+# Make the shared Python/wordle_core package importable from this folder
+_PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PYTHON_DIR not in sys.path:
+    sys.path.insert(0, _PYTHON_DIR)
+
+from Wordle import Wordle
+from wordle_core.engine import LOST, WON, GameEngine, InvalidGuess
+from wordle_core.scoring import MAX_WORD_LENGTH, MIN_WORD_LENGTH, WORD_LENGTH, decode
+from wordle_core.words import load_shard, load_word_list
+
+_SYMBOLS = ".YG"
+
+
+def feedback_text(pattern, length=WORD_LENGTH):
+    """Render a pattern as G/Y/. characters."""
+    return "".join(_SYMBOLS[d] for d in decode(pattern, length))
+
+
+def handle_line(engine, session, line):
+    """
+    Apply one protocol line to a session.
+
+    Returns:
+        tuple: (reply line, session) - NEW replaces the session.
+               The reply is None for QUIT.
+    """
+    command, _, argument = line.strip().partition(" ")
+    command = command.lower()
+    if command == "quit":
+        return None, session
+    if command == "new":
+        try:
+            puzzle = int(argument) if argument else None
+        except ValueError:
+            return "ERR puzzle must be a number", session
+        session = engine.new_session(puzzle=puzzle)
+        return f"WORDLE {engine.length} {engine.max_attempts}", session
+
+    try:
+        pattern = engine.guess(session, command)
+    except InvalidGuess as exc:
+        return f"ERR {exc}", session
+    feedback = feedback_text(pattern, engine.length)
+    if session.state == WON:
+        return f"WIN {feedback} {session.attempts}", session
+    if session.state == LOST:
+        return f"LOSE {feedback} {engine.target(session)}", session
+    return f"OK {feedback} {session.attempts}/{engine.max_attempts}", session
+
+
+class WordleServer:
+    """
+    asyncio server running one engine session per connection.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        """Play games with one client until it quits or disconnects."""
+        self.connections += 1
+        session = self.engine.new_session()
+        writer.write(f"WORDLE {self.engine.length} {self.engine.max_attempts}\n".encode("ascii"))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Line longer than the stream buffer limit
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not line:
+                    break
+                reply, session = handle_line(self.engine, session, line.decode("ascii", "replace"))
+                if reply is None:
+                    break
+                writer.write(reply.encode("ascii") + b"\n")
+                # Only wait on slow readers; most replies fit in the socket buffer
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=7777, unix=None):
+        """Listen until cancelled."""
+        if unix:
+            server = await asyncio.start_unix_server(self.handle, path=unix, backlog=4096)
+        else:
+            server = await asyncio.start_server(self.handle, host, port, backlog=4096)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Wordle games over a line protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--seed", type=int, default=None, help="seed for random targets")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH,
+                        choices=range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1),
+                        help="letters per word")
+    parser.add_argument("--attempts", type=int, default=6, help="guesses per game")
+    parser.add_argument("--dictionary", metavar="FILE",
+                        help="word file of allowed guesses (default: accept any word)")
+    args = parser.parse_args()
+
+    if args.attempts < 1:
+        parser.error("--attempts must be at least 1")
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    # The console game's built-in word list, or the dictionary shard for other lengths
+    words = Wordle().word_list if args.length == WORD_LENGTH else load_shard(args.length)
+    dictionary = load_word_list(args.dictionary, args.length) if args.dictionary else None
+    engine = GameEngine(words, dictionary=dictionary, max_attempts=args.attempts,
+                        length=args.length)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Serving Wordle on {where}")
+    try:
+        asyncio.run(WordleServer(engine).serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
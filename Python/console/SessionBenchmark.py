@@ -0,0 +1,146 @@
+"""
+Wordle Session Benchmark
+Author: Jace
+
+Description:
+Measures the multi-game engine and line server at many concurrent sessions:
+    memory   - bytes per Session after a few guesses (tracemalloc)
+    engine   - guesses/sec scored directly through GameEngine
+    server   - guesses/sec through Server.py with every session on its
+               own open connection (server runs in a child process)
+
+Usage:
+    python SessionBenchmark.py                  # 10,000 sessions
+    python SessionBenchmark.py --sessions 2000 --skip-server
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from Wordle import Wordle
+from wordle_core.engine import PLAYING, GameEngine, InvalidGuess
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Server.py")
+
+
+def bench_memory(engine, sessions, rng):
+    """Return average bytes per session after three guesses each."""
+    words = list(engine.word_list)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = [engine.new_session(rng) for _ in range(sessions)]
+    for game in games:
+        for word in rng.sample(words, 3):
+            try:
+                engine.guess(game, word)
+            except InvalidGuess:
+                pass  # Already won
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / sessions
+
+
+def bench_engine(engine, sessions, rng):
+    """Play every session to the end, one guess each in turn; return guesses/sec."""
+    words = list(engine.word_list)
+    games = [engine.new_session(rng) for _ in range(sessions)]
+    plans = [rng.sample(words, engine.max_attempts) for _ in range(sessions)]
+    guesses = 0
+    start = time.perf_counter()
+    for turn in range(engine.max_attempts):
+        for game, plan in zip(games, plans):
+            if game.state == PLAYING:
+                engine.guess(game, plan[turn])
+                guesses += 1
+    return guesses / (time.perf_counter() - start)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def bench_server(port, sessions, words, rng):
+    """
+    Open one connection per session, then play every game to the end with
+    all connections live. Returns (guesses/sec, errors).
+    """
+    connect_limit = asyncio.Semaphore(500)  # Stay under the listen backlog
+
+    async def connect():
+        async with connect_limit:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await reader.readline()  # Greeting
+            return reader, writer
+
+    connections = await asyncio.gather(*(connect() for _ in range(sessions)))
+    plans = [rng.sample(words, 6) for _ in range(sessions)]
+    counts = {"guesses": 0, "errors": 0}
+
+    async def play(reader, writer, plan):
+        for word in plan:
+            writer.write(word.encode("ascii") + b"\n")
+            reply = await reader.readline()
+            counts["guesses"] += 1
+            if reply.startswith(b"ERR"):
+                counts["errors"] += 1
+            if not reply.startswith(b"OK"):
+                break
+        writer.write(b"QUIT\n")
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play(r, w, plan) for (r, w), plan in zip(connections, plans)))
+    return counts["guesses"] / (time.perf_counter() - start), counts["errors"]
+
+
+def wait_for_port(port, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server did not start on port {port}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent Wordle sessions.")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-server", action="store_true", help="only benchmark in-process")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = GameEngine(Wordle().word_list)
+    print(f"Sessions: {args.sessions:,}  Words: {len(engine.word_list)}")
+    print(f"memory   {bench_memory(engine, args.sessions, rng):10.0f} bytes/session")
+    print(f"engine   {bench_engine(engine, args.sessions, rng):10,.0f} guesses/sec")
+
+    if args.skip_server:
+        return
+    port = free_port()
+    server = subprocess.Popen([sys.executable, SERVER, "--port", str(port)],
+                              stdout=subprocess.DEVNULL)
+    try:
+        wait_for_port(port)
+        rate, errors = asyncio.run(bench_server(port, args.sessions, list(engine.word_list), rng))
+        print(f"server   {rate:10,.0f} guesses/sec ({errors} errors)")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Wordle Simulation Harness
+Author: Jace
+
+Description:
+Plays many games of the console Wordle without input() or print(),
+spread across a process pool, and reports throughput, win rate, the
+guess-count distribution and where the time went.
+
+Strategies:
+    random    - any word still consistent with the feedback
+    frequency - the candidate whose letters are most common among candidates
+    solver    - entropy-maximising hints from wordle_core.solver
+
+Usage:
+    python Simulate.py --games 10000 --strategy frequency --workers 4
+"""
+
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from Wordle import Wordle
+from wordle_core.scoring import from_feedback, is_solved, score
+
+
+# ----------------------------
+# Strategies
+# ----------------------------
+class RandomStrategy:
+    """Guess a random word that is still consistent with all feedback."""
+
+    def __init__(self, word_list, rng):
+        self.words = list(dict.fromkeys(word_list))
+        self.rng = rng
+        self.candidates = self.words
+
+    def new_game(self):
+        """Forget the previous game."""
+        self.candidates = self.words
+
+    def next_guess(self):
+        """Return the next word to play."""
+        return self.rng.choice(self.candidates)
+
+    def observe(self, guess, pattern):
+        """Narrow the candidates with the feedback for guess."""
+        self.candidates = [w for w in self.candidates if score(guess, w) == pattern]
+
+
+class FrequencyStrategy(RandomStrategy):
+    """Guess the candidate whose distinct letters are most common among candidates."""
+
+    def next_guess(self):
+        freq = Counter(ch for word in self.candidates for ch in set(word))
+        return max(self.candidates, key=lambda word: sum(freq[ch] for ch in set(word)))
+
+
+class SolverStrategy:
+    """Guess what the entropy solver suggests."""
+
+    def __init__(self, word_list, rng):
+        # Imported here so the other strategies run without NumPy
+        from wordle_core.solver import get_solver
+        self.solver = get_solver(word_list)
+        self.state = self.solver.new_state()
+
+    def new_game(self):
+        self.state = self.solver.new_state()
+
+    def next_guess(self):
+        return self.state.hint()
+
+    def observe(self, guess, pattern):
+        self.state.update(guess, pattern)
+
+
+STRATEGIES = {
+    "random": RandomStrategy,
+    "frequency": FrequencyStrategy,
+    "solver": SolverStrategy,
+}
+
+
+# ----------------------------
+# Worker: plays a batch of games in one process
+# ----------------------------
+def play_games(strategy_name, game_count, seed, word_list=None):
+    """
+    Play game_count games and return raw statistics.
+
+    Args:
+        strategy_name (str): Key into STRATEGIES.
+        game_count (int): Games to play.
+        seed (int): Seed for target selection and the strategy.
+        word_list (list, optional): Words to play with. Defaults to the game's list.
+
+    Returns:
+        dict: wins, games, guess counts and per-phase seconds.
+    """
+    random.seed(seed)  # Wordle.reset_game draws from the global generator
+    game = Wordle(word_list)
+    strategy = STRATEGIES[strategy_name](game.word_list, random.Random(seed))
+    timings = {"reset": 0.0, "strategy": 0.0, "check": 0.0}
+    guesses = Counter()
+    wins = 0
+
+    for _ in range(game_count):
+        start = time.perf_counter()
+        game.reset_game()
+        timings["reset"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        strategy.new_game()
+        timings["strategy"] += time.perf_counter() - start
+
+        won = False
+        while game.attempts < game.max_attempts and not won:
+            start = time.perf_counter()
+            guess = strategy.next_guess()
+            timings["strategy"] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            pattern = from_feedback(game.submit_guess(guess))
+            timings["check"] += time.perf_counter() - start
+
+            won = is_solved(pattern, game.length)
+            if not won:
+                start = time.perf_counter()
+                strategy.observe(guess, pattern)
+                timings["strategy"] += time.perf_counter() - start
+
+        if won:
+            wins += 1
+            guesses[game.attempts] += 1
+        else:
+            guesses["X"] += 1
+
+    return {"games": game_count, "wins": wins, "guesses": guesses, "timings": timings}
+
+
+# ----------------------------
+# Driver
+# ----------------------------
+def run_simulation(strategy_name, games, workers=None, seed=0, word_list=None):
+    """
+    Split games across a process pool and merge the results.
+
+    Returns:
+        dict: Merged statistics plus wall-clock seconds and games/sec.
+    """
+    workers = workers or os.cpu_count() or 1
+    # A few batches per worker keeps the pool busy if batches finish unevenly
+    batches = max(1, min(games, workers * 4))
+    sizes = [games // batches + (1 if i < games % batches else 0) for i in range(batches)]
+
+    start = time.perf_counter()
+    merged = {"games": 0, "wins": 0, "guesses": Counter(),
+              "timings": {"reset": 0.0, "strategy": 0.0, "check": 0.0}}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_games, strategy_name, size, seed + i, word_list)
+                   for i, size in enumerate(sizes)]
+        for future in futures:
+            result = future.result()
+            merged["games"] += result["games"]
+            merged["wins"] += result["wins"]
+            merged["guesses"].update(result["guesses"])
+            for phase, seconds in result["timings"].items():
+                merged["timings"][phase] += seconds
+
+    merged["wall"] = time.perf_counter() - start
+    merged["games_per_sec"] = merged["games"] / merged["wall"] if merged["wall"] else 0.0
+    return merged
+
+
+def print_report(strategy_name, stats):
+    """Print a human-readable summary of run_simulation results."""
+    games = stats["games"]
+    print(f"Strategy: {strategy_name}")
+    print(f"Games: {games}  Wall: {stats['wall']:.2f}s  Throughput: {stats['games_per_sec']:.1f} games/sec")
+    print(f"Win rate: {100.0 * stats['wins'] / games:.1f}%")
+
+    print("\nGuess distribution:")
+    for key in sorted((k for k in stats["guesses"] if k != "X")) + ["X"]:
+        count = stats["guesses"].get(key, 0)
+        print(f"  {key}: {count:>7}  {'#' * round(40 * count / games)}")
+
+    print("\nTime per game (summed across workers):")
+    for phase, seconds in stats["timings"].items():
+        print(f"  {phase:<9} {1e6 * seconds / games:10.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play headless Wordle games in parallel.")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="frequency")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    args = parser.parse_args()
+
+    stats = run_simulation(args.strategy, args.games, args.workers, args.seed)
+    print_report(args.strategy, stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,26 @@ Author: Jace
 Date: 2026-01-14
 
 Description:
-A fully self-contained console-based Wordle game.
+A console-based Wordle game.
 All code written by the author. No external code sources used.
+Feedback scoring is shared with the GUI game through Python/wordle_core.
 """
 
+import os
 import random
 import string
+import sys
+
+# Make the shared Python/wordle_core package importable from this folder
+_PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PYTHON_DIR not in sys.path:
+    sys.path.insert(0, _PYTHON_DIR)
+
+from wordle_core.constraints import CandidateSet
+from wordle_core.difficulty import get_difficulty_index
+from wordle_core.schedule import get_schedule, puzzle_number
+from wordle_core.scoring import WORD_LENGTH, score, to_feedback
+from wordle_core.words import as_word_list, is_valid_word, load_shard
 
 # ANSI color codes for terminal output
 RESET = "\033[0m"
@@ -24,11 +38,21 @@ class Wordle:
     # ----------------------------
     # Constructor: Initializes game settings and starts a new game
     # ----------------------------
-    def __init__(self, word_list=None, max_attempts=6):
+    def __init__(self, word_list=None, max_attempts=6, dictionary=None, hard_mode=False,
+                 length=WORD_LENGTH):
         """
         Initialize the Wordle game with a word list and attempt limit.
+        Guesses must appear in dictionary (a separate list of allowed
+        guesses) when one is given; otherwise any word of length letters is
+        accepted. The word list is only used to pick targets.
+        In hard mode every guess must use all revealed hints.
+        Words are length letters long (4-8); without a word list, lengths
+        other than 5 play from that length's dictionary shard.
         """
-        self.word_list = word_list or [
+        self.length = length
+        if word_list is None and length != WORD_LENGTH:
+            word_list = load_shard(length)
+        self.word_list = as_word_list(word_list or [
             "apple", "grape", "mango", "peach", "berry",
             "lemon", "melon", "chess", "flame", "brick",
             "train", "plant", "shore", "stone", "snake",
@@ -50,19 +74,61 @@ class Wordle:
             "nudge", "orbit", "plume", "quark", "raven",
             "swirl", "trove", "ultra", "vixen", "wreak",
             "yodel", "night", "amber", "bliss", "crisp"
-        ]
+        ], length)
+        self.dictionary = as_word_list(dictionary, length) if dictionary else None
         self.max_attempts = max_attempts
+        self.hard_mode = hard_mode
+        self._schedule = None  # Puzzle schedule, built on the first scheduled game
+        self._difficulty = None  # Difficulty index, built on the first tiered game
         self.reset_game()
 
     # ----------------------------
     # Resets all game variables for a new round
     # ----------------------------
-    def reset_game(self):
-        """Reset game state for a new round."""
-        self.target_word = random.choice(self.word_list)
+    def reset_game(self, seed=None, puzzle=None, daily=False, difficulty=None):
+        """
+        Reset game state for a new round.
+        The target is random unless daily (today's puzzle), puzzle (puzzle
+        #N from the shared schedule) or seed (reproducible pick) is given.
+        difficulty ("easy", "medium" or "hard") limits random and seeded
+        picks to that tier of the difficulty index.
+        """
+        if daily:
+            puzzle = puzzle_number()
+        self.puzzle_number = puzzle
+        self.difficulty = difficulty if puzzle is None else None
+        rng = random.Random(seed) if seed is not None else random
+        if puzzle is not None:
+            self.target_word = self.schedule().answer(puzzle)
+        elif difficulty is not None:
+            self.target_word = self.difficulty_index().choice(difficulty, rng)
+        else:
+            self.target_word = rng.choice(self.word_list)
         self.attempts = 0
         self.previous_guesses = []
+        self.guessed_words = set()  # O(1) repeat-guess check
+        self.candidates = CandidateSet(self.word_list, self.length)  # Narrowed after every guess
         self.letter_status = {ch: "unused" for ch in string.ascii_lowercase}
+        self._solver_state = None  # Created on the first hint request
+        self._solver_moves = 0     # Guesses already applied to the solver state
+
+    # ----------------------------
+    # Shared answer schedule for numbered and daily puzzles
+    # ----------------------------
+    def schedule(self):
+        """Return the keyed puzzle schedule for this word list."""
+        if self._schedule is None:
+            self._schedule = get_schedule(self.word_list)
+        return self._schedule
+
+    # ----------------------------
+    # Answers rated easy/medium/hard for tiered games
+    # ----------------------------
+    def difficulty_index(self):
+        """Return the difficulty index for this word list (cached on disk)."""
+        if self._difficulty is None:
+            self._difficulty = get_difficulty_index(self.word_list, self.length)
+        return self._difficulty
 
     # ----------------------------
     # Prompts the user for a valid guess and validates input
@@ -72,12 +138,18 @@ class Wordle:
         while True:
             guess = input(f"Attempt {self.attempts + 1}/{self.max_attempts}: ").lower().strip()
 
-            if len(guess) != 5:
-                print("Invalid input: Enter exactly 5 letters.")
-            elif not guess.isalpha():
+            if guess == "?":
+                print(f"Hint: try '{self.hint()}'.")
+            elif len(guess) != self.length:
+                print(f"Invalid input: Enter exactly {self.length} letters.")
+            elif not is_valid_word(guess, self.length):
                 print("Invalid input: Letters only.")
-            elif guess in [g for g, _ in self.previous_guesses]:
+            elif guess in self.guessed_words:
                 print("You already guessed that word.")
+            elif self.dictionary is not None and guess not in self.dictionary:
+                print("Not in word list.")
+            elif self.hard_mode and not self.candidates.constraints.satisfies_hard_mode(guess):
+                print(f"Hard mode: {self.candidates.constraints.hard_mode_error(guess)}.")
             else:
                 return guess
 
@@ -87,20 +159,7 @@ class Wordle:
     # ----------------------------
     def check_guess(self, guess):
         """Compare guess to target word and return feedback list."""
-        feedback = ["absent"] * 5
-        target_letters = list(self.target_word)
-
-        # First pass: exact matches
-        for i, letter in enumerate(guess):
-            if letter == target_letters[i]:
-                feedback[i] = "correct"
-                target_letters[i] = None
-
-        # Second pass: correct letters in wrong positions
-        for i, letter in enumerate(guess):
-            if feedback[i] == "absent" and letter in target_letters:
-                feedback[i] = "present"
-                target_letters[target_letters.index(letter)] = None
+        feedback = to_feedback(score(guess, self.target_word), self.length)
 
         # Update keyboard tracking
         for i, letter in enumerate(guess):
@@ -113,6 +172,47 @@ class Wordle:
 
         return feedback
 
+    # ----------------------------
+    # Plays one guess: scores it and records it in the game history
+    # ----------------------------
+    def submit_guess(self, guess):
+        """Use up an attempt on guess and return its feedback list."""
+        self.attempts += 1
+        feedback = self.check_guess(guess)
+        self.previous_guesses.append((guess, feedback))
+        self.guessed_words.add(guess)
+        self.candidates.update(guess, score(guess, self.target_word))
+        return feedback
+
+    # ----------------------------
+    # Queries against everything the feedback has revealed so far
+    # ----------------------------
+    def remaining_candidates(self):
+        """Return the words that could still be the target."""
+        return self.candidates.remaining()
+
+    def is_consistent(self, word):
+        """Return True if word fits the feedback of every guess so far."""
+        return self.candidates.is_consistent(word)
+
+    # ----------------------------
+    # Suggests the next guess with the highest expected information gain
+    # ----------------------------
+    def hint(self):
+        """Return the best next guess over the words still possible."""
+        # Imported here so the game itself runs without NumPy
+        from wordle_core.solver import get_solver
+
+        if self._solver_state is None:
+            self._solver_state = get_solver(self.word_list).new_state()
+            self._solver_moves = 0
+
+        # Only narrow by guesses made since the last hint
+        for guess, _ in self.previous_guesses[self._solver_moves:]:
+            self._solver_state.update(guess, score(guess, self.target_word))
+        self._solver_moves = len(self.previous_guesses)
+        return self._solver_state.hint()
+
     # ----------------------------
     # Displays previous guesses and available keyboard letters
     # ----------------------------
@@ -135,24 +235,30 @@ class Wordle:
             color = GREEN if status == "correct" else \
                     YELLOW if status == "present" else RESET
             print(f"{color}{ch}{RESET}", end=" ")
-        print("\n" + "-" * 40)
+        print(f"\n\nWords still possible: {len(self.candidates)}")
+        print("-" * 40)
 
     # ----------------------------
     # Runs a single round of Wordle gameplay
     # ----------------------------
     def play_round(self):
         """Run one round of Wordle."""
-        print("\nWelcome to Wordle! Guess the 5-letter word.")
+        print(f"\nWelcome to Wordle! Guess the {self.length}-letter word.")
+        if self.puzzle_number is not None:
+            print(f"Puzzle #{self.puzzle_number}")
+        if self.difficulty is not None:
+            print(f"Difficulty: {self.difficulty}")
         print(f"{GREEN}Green{RESET}: correct spot")
         print(f"{YELLOW}Yellow{RESET}: wrong spot")
         print(f"{GRAY}Gray{RESET}: not in word")
+        if self.hard_mode:
+            print("Hard mode: every guess must use all revealed hints.")
+        print("Type ? for a hint.")
         print("-" * 40)
 
         while self.attempts < self.max_attempts:
             guess = self.get_guess()
-            self.attempts += 1
-            feedback = self.check_guess(guess)
-            self.previous_guesses.append((guess, feedback))
+            feedback = self.submit_guess(guess)
             self.display()
 
             if all(f == "correct" for f in feedback):
@@ -175,7 +281,7 @@ class Wordle:
                 print("Please enter 'y' or 'n'.")
 
             if choice == "y":
-                self.reset_game()
+                self.reset_game(difficulty=self.difficulty)
             else:
                 print("Thanks for playing!")
                 break
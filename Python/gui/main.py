@@ -1,11 +1,30 @@
+import os
+import queue
+import sys
+import threading
 import tkinter as tk
 from tkinter import messagebox
 import random
 
-# Load words from external file
-def load_word_list(filename="words.txt"):
-    with open(filename, "r") as f:
-        return [line.strip().lower() for line in f.readlines() if line.strip()]
+# Make the shared Python/wordle_core package importable from this folder
+_PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PYTHON_DIR not in sys.path:
+    sys.path.insert(0, _PYTHON_DIR)
+
+from wordle_core.constraints import CandidateSet
+from wordle_core.difficulty import TIERS, get_difficulty_index
+from wordle_core.schedule import get_schedule, puzzle_number
+from wordle_core.scoring import WORD_LENGTH, score, to_emoji
+from wordle_core.words import WordShards, as_word_list, is_valid_word
+
+# Resolved next to this file, so the game starts from any working directory
+WORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.txt")
+# Set WORDLE_DEBUG=1 to print each target word (never shown otherwise)
+DEBUG = bool(os.environ.get("WORDLE_DEBUG"))
+LOAD_POLL_MS = 15  # How often the Tk loop checks for the background word load
+# 5-letter words come from words.txt, other lengths from the shared shards
+SHARDS = WordShards(files={WORD_LENGTH: WORDS_FILE})
+
 
 class Wordle:
     """
@@ -14,33 +33,90 @@ class Wordle:
     Features:
     - Randomly selects a target word from a list
     - Tracks guesses and provides feedback using colored emojis
+      (scored by the shared wordle_core engine, same rules as the console game)
     - Checks for game over conditions (win/loss)
     """
 
-    def __init__(self, word_list=None):
+    def __init__(self, word_list=None, hard_mode=False, length=WORD_LENGTH, max_attempts=6,
+                 dictionary=None):
         """
         Initialize the Wordle game.
 
         Args:
-            word_list (list, optional): Custom list of words to use. Defaults to a preset list.
+            word_list (list, optional): Custom list of words to use. Defaults to
+                words.txt for 5 letters and the dictionary shard for other lengths.
+            hard_mode (bool): Require every guess to use all revealed hints.
+            length (int): Letters per word (4-8).
+            max_attempts (int): Guesses per game.
+            dictionary (list, optional): Allowed guesses. Without one, any
+                word of length letters is accepted; word_list only picks targets.
         """
-        # Use provided word list or load from file
-        self.word_list = word_list or load_word_list()
+        self.hard_mode = hard_mode
+        self.length = length
+        self.max_attempts = max_attempts
+        # Use provided word list or load from file (deduplicated and validated)
+        self.word_list = as_word_list(word_list, length) if word_list else SHARDS[length]
+        self.dictionary = as_word_list(dictionary, length) if dictionary else None
+        self._schedule = None  # Puzzle schedule, built on the first scheduled game
+        self._difficulty = None  # Difficulty index, built on the first tiered game
         # Start a new game
         self.reset_game()
 
-    def reset_game(self):
+    def reset_game(self, seed=None, puzzle=None, daily=False, difficulty=None):
         """
         Reset the game state:
-        - Pick a random target word
+        - Pick the target word: today's puzzle (daily), puzzle #N from the
+          shared schedule (puzzle), a reproducible pick (seed), or random,
+          optionally limited to one difficulty tier
         - Clear previous attempts
-        - Set maximum allowed attempts
+
+        Args:
+            seed (int, optional): Seed for a reproducible target.
+            puzzle (int, optional): Scheduled puzzle number.
+            daily (bool): Play today's scheduled puzzle.
+            difficulty (str, optional): "easy", "medium" or "hard": draw
+                random and seeded targets from that tier only.
         """
-        self.target_word = random.choice(self.word_list)
+        if daily:
+            puzzle = puzzle_number()
+        self.puzzle_number = puzzle
+        self.difficulty = difficulty if puzzle is None else None
+        rng = random.Random(seed) if seed is not None else random
+        if puzzle is not None:
+            self.target_word = self.schedule().answer(puzzle)
+        elif difficulty is not None:
+            self.target_word = self.difficulty_index().choice(difficulty, rng)
+        else:
+            self.target_word = rng.choice(self.word_list)
         self.attempts = []
-        self.max_attempts = 6
-        # Debug print to check target word (can be removed in production)
-        print(f"Target word: {self.target_word}")
+        self.candidates = CandidateSet(self.word_list, self.length)  # Narrowed after every guess
+        self._solver_state = None  # Created on the first hint request
+        self._solver_moves = 0     # Attempts already applied to the solver state
+        if DEBUG:
+            print(f"Target word: {self.target_word}")
+
+    def schedule(self):
+        """
+        Keyed puzzle schedule for this word list, built on first use.
+
+        Returns:
+            Schedule: Answers by puzzle number.
+        """
+        if self._schedule is None:
+            self._schedule = get_schedule(self.word_list)
+        return self._schedule
+
+    def difficulty_index(self):
+        """
+        Answers rated easy/medium/hard for this word list, built on first
+        use (only words missing from the disk cache are rated).
+
+        Returns:
+            DifficultyIndex: Ratings and tiers.
+        """
+        if self._difficulty is None:
+            self._difficulty = get_difficulty_index(self.word_list, self.length)
+        return self._difficulty
 
     def guess(self, word):
         """
@@ -53,23 +129,90 @@ class Wordle:
             str: Feedback string using colored emojis
         """
         word = word.lower()
-        if len(word) != 5:
-            return "Word must be 5 letters!"
-
-        feedback = ""
-        # Compare guess to target word
-        for i in range(5):
-            if word[i] == self.target_word[i]:
-                feedback += "🟩"  # Correct letter in correct position
-            elif word[i] in self.target_word:
-                feedback += "🟨"  # Correct letter in wrong position
-            else:
-                feedback += "⬜"  # Letter not in word
+        if len(word) != self.length:
+            return f"Word must be {self.length} letters!"
 
-        # Record this guess and feedback
+        # Compare guess to target word (🟩 correct, 🟨 wrong spot, ⬜ not in word)
+        pattern = score(word, self.target_word)
+        feedback = to_emoji(pattern, self.length)
+
+        # Record this guess and feedback, and rule out words it contradicts
         self.attempts.append((word, feedback))
+        self.candidates.update(word, pattern)
         return feedback
 
+    def hard_mode_error(self, word):
+        """
+        Check a guess against hard mode using the accumulated constraint masks.
+
+        Args:
+            word (str): The guessed word
+
+        Returns:
+            str | None: Why the guess breaks hard mode, or None if it is allowed
+        """
+        if not self.hard_mode:
+            return None
+        return self.candidates.constraints.hard_mode_error(word.lower())
+
+    def remaining_candidates(self):
+        """
+        Words that could still be the target, given every guess so far.
+
+        Returns:
+            list: Remaining candidate words.
+        """
+        return self.candidates.remaining()
+
+    def is_consistent(self, word):
+        """
+        Check whether a word fits the feedback of every guess so far.
+
+        Args:
+            word (str): The word to check
+
+        Returns:
+            bool: True if the word could still be the target
+        """
+        return self.candidates.is_consistent(word.lower())
+
+    def is_valid_word(self, word):
+        """
+        Check a guess against the dictionary in O(1), or only its letters
+        when no dictionary was given.
+
+        Args:
+            word (str): The guessed word
+
+        Returns:
+            bool: True if the word is an allowed guess
+        """
+        word = word.lower()
+        if self.dictionary is None:
+            return is_valid_word(word, self.length)
+        return word in self.dictionary
+
+    def hint(self):
+        """
+        Suggest the next guess with the highest expected information gain.
+        The solver's candidate set is narrowed only by attempts made since
+        the previous hint.
+
+        Returns:
+            str: Suggested word.
+        """
+        # Imported here so the game itself runs without NumPy
+        from wordle_core.solver import get_solver
+
+        if self._solver_state is None:
+            self._solver_state = get_solver(self.word_list).new_state()
+            self._solver_moves = 0
+
+        for word, _ in self.attempts[self._solver_moves:]:
+            self._solver_state.update(word, score(word, self.target_word))
+        self._solver_moves = len(self.attempts)
+        return self._solver_state.hint()
+
     def is_game_over(self):
         """
         Check if the game has ended (win or loss).
@@ -85,14 +228,110 @@ class Wordle:
             return True, f"You lost! The word was '{self.target_word}'"
         return False, ""  # Game continues
 
+class BoardModel:
+    """
+    In-memory state of the guess grid and on-screen keyboard.
+
+    The GUI never reads state back out of its widgets. Every change goes
+    through this model, which returns a minimal diff: a list of
+    (widget key, {property: value}) for only the properties that actually
+    changed. WordleApp applies each diff in one pass.
+
+    Widget keys are ("cell", row, col) and ("key", LETTER).
+    Cell states: "default", "correct", "present", "absent".
+    """
+
+    # Keyboard keys only ever move up this ranking (green beats yellow beats gray)
+    KEY_RANK = {"default": 0, "absent": 1, "present": 2, "correct": 3}
+
+    def __init__(self, rows=6, cols=5, letters="QWERTYUIOPASDFGHJKLZXCVBNM"):
+        """
+        Args:
+            rows (int): Guesses on the board.
+            cols (int): Letters per guess.
+            letters (str): Keyboard letters.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.texts = [[""] * cols for _ in range(rows)]
+        self.states = [["default"] * cols for _ in range(rows)]
+        self.keys = {letter: "default" for letter in letters}
+
+    def set_letter(self, row, col, text):
+        """
+        Set (or clear, with "") the letter in one cell.
+
+        Returns:
+            list: Diff for the cell, empty if it already showed text.
+        """
+        if self.texts[row][col] == text:
+            return []
+        self.texts[row][col] = text
+        return [(("cell", row, col), {"text": text})]
+
+    def row_word(self, row):
+        """Return the letters typed into a row."""
+        return "".join(self.texts[row])
+
+    def apply_guess(self, row, word, states):
+        """
+        Color a submitted row and upgrade the keyboard.
+
+        Args:
+            row (int): Row the guess was typed in.
+            word (str): Uppercase guess.
+            states (list[str]): "correct"/"present"/"absent" per letter.
+
+        Returns:
+            list: Diff for the cells and keys whose state changed.
+        """
+        diff = []
+        for col, state in enumerate(states):
+            if self.states[row][col] != state:
+                self.states[row][col] = state
+                diff.append((("cell", row, col), {"state": state}))
+
+        for letter, state in zip(word, states):
+            old = self.keys.get(letter)
+            if old is not None and self.KEY_RANK[state] > self.KEY_RANK[old]:
+                self.keys[letter] = state
+                diff.append((("key", letter), {"state": state}))
+        return diff
+
+    def reset(self):
+        """
+        Clear the board and keyboard.
+
+        Returns:
+            list: Diff for only the cells and keys that were not already clear.
+        """
+        diff = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                changes = {}
+                if self.texts[row][col]:
+                    self.texts[row][col] = ""
+                    changes["text"] = ""
+                if self.states[row][col] != "default":
+                    self.states[row][col] = "default"
+                    changes["state"] = "default"
+                if changes:
+                    diff.append((("cell", row, col), changes))
+        for letter, state in self.keys.items():
+            if state != "default":
+                self.keys[letter] = "default"
+                diff.append((("key", letter), {"state": "default"}))
+        return diff
+
+
 class WordleApp:
     """
     GUI application for the Wordle game using Tkinter.
 
     Features:
-    - 6x5 grid for guesses
+    - Grid for guesses (6x5 by default, 4-8 letters and any number of rows)
     - On-screen clickable keyboard
-    - Backspace and Submit buttons
+    - Backspace, Submit and Hint buttons, Hard mode toggle, word length choice
     - Keyboard colors updated based on feedback
     """
 
@@ -102,54 +341,195 @@ class WordleApp:
         "present": "#c9b458",  # Yellow for correct letters in wrong position
         "absent": "#595959"    # Dark gray for keyboard letters not in word
     }
+    # Grid cells for absent letters stay light gray; only keys turn dark
+    CELL_COLORS = dict(COLORS, absent=COLORS["default"])
+    FEEDBACK_STATES = {"🟩": "correct", "🟨": "present", "⬜": "absent"}
 
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, word_list=None, words_file=WORDS_FILE,
+                 length=WORD_LENGTH, max_attempts=6):
         """
         Initialize the Wordle GUI application.
+        The window is built right away; unless word_list is given, the
+        dictionary is loaded on a background thread and the game starts
+        when it arrives.
 
         Args:
             root (tk.Tk): Root Tkinter window.
+            word_list (list, optional): Words to play with instead of the dictionary.
+            words_file (str): Word file for 5-letter games.
+            length (int): Letters per word (4-8).
+            max_attempts (int): Guesses per game (rows on the board).
         """
         self.root = root
         self.root.title("Wordle GUI")
-        self.game = Wordle()  # Wordle game logic object
+        self.game = None  # Wordle game logic object, created once the words are loaded
+        self.shards = WordShards(files={WORD_LENGTH: words_file})  # Loaded per length on use
+        self.model = BoardModel(rows=max_attempts, cols=length)  # Board and keyboard state
         self.letter_labels = {}  # Stores keyboard letter labels
-        self.grid_labels = []    # 6x5 grid for guesses
+        self.grid_labels = []    # Grid of labels for guesses
         self.current_row = 0     # Track which row of the grid we're filling
         self.current_col = 0     # Track current letter position in row
+        self._loaded = None      # Queue of the background word load in progress
+        self._rated = None       # Queue of the background difficulty rating in progress
 
         # Create GUI elements
         self.create_widgets()
 
+        if word_list:
+            self.start_game(word_list)
+        else:
+            self.load_words(length)
+
+    def load_words(self, length):
+        """
+        Load the dictionary for a word length on a background thread (from
+        the binary cache when fresh) and hand it to the Tk loop with after().
+
+        Args:
+            length (int): Word length to load.
+        """
+        loaded = self._loaded = queue.Queue(maxsize=1)
+        difficulty = self.difficulty_var.get()
+
+        def worker():
+            try:
+                words = self.shards[length]
+                rated = difficulty in TIERS
+                if rated:
+                    get_difficulty_index(words, length)  # Rate off the Tk thread too
+                loaded.put((words, rated))
+            except Exception as exc:  # Reported on the Tk thread; never leave it polling
+                loaded.put(exc)
+
+        threading.Thread(target=worker, name="word-loader", daemon=True).start()
+        self.root.after(LOAD_POLL_MS, self._check_words_loaded, loaded)
+
+    def _check_words_loaded(self, loaded):
+        """
+        Tk-side half of load_words: start the game once the words arrive.
+        Loads superseded by a later word length choice are dropped.
+        """
+        if loaded is not self._loaded:
+            return
+        try:
+            result = loaded.get_nowait()
+        except queue.Empty:
+            self.root.after(LOAD_POLL_MS, self._check_words_loaded, loaded)
+            return
+        if not isinstance(result, Exception) and not result[0]:
+            result = ValueError(f"no {self.model.cols}-letter words in the word list")
+        if isinstance(result, Exception):
+            self.status_label.config(text="Could not load words")
+            messagebox.showerror("Word List", f"Could not load words: {result}")
+            return
+        self.start_game(*result)
+
+    def start_game(self, word_list, rated=False):
+        """
+        Create the game logic and enable the controls that need it.
+
+        Args:
+            word_list (Sequence[str]): Words to play with.
+            rated (bool): The difficulty index for word_list is already built.
+        """
+        self._loaded = None
+        self.game = Wordle(word_list, hard_mode=self.hard_mode_var.get(),
+                           length=self.model.cols, max_attempts=self.model.rows)
+        if rated and self.difficulty_var.get() in TIERS:
+            self.game.reset_game(difficulty=self.difficulty_var.get())
+        self.status_label.config(text="")
+        for button in (self.submit_button, self.hint_button, self.reset_button):
+            button.config(state="normal")
+        if not rated:
+            self.rate_words()  # A tier picked while loading applies from the next game
+
+    def rate_words(self, difficulty=None):
+        """
+        Build the game's difficulty index on a background thread when a tier
+        is chosen, keeping New Game disabled until it is ready.
+
+        Args:
+            difficulty (str, optional): Tier just picked in the menu.
+        """
+        if difficulty is None:
+            difficulty = self.difficulty_var.get()
+        if self.game is None or difficulty not in TIERS or self._rated is not None:
+            return  # A load or rating in progress covers it
+        game = self.game
+        rated = self._rated = queue.Queue(maxsize=1)
+        self.reset_button.config(state="disabled")
+        self.status_label.config(text="Rating words...")
+
+        def worker():
+            try:
+                rated.put(game.difficulty_index())
+            except Exception as exc:
+                rated.put(exc)
+
+        threading.Thread(target=worker, name="difficulty-rater", daemon=True).start()
+        self.root.after(LOAD_POLL_MS, self._check_words_rated, rated)
+
+    def _check_words_rated(self, rated):
+        """
+        Tk-side half of rate_words: re-enable New Game once the index is built.
+        """
+        if rated is not self._rated:
+            return
+        try:
+            result = rated.get_nowait()
+        except queue.Empty:
+            self.root.after(LOAD_POLL_MS, self._check_words_rated, rated)
+            return
+        self._rated = None
+        self.status_label.config(text="")
+        if isinstance(result, Exception):
+            self.difficulty_var.set("any")
+            messagebox.showerror("Difficulty", f"Could not rate words: {result}")
+        self.reset_button.config(state="normal")
+
+    def set_length(self, length):
+        """
+        Switch to a different word length: rebuild the grid and start a new
+        game once that length's dictionary has loaded.
+
+        Args:
+            length (int): Letters per word.
+        """
+        length = int(length)
+        if length == self.model.cols:
+            return
+        self.game = None
+        self._rated = None  # Drop any rating of the previous length's words
+        for button in (self.submit_button, self.hint_button, self.reset_button):
+            button.config(state="disabled")
+        self.status_label.config(text="Loading words...")
+
+        self.apply_diff(self.model.reset())  # Keyboard colors back to default
+        for row_labels in self.grid_labels:
+            for lbl in row_labels:
+                lbl.destroy()
+        self.model = BoardModel(rows=self.model.rows, cols=length)
+        self.build_grid()
+        self.current_row = 0
+        self.current_col = 0
+        self.load_words(length)
+
     def create_widgets(self):
         """
         Create all GUI components:
         - Grid for guesses
         - On-screen keyboard
-        - Backspace, Submit, Reset, Quit buttons
+        - Backspace, Submit, Hard mode, Hint, Reset, Quit controls
         """
+        # --- Status line (shown while the dictionary loads) ---
+        self.status_label = tk.Label(self.root, text="Loading words...")
+        self.status_label.pack()
+
         # --- Word grid ---
         self.grid_frame = tk.Frame(self.root)
         self.grid_frame.pack(pady=10)
 
-        # Create 6x5 label grid
-        for r in range(6):
-            row_labels = []
-            for c in range(5):
-                lbl = tk.Label(
-                    self.grid_frame,
-                    text="",
-                    width=4,
-                    height=2,
-                    bg=self.COLORS["default"],
-                    relief="solid",
-                    font=("Consolas", 24),
-                    borderwidth=2,
-                    fg="black"
-                )
-                lbl.grid(row=r, column=c, padx=5, pady=5)
-                row_labels.append(lbl)
-            self.grid_labels.append(row_labels)
+        self.build_grid()
 
         # --- On-screen keyboard ---
         keyboard_frame = tk.Frame(self.root)
@@ -191,26 +571,101 @@ class WordleApp:
         self.letter_labels["BACKSPACE"] = backspace
 
         # --- Submit button ---
-        self.submit_button = tk.Button(self.root, text="Submit", command=self.make_guess)
+        self.submit_button = tk.Button(self.root, text="Submit", command=self.make_guess,
+                                       state="disabled")
         self.submit_button.pack(pady=5)
 
+        # --- Hard mode toggle ---
+        self.hard_mode_var = tk.BooleanVar(value=False)
+        self.hard_mode_check = tk.Checkbutton(self.root, text="Hard mode",
+                                              variable=self.hard_mode_var,
+                                              command=self.toggle_hard_mode)
+        self.hard_mode_check.pack(pady=5)
+
+        # --- Word length choice (only lengths with a dictionary) ---
+        self.length_var = tk.IntVar(value=self.model.cols)
+        length_frame = tk.Frame(self.root)
+        length_frame.pack(pady=5)
+        tk.Label(length_frame, text="Letters:").pack(side="left")
+        lengths = sorted(set(self.shards.available()) | {self.model.cols})
+        self.length_menu = tk.OptionMenu(length_frame, self.length_var, *lengths,
+                                         command=self.set_length)
+        self.length_menu.pack(side="left")
+
+        # --- Difficulty choice, next to it (applies from the next game) ---
+        self.difficulty_var = tk.StringVar(value="any")
+        tk.Label(length_frame, text="Difficulty:").pack(side="left")
+        self.difficulty_menu = tk.OptionMenu(length_frame, self.difficulty_var, "any", *TIERS,
+                                             command=self.rate_words)
+        self.difficulty_menu.pack(side="left")
+
+        # --- Hint button ---
+        self.hint_button = tk.Button(self.root, text="Hint", command=self.show_hint,
+                                     state="disabled")
+        self.hint_button.pack(pady=5)
+
         # --- Reset / Quit buttons ---
-        self.reset_button = tk.Button(self.root, text="New Game", command=self.reset_game)
+        self.reset_button = tk.Button(self.root, text="New Game", command=self.reset_game,
+                                      state="disabled")
         self.reset_button.pack(pady=5)
         self.quit_button = tk.Button(self.root, text="Quit", command=self.root.destroy)
         self.quit_button.pack(pady=5)
 
+    def build_grid(self):
+        """
+        Create one label per cell of the board model in the grid frame.
+        """
+        self.grid_labels = []
+        for r in range(self.model.rows):
+            row_labels = []
+            for c in range(self.model.cols):
+                lbl = tk.Label(
+                    self.grid_frame,
+                    text="",
+                    width=4,
+                    height=2,
+                    bg=self.COLORS["default"],
+                    relief="solid",
+                    font=("Consolas", 24),
+                    borderwidth=2,
+                    fg="black"
+                )
+                lbl.grid(row=r, column=c, padx=5, pady=5)
+                row_labels.append(lbl)
+            self.grid_labels.append(row_labels)
+
+    def apply_diff(self, diff):
+        """
+        Push a BoardModel diff to the widgets in one pass, one configure()
+        call per changed widget with only its changed properties.
+
+        Args:
+            diff (list): (widget key, {property: value}) pairs.
+        """
+        for key, changes in diff:
+            if key[0] == "cell":
+                widget = self.grid_labels[key[1]][key[2]]
+                colors = self.CELL_COLORS
+            else:
+                widget = self.letter_labels[key[1]]
+                colors = self.COLORS
+            options = {}
+            if "text" in changes:
+                options["text"] = changes["text"]
+            if "state" in changes:
+                options["bg"] = colors[changes["state"]]
+            widget.configure(**options)
+
     def add_letter(self, letter: str):
         """
         Add a letter from the on-screen keyboard to the current row.
-        Only adds if there are less than 5 letters in the row.
+        Only adds if the row is not full yet.
 
         Args:
             letter (str): Letter to add.
         """
-        if self.current_col < 5 and self.current_row < 6:
-            lbl = self.grid_labels[self.current_row][self.current_col]
-            lbl.config(text=letter)
+        if self.current_col < self.model.cols and self.current_row < self.model.rows:
+            self.apply_diff(self.model.set_letter(self.current_row, self.current_col, letter))
             self.current_col += 1
 
     def backspace_letter(self):
@@ -219,97 +674,94 @@ class WordleApp:
         """
         if self.current_col > 0:
             self.current_col -= 1
-            lbl = self.grid_labels[self.current_row][self.current_col]
-            lbl.config(text="")
+            self.apply_diff(self.model.set_letter(self.current_row, self.current_col, ""))
 
     def make_guess(self):
         """
         Submit the current row as a guess:
-        - Validate the guess length
+        - Validate the guess length and that it is a real word
         - Update the grid colors and keyboard colors
         - Check for win/loss after updating the GUI
         """
-        if self.current_col != 5:
-            messagebox.showinfo("Invalid Guess", "Please enter 5 letters!")
+        if self.game is None:
+            return  # Still loading words
+        if self.current_col != self.model.cols:
+            messagebox.showinfo("Invalid Guess", f"Please enter {self.model.cols} letters!")
             return
 
         # Build the word from the current row
-        word = "".join(lbl.cget("text") for lbl in self.grid_labels[self.current_row]).upper()
+        word = self.model.row_word(self.current_row).upper()
+        if not self.game.is_valid_word(word):
+            messagebox.showinfo("Invalid Guess", "Not in word list!")
+            return
+        error = self.game.hard_mode_error(word)
+        if error:
+            messagebox.showinfo("Hard Mode", f"{error}!")
+            return
         feedback = self.game.guess(word.lower())
 
-        # --- Update the grid for this row ---
-        for i in range(5):
-            lbl = self.grid_labels[self.current_row][i]
-            if feedback[i] == "🟩":
-                lbl.config(bg=self.COLORS["correct"])
-            elif feedback[i] == "🟨":
-                lbl.config(bg=self.COLORS["present"])
-            else:
-                lbl.config(bg=self.COLORS["default"])
-
-        # --- Update keyboard colors ---
+        # --- Update the grid row and keyboard in one batched pass ---
         self.update_keyboard(word, feedback)
 
-        # Force GUI to redraw before showing popup
-        self.root.update_idletasks()
-
         # Move to next row
         self.current_row += 1
         self.current_col = 0
 
-        # --- Check if game over after updating GUI ---
+        # --- Check if game over; the popup waits until the new colors are drawn ---
         over, msg = self.game.is_game_over()
         if over:
-            messagebox.showinfo("Game Over", msg)
+            self.root.after_idle(messagebox.showinfo, "Game Over", msg)
+
+    def toggle_hard_mode(self):
+        """
+        Turn hard mode on or off; it applies from the next guess.
+        """
+        if self.game is not None:
+            self.game.hard_mode = self.hard_mode_var.get()
+
+    def show_hint(self):
+        """
+        Show the solver's suggested next guess in a popup.
+        """
+        messagebox.showinfo("Hint", f"Try: {self.game.hint().upper()}")
 
     def update_keyboard(self, word: str, feedback: str):
         """
-        Update the colors of the on-screen keyboard based on feedback.
+        Color the current grid row and the on-screen keyboard from feedback.
+        Only cells and keys whose state changes are reconfigured.
 
         Args:
             word (str): The guessed word.
             feedback (str): Feedback string (🟩, 🟨, ⬜).
         """
-        for i, letter in enumerate(word):
-            lbl = self.letter_labels.get(letter.upper())
-            if not lbl:
-                continue
-            if feedback[i] == "🟩":
-                lbl.config(bg=self.COLORS["correct"])
-            elif feedback[i] == "🟨":
-                if lbl.cget("bg") != self.COLORS["correct"]:
-                    lbl.config(bg=self.COLORS["present"])
-            else:
-                if lbl.cget("bg") not in [self.COLORS["correct"], self.COLORS["present"]]:
-                    lbl.config(bg=self.COLORS["absent"])
+        states = [self.FEEDBACK_STATES[mark] for mark in feedback]
+        self.apply_diff(self.model.apply_guess(self.current_row, word.upper(), states))
 
     def reset_game(self):
         """
         Reset the game to initial state:
         - Clear the grid
         - Reset keyboard colors
-        - Reset game logic
+        - Reset game logic, drawing from the chosen difficulty tier
         """
-        self.game.reset_game()
+        difficulty = self.difficulty_var.get()
+        self.game.reset_game(difficulty=difficulty if difficulty in TIERS else None)
         self.current_row = 0
         self.current_col = 0
 
-        # Reset grid
-        for r in range(6):
-            for c in range(5):
-                lbl = self.grid_labels[r][c]
-                lbl.config(text="", bg=self.COLORS["default"], fg="black")
-
-        # Reset keyboard
-        for lbl in self.letter_labels.values():
-            if lbl.cget("text") == "⌫":
-                lbl.config(bg="#bbbbbb")
-            else:
-                lbl.config(bg=self.COLORS["default"])
+        # Reset only the grid cells and keys that changed during the game
+        self.apply_diff(self.model.reset())
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play Wordle in a window.")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH, help="letters per word (4-8)")
+    parser.add_argument("--attempts", type=int, default=6, help="guesses per game")
+    args = parser.parse_args()
+
     # Launch the Wordle GUI
     root = tk.Tk()
-    app = WordleApp(root)
+    app = WordleApp(root, length=args.length, max_attempts=args.attempts)
     root.mainloop()
@@ -0,0 +1,169 @@
+"""
+Wordle GUI Startup Benchmark
+Author: Jace
+
+Description:
+Times GUI startup in fresh interpreters so every sample pays a cold import:
+    import   - importing main.py (tkinter plus wordle_core)
+    words    - load_word_list, cold (no binary sidecar yet) and warm
+    frame    - import to the first drawn frame of WordleApp (needs a display)
+    ready    - import to the game being playable (needs a display)
+
+Each scenario copies the word file to a fresh temporary path, so the first
+run has no sidecar (cold) and the following runs reuse the one it wrote
+(warm). A synthetic list of --synthetic words checks that startup stays
+flat as dictionaries grow; first frame should not depend on its size.
+
+Usage:
+    python startup_benchmark.py
+    python startup_benchmark.py --runs 10 --synthetic 200000 --budget-ms 250
+"""
+
+import argparse
+import itertools
+import json
+import os
+import shutil
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+GUI_DIR = os.path.dirname(os.path.abspath(__file__))
+WORDS_FILE = os.path.join(GUI_DIR, "words.txt")
+
+
+# ----------------------------
+# Child process (one sample)
+# ----------------------------
+def sample(words_file, gui):
+    """
+    Take one startup sample in this (fresh) interpreter.
+
+    Returns:
+        dict: Milliseconds for each measured step.
+    """
+    start = time.perf_counter()
+    sys.path.insert(0, GUI_DIR)
+    import main
+    from wordle_core.words import load_word_list
+    result = {"import": (time.perf_counter() - start) * 1000}
+
+    if not gui:
+        begin = time.perf_counter()
+        load_word_list(words_file)
+        result["words"] = (time.perf_counter() - begin) * 1000
+        return result
+
+    root = main.tk.Tk()
+    app = main.WordleApp(root, words_file=words_file)
+    root.after_idle(lambda: result.setdefault("frame", (time.perf_counter() - start) * 1000))
+    while app.game is None:
+        root.update()
+    result["ready"] = (time.perf_counter() - start) * 1000
+    root.destroy()
+    return result
+
+
+# ----------------------------
+# Parent process
+# ----------------------------
+def has_display():
+    """Return True if Tk can open a window here."""
+    probe = "import tkinter; tkinter.Tk().destroy()"
+    return subprocess.run([sys.executable, "-c", probe], capture_output=True).returncode == 0
+
+
+def write_synthetic(path, count):
+    """Write count distinct five-letter words."""
+    words = itertools.islice(itertools.product(string.ascii_lowercase, repeat=5), count)
+    with open(path, "w") as f:
+        f.write("\n".join("".join(word) for word in words))
+
+
+def run_scenario(source, runs, gui):
+    """
+    Sample startup runs times against a fresh copy of source.
+
+    Returns:
+        tuple: (cold sample, list of warm samples)
+    """
+    from wordle_core.words import DEFAULT_CACHE_DIR, WORD_LENGTH, _sidecar_path
+
+    tmp_dir = tempfile.mkdtemp(prefix="wordle-startup-")
+    words_file = os.path.join(tmp_dir, "words.txt")
+    shutil.copyfile(source, words_file)
+    command = [sys.executable, os.path.abspath(__file__), "--child", words_file]
+    if gui:
+        command.append("--gui")
+    try:
+        samples = []
+        for _ in range(runs + 1):
+            output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+            samples.append(json.loads(output.splitlines()[-1]))
+        return samples[0], samples[1:]
+    finally:
+        # Drop the sidecar written for the temporary copy along with it
+        try:
+            os.remove(_sidecar_path(words_file, WORD_LENGTH, DEFAULT_CACHE_DIR))
+        except OSError:
+            pass
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def report(name, cold, warm):
+    """Print cold and median warm milliseconds per step."""
+    print(f"\n{name}")
+    for step in cold:
+        warm_ms = statistics.median(s[step] for s in warm)
+        print(f"  {step:<8} cold {cold[step]:8.1f} ms   warm {warm_ms:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Wordle GUI startup.")
+    parser.add_argument("--runs", type=int, default=5, help="warm samples per scenario")
+    parser.add_argument("--synthetic", type=int, default=100_000,
+                        help="size of the large synthetic word list (0 to skip)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if warm first frame (or import + words headless) exceeds this")
+    parser.add_argument("--child", metavar="WORDS_FILE", help=argparse.SUPPRESS)
+    parser.add_argument("--gui", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(sample(args.child, args.gui)))
+        return
+
+    sys.path.insert(0, os.path.dirname(GUI_DIR))
+    gui = has_display()
+    if not gui:
+        print("Display unavailable: timing import and word loading only")
+
+    scenarios = [("bundled words.txt", WORDS_FILE)]
+    tmp_dir = tempfile.mkdtemp(prefix="wordle-synthetic-")
+    if args.synthetic:
+        synthetic = os.path.join(tmp_dir, "words.txt")
+        write_synthetic(synthetic, args.synthetic)
+        scenarios.append((f"synthetic {args.synthetic:,} words", synthetic))
+
+    over_budget = False
+    try:
+        for name, source in scenarios:
+            cold, warm = run_scenario(source, args.runs, gui)
+            report(name, cold, warm)
+            if gui:
+                startup = statistics.median(s["frame"] for s in warm)
+            else:
+                startup = statistics.median(s["import"] + s["words"] for s in warm)
+            if args.budget_ms is not None and startup > args.budget_ms:
+                print(f"  OVER BUDGET: {startup:.1f} ms > {args.budget_ms:.1f} ms")
+                over_budget = True
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
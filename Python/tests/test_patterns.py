@@ -0,0 +1,71 @@
+"""
+Pattern Matrix Parity Tests
+Author: Jace
+
+Description:
+Checks that the vectorised pattern matrix (wordle_core.patterns) agrees
+with the reference scorer (wordle_core.scoring.score) at every supported
+word length, including words with repeated letters, where the two
+implementations are most likely to drift apart.
+
+Usage:
+    python -m pytest tests
+"""
+
+import itertools
+import os
+import random
+import sys
+
+import pytest
+
+# Make the shared Python/wordle_core package importable from this folder
+_PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PYTHON_DIR not in sys.path:
+    sys.path.insert(0, _PYTHON_DIR)
+
+pytest.importorskip("numpy")
+
+from wordle_core.patterns import build_pattern_matrix, pattern_dtype
+from wordle_core.scoring import MAX_WORD_LENGTH, MIN_WORD_LENGTH, score
+
+LENGTHS = range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1)
+
+
+def random_words(count, length, seed):
+    """Return count random words drawn from a small alphabet, so letters repeat often."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices("abcdefghij", k=length)) for _ in range(count)]
+
+
+def repeated_letter_words(length):
+    """Every word of a and b, plus a few with a third letter, so letters repeat in guesses and answers."""
+    words = ["".join(letters) for letters in itertools.product("ab", repeat=length)]
+    return words + ["c" * (length - 1) + "a", "a" + "c" * (length - 1), "abc".ljust(length, "c")]
+
+
+def assert_matches_score(guesses, answers):
+    matrix = build_pattern_matrix(guesses, answers, chunk_size=7)  # Several partial chunks
+    assert matrix.shape == (len(guesses), len(answers))
+    assert matrix.dtype == pattern_dtype(len(guesses[0]))
+    for i, guess in enumerate(guesses):
+        for j, answer in enumerate(answers):
+            assert matrix[i, j] == score(guess, answer), (guess, answer)
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_random_words_match_score(length):
+    guesses = random_words(60, length, seed=length)
+    answers = random_words(80, length, seed=100 + length)
+    assert_matches_score(guesses, answers)
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_repeated_letters_match_score(length):
+    words = repeated_letter_words(length)
+    assert_matches_score(words, words)
+
+
+def test_answers_default_to_guesses():
+    words = random_words(20, 5, seed=0)
+    assert (build_pattern_matrix(words) == build_pattern_matrix(words, words)).all()
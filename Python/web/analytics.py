@@ -0,0 +1,377 @@
+"""
+Score History Analytics
+Author: Jace Claassen
+Description:
+    Streams the full game_data history once and reports, per chosen_time
+    and per username: games played, mean distance and p50/p90/p99
+    distance. Percentiles come from mergeable KLL sketches (sketch.py), so
+    memory stays bounded per group no matter how long the history is.
+
+    The history is split into tasks: one per compacted segment and one per
+    byte range of each CSV (rotated logs and the live log). A process pool
+    runs the tasks; each worker streams its rows through a generator
+    pipeline (lines -> rows -> aggregates) and returns small partial
+    aggregates that the parent merges.
+
+    With --state, the aggregates for sealed history (segments and rotated
+    logs, which never change) are saved along with the live log's inode
+    and byte offset. The next run only reads new segments and the live
+    log past that offset, so refreshes cost time proportional to the new
+    rows rather than the whole history.
+
+    How to Run:
+    Terminal: python3 analytics.py
+    Terminal: python3 analytics.py --workers 4 --state analytics.json --users 50
+"""
+
+import argparse
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from compaction import (
+    CSV_HEADER, _stamp, read_segment, rotated_files, segment_dir_for, segment_files
+)
+from score_writer import csv_lock
+from sketch import KLLSketch
+
+STATE_VERSION = 1
+PERCENTILES = (0.5, 0.9, 0.99)
+MIN_RANGE_BYTES = 1024 * 1024  # Smaller CSV ranges cost more in task overhead than they save
+
+
+# ---------------------------
+# Aggregates
+# ---------------------------
+class GroupStats:
+    """
+    Count, sum and distance sketch for one chosen_time or username.
+    """
+
+    __slots__ = ('count', 'total', 'sketch')
+
+    def __init__(self, k=200):
+        self.count = 0
+        self.total = 0.0
+        self.sketch = KLLSketch(k)
+
+    def add(self, distance):
+        self.count += 1
+        self.total += distance
+        self.sketch.add(distance)
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.sketch.merge(other.sketch)
+
+    def summary(self):
+        """Games, mean and percentile distances."""
+        return {'games': self.count,
+                'mean': self.total / self.count if self.count else None,
+                **dict(zip(('p50', 'p90', 'p99'), self.sketch.quantiles(PERCENTILES)))}
+
+    def to_dict(self):
+        return {'count': self.count, 'total': self.total, 'sketch': self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls.__new__(cls)
+        stats.count = data['count']
+        stats.total = data['total']
+        stats.sketch = KLLSketch.from_dict(data['sketch'])
+        return stats
+
+
+class HistoryStats:
+    """
+    Per-chosen_time and per-username GroupStats, mergeable across workers.
+    """
+
+    def __init__(self, k=200):
+        self.k = k
+        self.by_time = {}
+        self.by_user = {}
+
+    def add(self, username, chosen_time, distance):
+        """Fold in one score."""
+        group = self.by_time.get(chosen_time)
+        if group is None:
+            group = self.by_time[chosen_time] = GroupStats(self.k)
+        group.add(distance)
+        group = self.by_user.get(username)
+        if group is None:
+            group = self.by_user[username] = GroupStats(self.k)
+        group.add(distance)
+
+    def consume(self, rows):
+        """Fold in every (username, chosen_time, distance) from an iterable."""
+        for username, chosen_time, distance in rows:
+            self.add(username, chosen_time, distance)
+        return self
+
+    def merge(self, other):
+        """Fold another HistoryStats into this one."""
+        for mine, theirs in ((self.by_time, other.by_time), (self.by_user, other.by_user)):
+            for key, group in theirs.items():
+                if key in mine:
+                    mine[key].merge(group)
+                else:
+                    mine[key] = group
+        return self
+
+    @property
+    def rows(self):
+        return sum(group.count for group in self.by_time.values())
+
+    def to_dict(self):
+        return {'k': self.k,
+                'by_time': [[key, group.to_dict()] for key, group in self.by_time.items()],
+                'by_user': [[key, group.to_dict()] for key, group in self.by_user.items()]}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(data['k'])
+        stats.by_time = {key: GroupStats.from_dict(group) for key, group in data['by_time']}
+        stats.by_user = {key: GroupStats.from_dict(group) for key, group in data['by_user']}
+        return stats
+
+
+# ---------------------------
+# Streaming readers
+# ---------------------------
+def iter_lines(path, start, end):
+    """
+    Yield the lines of a file that start in the byte range [start, end).
+    A range starting mid-line skips ahead to the next line; that line
+    belongs to the range before, which reads past its end to finish it.
+    """
+    with open(path, 'rb') as file:
+        if start:
+            file.seek(start - 1)
+            file.readline()  # Only consumes the byte before start if a line begins at start
+        position = file.tell()
+        while position < end:
+            line = file.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode('utf-8', 'replace')
+
+
+def parse_rows(lines):
+    """
+    Turn CSV lines into (username, chosen_time, distance), skipping the
+    header and malformed rows.
+    """
+    for row in csv.reader(lines):
+        if len(row) != 3 or row == CSV_HEADER:
+            continue
+        try:
+            yield row[0], float(row[1]), float(row[2])
+        except ValueError:
+            continue  # Skip malformed rows
+
+
+def run_task(task):
+    """
+    Aggregate one unit of work in a worker process.
+
+    Args:
+        task (tuple): ('segment', path, k) or ('csv', path, start, end, k).
+
+    Returns:
+        HistoryStats: Partial aggregates for the task.
+    """
+    if task[0] == 'segment':
+        _, path, k = task
+        return HistoryStats(k).consume(read_segment(path))
+    _, path, start, end, k = task
+    return HistoryStats(k).consume(parse_rows(iter_lines(path, start, end)))
+
+
+def csv_tasks(path, start, end, range_bytes, k):
+    """Split [start, end) of a CSV into byte-range tasks."""
+    tasks = []
+    while start < end:
+        stop = min(end, start + range_bytes)
+        tasks.append(('csv', path, start, stop, k))
+        start = stop
+    return tasks
+
+
+# ---------------------------
+# Incremental state
+# ---------------------------
+def load_state(path, k):
+    """
+    Load saved aggregates, or start empty if there are none (or k changed).
+
+    Returns:
+        dict: sealed (HistoryStats), done (set of stamps), and live
+              (dict with inode, offset and its HistoryStats, or None).
+    """
+    empty = {'sealed': HistoryStats(k), 'done': set(), 'live': None}
+    if not path or not os.path.exists(path):
+        return empty
+    with open(path, 'r') as file:
+        data = json.load(file)
+    if data.get('version') != STATE_VERSION or data['sealed']['k'] != k:
+        return empty
+    live = data['live']
+    if live:
+        live = dict(live, stats=HistoryStats.from_dict(live['stats']))
+    return {'sealed': HistoryStats.from_dict(data['sealed']),
+            'done': set(data['done']), 'live': live}
+
+
+def save_state(path, sealed, done, live):
+    """Write the aggregates atomically."""
+    data = {'version': STATE_VERSION, 'sealed': sealed.to_dict(), 'done': sorted(done),
+            'live': dict(live, stats=live['stats'].to_dict()) if live else None}
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as file:
+        json.dump(data, file, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+# ---------------------------
+# Analysis
+# ---------------------------
+def analyse(csv_file, segment_dir=None, workers=None, state_file=None, k=200,
+            range_bytes=None):
+    """
+    Aggregate the whole score history in one parallel pass.
+
+    Sealed sources (segments and rotated logs) are identified by their
+    rotation stamp, which a rotated log and the segment it becomes share.
+    The live log is identified by inode: if it has been rotated since the
+    last run, its counted prefix is found again under the rotated name.
+
+    Args:
+        csv_file (str): Live history log.
+        segment_dir (str, optional): Defaults to <csv_file>.segments.
+        workers (int, optional): Worker processes (default: CPU count).
+        state_file (str, optional): Saved aggregates to refresh and update.
+        k (int): Sketch accuracy parameter.
+        range_bytes (int, optional): CSV bytes per task.
+
+    Returns:
+        HistoryStats: Aggregates for every row in the history.
+    """
+    segment_dir = segment_dir or segment_dir_for(csv_file)
+    workers = workers or os.cpu_count() or 1
+    state = load_state(state_file, k)
+    sealed, done, live = state['sealed'], state['done'], state['live']
+
+    # Same listing order as iter_history(): rotated logs before segments
+    rotated = rotated_files(csv_file)
+    segments = {_stamp(path): path for path in segment_files(segment_dir)}
+    for path in rotated:
+        segments.pop(_stamp(path), None)  # Read the log while it is still there
+    # Snapshot the live log's size between ScoreWriter batches, so the
+    # saved offset always falls on a row boundary
+    with csv_lock(csv_file + '.lock'):
+        live_stat = os.stat(csv_file) if os.path.exists(csv_file) else None
+
+    # (path, start, end, stamp or None for the live log) per CSV to read
+    csv_sources = []
+    resumed = None  # Partial aggregates for the file holding the old live prefix
+    for path in rotated:
+        stamp = _stamp(path)
+        if stamp in done:
+            continue
+        start = 0
+        if live and os.stat(path).st_ino == live['inode']:
+            start, resumed = live['offset'], live['stats']
+        csv_sources.append((path, start, os.path.getsize(path), stamp))
+    if live_stat is not None:
+        start, live_stats = 0, HistoryStats(k)
+        if live and live_stat.st_ino == live['inode'] and live_stat.st_size >= live['offset']:
+            start, live_stats = live['offset'], live['stats']
+        csv_sources.append((csv_file, start, live_stat.st_size, None))
+
+    tasks, owners = [], []  # owners: the source each task's rows belong to
+    for stamp, path in segments.items():
+        if stamp not in done:
+            tasks.append(('segment', path, k))
+            owners.append(stamp)
+    total_bytes = sum(end - start for _, start, end, _ in csv_sources)
+    range_bytes = range_bytes or max(MIN_RANGE_BYTES, total_bytes // (workers * 4) + 1)
+    for path, start, end, stamp in csv_sources:
+        ranges = csv_tasks(path, start, end, range_bytes, k)
+        tasks.extend(ranges)
+        owners.extend([stamp] * len(ranges))
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_task, tasks))
+    else:
+        results = [run_task(task) for task in tasks]
+
+    if resumed is not None:
+        sealed.merge(resumed)
+    live_new = HistoryStats(k)
+    for owner, result in zip(owners, results):
+        if owner is None:
+            live_new.merge(result)
+        else:
+            sealed.merge(result)
+    # Also covers a rotated log whose rows were all counted while it was live
+    done.update(owner for owner in owners if owner is not None)
+    done.update(stamp for _, _, _, stamp in csv_sources if stamp is not None)
+
+    live = None
+    if live_stat is not None:
+        live = {'inode': live_stat.st_ino, 'offset': live_stat.st_size,
+                'stats': live_stats.merge(live_new)}
+    if state_file:
+        save_state(state_file, sealed, done, live)
+    return sealed.merge(live['stats']) if live else sealed
+
+
+# ---------------------------
+# Command Line
+# ---------------------------
+def print_table(title, key_label, groups):
+    """Print one row of summary statistics per group."""
+    print(f"\n{title}")
+    print(f"{key_label:<20} {'games':>8} {'mean':>9} {'p50':>9} {'p90':>9} {'p99':>9}")
+    for key, group in groups:
+        s = group.summary()
+        print(f"{str(key):<20} {s['games']:>8} {s['mean']:>9.3f} {s['p50']:>9.3f} "
+              f"{s['p90']:>9.3f} {s['p99']:>9.3f}")
+
+
+def format_time(chosen_time):
+    """Show whole-second times without a trailing .0."""
+    return f"{chosen_time:g}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarise the score history in one streaming pass.')
+    parser.add_argument('--csv', default='game_data.csv', help='live history log')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--state', metavar='FILE',
+                        help='saved sketches to refresh incrementally (created if missing)')
+    parser.add_argument('--users', type=int, default=20,
+                        help='show the N players with the most games (0 for all)')
+    parser.add_argument('--k', type=int, default=200, help='sketch accuracy parameter')
+    args = parser.parse_args()
+
+    stats = analyse(args.csv, workers=args.workers, state_file=args.state, k=args.k)
+    print(f"Rows: {stats.rows}  Players: {len(stats.by_user)}")
+    if not stats.rows:
+        return
+    print_table("By game length", "chosen_time",
+                ((format_time(t), g) for t, g in sorted(stats.by_time.items())))
+    players = sorted(stats.by_user.items(), key=lambda item: (-item[1].count, item[0]))
+    if args.users:
+        players = players[:args.users]
+    print_table("By player (most games first)", "username", players)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,25 +4,70 @@ Author: Jace Claassen
 Description:
     A simple web game where users try to guess a target time.
     Users log in with a unique username, select a time interval, start/stop
-    the counter, and see how close they were. Scores are saved to CSV and
-    the top scores are displayed on a leaderboard.
+    the counter, and see how close they were. The elapsed time is measured
+    on the server between /start and /stop. Scores are saved to CSV and
+    an indexed SQLite leaderboard store, and the top scores are displayed
+    on a leaderboard.
 
     How to Run:
     Terminal: python3 app.py
+    Periodic: python3 compaction.py   (rotate and compact game_data.csv)
     Browser: http://127.0.0.1:5000
 """
 
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify
+from flask import Flask, Response, render_template, request, redirect, url_for, session, jsonify, make_response, abort
+from datetime import datetime, timezone
 import csv
+import hmac
+import math
 import os
 
+from leaderboard_store import LeaderboardStore
+from metrics import InstrumentedStore, Registry, instrument_app
+from score_writer import ScoreWriter, csv_lock
+from timing import SharedTimerTable, TimerTable
+
 # ---------------------------
 # App Initialization
 # ---------------------------
 app = Flask(__name__)
-app.secret_key = 'supersecretkey'  # Needed for session handling
+# Needed for session handling; production sets SECRET_KEY (see wsgi.py)
+app.secret_key = os.environ.get('SECRET_KEY', 'supersecretkey')
 
 CSV_FILE = 'game_data.csv'
+DB_FILE = 'game_data.db'
+LEADERBOARD_SIZE = 5
+SCORE_BATCH_SIZE = 100       # Max rows per CSV group commit
+SCORE_FLUSH_INTERVAL = 0.5   # Max seconds a score waits before hitting disk
+
+# Valid game lengths in seconds:
+#   - 10s to 1 min in 10s increments
+#   - 1 min to 10 min in 30s increments
+TIME_OPTIONS = list(range(10, 61, 10)) + list(range(90, 601, 30))
+
+MAX_USERNAME_LENGTH = 50
+MAX_BULK_SCORES = 1000  # Largest batch accepted by /submit_scores
+# /submit_score(s) trust the distance they are sent, so they only accept
+# trusted clients (e.g. kiosks) that send "Authorization: Bearer <token>".
+# Without INGEST_TOKEN they are disabled; players are scored via /start and /stop.
+INGEST_TOKEN = os.environ.get('INGEST_TOKEN')
+TIMER_TTL = 3 * max(TIME_OPTIONS)  # Seconds before an unstopped game is dropped
+MAX_TIMERS = 100000                # Most games running at once
+
+# Opt-in profiling: set PROFILE_SLOW_MS to dump cProfile output for
+# sampled requests slower than that many milliseconds
+PROFILE_SLOW_MS = float(os.environ['PROFILE_SLOW_MS']) if os.environ.get('PROFILE_SLOW_MS') else None
+PROFILE_RATE = float(os.environ.get('PROFILE_RATE', 0.1))  # Fraction of requests profiled
+
+# Keep running games in the database instead of process memory, so
+# /start and /stop can be served by different worker processes
+SHARED_TIMERS = os.environ.get('SHARED_TIMERS') == '1'
+
+# ---------------------------
+# Metrics
+# ---------------------------
+metrics = Registry()
+instrument_app(app, metrics, slow_ms=PROFILE_SLOW_MS, profile_rate=PROFILE_RATE)
 
 # ---------------------------
 # CSV Initialization
@@ -47,7 +92,167 @@ def init_csv():
             writer = csv.writer(file)
             writer.writerow(['username', 'chosen_time', 'distance'])
 
-init_csv()
+# ---------------------------
+# Leaderboard Store
+# ---------------------------
+# Every worker process imports this module. The setup below is idempotent
+# and runs under the CSV lock, so the first worker does it and the rest
+# find it already done (and no worker rewrites the CSV under a writer).
+with csv_lock(CSV_FILE + '.lock'):
+    init_csv()
+    store = InstrumentedStore(LeaderboardStore(DB_FILE, top_k=LEADERBOARD_SIZE), metrics)
+    store.migrate_csv(CSV_FILE)  # One-time import of existing CSV history
+
+# Write-behind CSV sink: keeps file I/O off the request thread
+score_writer = ScoreWriter(CSV_FILE, batch_size=SCORE_BATCH_SIZE,
+                           flush_interval=SCORE_FLUSH_INTERVAL)
+
+# Running games: server-side start timestamps keyed by a session token
+if SHARED_TIMERS:
+    timers = SharedTimerTable(DB_FILE, ttl=TIMER_TTL, max_timers=MAX_TIMERS)
+else:
+    timers = TimerTable(ttl=TIMER_TTL, max_timers=MAX_TIMERS)
+
+
+@metrics.collector
+def collect_runtime_metrics():
+    """
+    Values kept by the score writer and timer table, read at scrape time.
+    """
+    return [
+        ('csv_rows_written_total', 'counter', 'Score rows appended to the CSV history.',
+         score_writer.rows_written),
+        ('csv_bytes_written_total', 'counter', 'Bytes appended to the CSV history.',
+         score_writer.bytes_written),
+        ('csv_batches_written_total', 'counter', 'Locked CSV group commits.',
+         score_writer.batches_written),
+        ('running_games', 'gauge', 'Games started and not yet stopped.', len(timers)),
+    ]
+
+# ---------------------------
+# Leaderboard Cache
+# ---------------------------
+# Latest rendered leaderboard per chosen_time (None = all times).
+# Entries are replaced as a whole (never mutated) so concurrent requests
+# always see a consistent entry. Each worker process has its own cache,
+# checked against the version counters in the shared database, so a score
+# saved by any worker refreshes every worker's copy on its next view.
+_leaderboard_cache = {}
+
+
+def cached_leaderboard(chosen_time=None):
+    """
+    Return the cached leaderboard entry, rebuilding it only when the
+    store's version has moved (i.e. a new score entered that top K).
+
+    Args:
+        chosen_time (float, optional): Game length bucket; None for all times.
+
+    Returns:
+        dict: version, modified (datetime), results and rendered html.
+    """
+    version, modified = store.version(chosen_time)
+    entry = _leaderboard_cache.get(chosen_time)
+    if entry is None or entry['version'] != version:
+        results = store.top_scores(chosen_time=chosen_time)
+        entry = {
+            'version': version,
+            'modified': datetime.fromtimestamp(int(modified), tz=timezone.utc),
+            'results': results,
+            'html': render_template('leaderboard.html', results=results,
+                                    times=TIME_OPTIONS, chosen_time=chosen_time),
+        }
+        _leaderboard_cache[chosen_time] = entry
+    return entry
+
+
+def requested_time():
+    """
+    Read the optional ?time= leaderboard filter; 404 if it is not a game length.
+    """
+    chosen_time = request.args.get('time', type=float)
+    if chosen_time is not None and chosen_time not in TIME_OPTIONS:
+        abort(404)
+    return chosen_time
+
+
+def conditional_response(body, entry, kind):
+    """
+    Wrap a leaderboard body with ETag/Last-Modified validators and turn it
+    into a 304 Not Modified when the client's copy is still current.
+    """
+    response = make_response(body)
+    response.set_etag(f"leaderboard-{kind}-{entry['version']}")
+    response.last_modified = entry['modified']
+    response.cache_control.no_cache = True  # Always revalidate, usually with a 304
+    return response.make_conditional(request)
+
+# ---------------------------
+# Score Validation
+# ---------------------------
+def validate_score(data):
+    """
+    Validate a JSON score submission without touching the session.
+
+    Args:
+        data: Decoded JSON object with username, chosen_time and distance.
+
+    Returns:
+        tuple: (row, error) where row is (username, chosen_time, distance)
+        on success and error is a message on failure.
+    """
+    if not isinstance(data, dict):
+        return None, 'score must be an object'
+
+    username = data.get('username')
+    if not isinstance(username, str) or not username.strip():
+        return None, 'username is required'
+    if len(username) > MAX_USERNAME_LENGTH:
+        return None, f'username must be at most {MAX_USERNAME_LENGTH} characters'
+
+    try:
+        chosen_time = float(data.get('chosen_time'))
+        distance = float(data.get('distance'))
+    except (TypeError, ValueError):
+        return None, 'chosen_time and distance must be numbers'
+    if chosen_time not in TIME_OPTIONS:
+        return None, 'chosen_time is not a valid game length'
+    if not math.isfinite(distance) or distance < 0:
+        return None, 'distance must be a non-negative number'
+
+    return (username.strip(), chosen_time, round(distance, 2)), None
+
+
+def parse_time(value):
+    """
+    Return value as a game length, or None if it is not one of TIME_OPTIONS.
+    """
+    try:
+        chosen_time = float(value)
+    except (TypeError, ValueError):
+        return None
+    return chosen_time if chosen_time in TIME_OPTIONS else None
+
+
+def ingest_authorized():
+    """
+    True if the request carries the INGEST_TOKEN bearer token.
+    """
+    if not INGEST_TOKEN:
+        return False
+    supplied = request.headers.get('Authorization', '')
+    return hmac.compare_digest(supplied.encode('utf-8'), f'Bearer {INGEST_TOKEN}'.encode('utf-8'))
+
+
+def save_scores(rows):
+    """
+    Queue rows for the CSV history and insert them into the store
+    in a single transaction.
+    """
+    for row in rows:
+        score_writer.submit(row)
+    store.add_scores(rows)
+
 
 # ---------------------------
 # Routes
@@ -71,67 +276,171 @@ def login():
 @app.route("/select_time", methods=['GET', 'POST'])
 def select_time():
     """
-    Let the user select the game length.
-    Valid time options:
-        - 10s to 1 min in 10s increments
-        - 1 min to 10 min in 30s increments
+    Let the user select the game length from TIME_OPTIONS.
     """
     if 'username' not in session:
         return redirect(url_for('login'))
 
-    times_seconds = list(range(10, 61, 10)) + list(range(90, 601, 30))
-
     if request.method == 'POST':
-        chosen_time = float(request.form.get('time'))
+        chosen_time = parse_time(request.form.get('time'))
+        if chosen_time is None:
+            abort(400)
         session['chosen_time'] = chosen_time
         return redirect(url_for('game'))
 
-    return render_template('select_time.html', times=times_seconds)
+    return render_template('select_time.html', times=TIME_OPTIONS)
 
 
-@app.route("/game", methods=['GET', 'POST'])
+@app.route("/game")
 def game():
     """
     Game page where user starts/stops the timer and guesses the duration.
-    POST: calculate distance from target, save to CSV, redirect to leaderboard.
+    The page's Start and Stop buttons call /start and /stop.
     """
     if 'username' not in session or 'chosen_time' not in session:
         return redirect(url_for('login'))
 
-    if request.method == 'POST':
-        actual_time = float(request.form.get('actual_time'))
-        chosen_time = session['chosen_time']
-        distance = abs(chosen_time - actual_time)
+    return render_template('game.html', chosen_time=session['chosen_time'])
 
-        # Append result to CSV
-        with open(CSV_FILE, 'a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([session['username'], chosen_time, round(distance, 2)])
 
-        return redirect(url_for('leaderboard'))
+@app.route("/start", methods=['POST'])
+def start():
+    """
+    Start the server-side timer for the session's game.
+    """
+    if 'username' not in session or 'chosen_time' not in session:
+        return jsonify({'error': 'log in and choose a time first'}), 401
+    if parse_time(session['chosen_time']) is None:
+        return jsonify({'error': 'chosen_time is not a valid game length'}), 400
+
+    session['timer'] = timers.start(session['username'], session['chosen_time'])
+    return jsonify({'started': True})
 
-    return render_template('game.html', chosen_time=session['chosen_time'])
+
+@app.route("/stop", methods=['POST'])
+def stop():
+    """
+    Stop the session's timer, compute the distance from the target on the
+    server, and save it to CSV and the leaderboard store.
+    """
+    if 'username' not in session:
+        return jsonify({'error': 'log in first'}), 401
+
+    result = timers.stop(session.pop('timer', None), session['username'])
+    if result is None:
+        return jsonify({'error': 'no running game'}), 409
+
+    elapsed, chosen_time = result
+    distance = round(abs(chosen_time - elapsed), 2)
+
+    # Queue result for the CSV history (written in the background)
+    score_writer.submit([session['username'], chosen_time, distance])
+
+    store.add_score(session['username'], chosen_time, distance)
+
+    return jsonify({'elapsed': round(elapsed, 2), 'distance': distance})
+
+
+@app.route("/submit_score", methods=['POST'])
+def submit_score():
+    """
+    JSON API: save one score from a trusted client (see INGEST_TOKEN).
+    Body: {"username": str, "chosen_time": float, "distance": float}
+    """
+    if not ingest_authorized():
+        return jsonify({'error': 'score ingestion requires a valid token'}), 403
+
+    row, error = validate_score(request.get_json(silent=True))
+    if error:
+        return jsonify({'error': error}), 400
+
+    save_scores([row])
+    return jsonify({'accepted': 1}), 201
+
+
+@app.route("/submit_scores", methods=['POST'])
+def submit_scores():
+    """
+    JSON API: save a batch of scores in one request and one transaction.
+    Body: a list of score objects (see /submit_score).
+    Valid scores are saved; invalid ones are reported by index.
+    """
+    if not ingest_authorized():
+        return jsonify({'error': 'score ingestion requires a valid token'}), 403
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return jsonify({'error': 'body must be a list of scores'}), 400
+    if len(data) > MAX_BULK_SCORES:
+        return jsonify({'error': f'at most {MAX_BULK_SCORES} scores per request'}), 413
+
+    rows, rejected = [], []
+    for index, item in enumerate(data):
+        row, error = validate_score(item)
+        if error:
+            rejected.append({'index': index, 'error': error})
+        else:
+            rows.append(row)
+
+    if rows:
+        save_scores(rows)
+    status = 400 if rejected and not rows else 200
+    return jsonify({'accepted': len(rows), 'rejected': rejected}), status
 
 
 @app.route("/leaderboard")
 def leaderboard():
     """
-    Display the top 5 scores from the CSV file sorted by distance (closest guesses first).
-    """
-    results = []
-    if os.path.exists(CSV_FILE):
-        with open(CSV_FILE, 'r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                try:
-                    row['distance'] = float(row['distance'])
-                    row['chosen_time'] = float(row['chosen_time'])
-                    results.append(row)
-                except (KeyError, ValueError):
-                    continue  # Skip malformed rows
-
-    results = sorted(results, key=lambda x: x['distance'])[:5]
-    return render_template('leaderboard.html', results=results)
+    Display the top 5 scores sorted by distance (closest guesses first),
+    overall or for one game length with ?time=<seconds>.
+    The rendered page is cached until that top 5 changes, and repeat views
+    with a matching ETag or Last-Modified get 304 Not Modified.
+    """
+    chosen_time = requested_time()
+    entry = cached_leaderboard(chosen_time)
+    return conditional_response(entry['html'], entry, f'html-{chosen_time}')
+
+
+@app.route("/api/leaderboard")
+def leaderboard_json():
+    """
+    Top 5 scores as JSON for clients that poll the leaderboard.
+    Accepts the same ?time= filter, cache and validators as the HTML page.
+    """
+    chosen_time = requested_time()
+    entry = cached_leaderboard(chosen_time)
+    return conditional_response(jsonify(entry['results']), entry, f'json-{chosen_time}')
+
+
+@app.route("/stats/<username>")
+def user_stats(username):
+    """
+    A player's games played, mean and best distance, and personal best
+    per game length, read from the store's running aggregates.
+    """
+    stats = store.user_stats(username)
+    if stats is None:
+        abort(404)
+    return render_template('user_stats.html', stats=stats)
+
+
+@app.route("/api/stats/<username>")
+def user_stats_json(username):
+    """
+    JSON version of /stats/<username>.
+    """
+    stats = store.user_stats(username)
+    if stats is None:
+        return jsonify({'error': 'unknown user'}), 404
+    return jsonify(stats)
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """
+    Request, storage and render metrics in the Prometheus text format.
+    """
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 
 # ---------------------------
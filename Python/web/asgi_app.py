@@ -0,0 +1,337 @@
+"""
+Time Guess Game ASGI App
+Author: Jace Claassen
+Description:
+    Async entry point for the Time Guess Game with the same routes and
+    templates as app.py (/, /select_time, /game, /start, /stop,
+    /leaderboard, /stats/<username>).
+    Requests are handled on a single event loop, so one process can hold
+    thousands of concurrent players. Leaderboard reads and writes go
+    through the pooled AsyncLeaderboardStore, and the CSV history is
+    appended by the same background ScoreWriter as the Flask app.
+
+    Sessions are kept in a signed cookie (itsdangerous, which ships with
+    Flask), like Flask's own session.
+
+    How to Run:
+    Terminal: uvicorn asgi_app:app --port 8000
+    Browser: http://127.0.0.1:8000
+"""
+
+import asyncio
+import json
+import mimetypes
+import os
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qs, quote
+
+from itsdangerous import BadSignature, URLSafeSerializer
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from app import (
+    app as flask_app, DB_FILE, LEADERBOARD_SIZE, TIME_OPTIONS, parse_time, score_writer, timers
+)
+from async_store import AsyncLeaderboardStore
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+SESSION_COOKIE = 'session'
+
+ROUTES = {
+    'login': '/',
+    'select_time': '/select_time',
+    'game': '/game',
+    'start': '/start',
+    'stop': '/stop',
+    'leaderboard': '/leaderboard',
+    'user_stats': '/stats/{username}',
+}
+STATS_PREFIX = '/stats/'
+
+# ---------------------------
+# App Initialization
+# ---------------------------
+serializer = URLSafeSerializer(flask_app.secret_key, salt='asgi-session')
+store = AsyncLeaderboardStore(DB_FILE, top_k=LEADERBOARD_SIZE)
+
+
+def url_for(endpoint, **values):
+    """
+    Minimal stand-in for flask.url_for so the templates render unchanged.
+    """
+    if endpoint == 'static':
+        return '/static/' + values['filename']
+    return ROUTES[endpoint].format(**{k: quote(str(v), safe='') for k, v in values.items()})
+
+
+templates = Environment(
+    loader=FileSystemLoader(os.path.join(BASE_DIR, 'templates')),
+    autoescape=select_autoescape(['html']),
+    enable_async=True,
+)
+templates.globals['url_for'] = url_for
+
+
+# ---------------------------
+# Request / Response helpers
+# ---------------------------
+class Request:
+    """
+    Parsed view of an ASGI HTTP request.
+    """
+
+    def __init__(self, scope, body):
+        self.method = scope['method']
+        self.path = scope['path']
+        headers = {k.decode('latin-1'): v.decode('latin-1') for k, v in scope['headers']}
+        query = scope.get('query_string', b'').decode('latin-1')
+        self.args = {k: v[0] for k, v in parse_qs(query).items()}
+        self.form = {}
+        if headers.get('content-type', '').startswith('application/x-www-form-urlencoded'):
+            self.form = {k: v[0] for k, v in parse_qs(body.decode('utf-8')).items()}
+        self.session = {}
+        cookie = SimpleCookie(headers.get('cookie', ''))
+        if SESSION_COOKIE in cookie:
+            try:
+                self.session = serializer.loads(cookie[SESSION_COOKIE].value)
+            except BadSignature:
+                self.session = {}
+        self._session_snapshot = dict(self.session)
+
+    def session_changed(self):
+        return self.session != self._session_snapshot
+
+
+class Response:
+    """
+    Body, status and headers for an ASGI HTTP response.
+    """
+
+    def __init__(self, body=b'', status=200, content_type='text/html; charset=utf-8', headers=None):
+        self.body = body.encode('utf-8') if isinstance(body, str) else body
+        self.status = status
+        self.headers = [(b'content-type', content_type.encode('latin-1'))]
+        for name, value in (headers or {}).items():
+            self.headers.append((name.encode('latin-1'), value.encode('latin-1')))
+
+    async def send(self, send, request=None):
+        headers = list(self.headers)
+        headers.append((b'content-length', str(len(self.body)).encode('latin-1')))
+        if request is not None and request.session_changed():
+            value = serializer.dumps(request.session)
+            headers.append((b'set-cookie',
+                            f'{SESSION_COOKIE}={value}; Path=/; HttpOnly; SameSite=Lax'.encode('latin-1')))
+        await send({'type': 'http.response.start', 'status': self.status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': self.body})
+
+
+def json_response(data, status=200):
+    return Response(json.dumps(data), status=status, content_type='application/json')
+
+
+def redirect(endpoint):
+    return Response(status=302, headers={'location': ROUTES[endpoint]})
+
+
+async def render(template_name, **context):
+    template = templates.get_template(template_name)
+    return Response(await template.render_async(**context))
+
+
+# ---------------------------
+# Routes
+# ---------------------------
+async def login(request):
+    """
+    GET: display login page.
+    POST: store username in session and redirect to time selection.
+    """
+    if request.method == 'POST':
+        username = request.form.get('username')
+        if username:
+            request.session['username'] = username
+            return redirect('select_time')
+    return await render('login.html')
+
+
+async def select_time(request):
+    """
+    Let the user select the game length from TIME_OPTIONS.
+    """
+    if 'username' not in request.session:
+        return redirect('login')
+
+    if request.method == 'POST':
+        chosen_time = parse_time(request.form.get('time'))
+        if chosen_time is None:
+            return Response(b'Bad Request', status=400, content_type='text/plain')
+        request.session['chosen_time'] = chosen_time
+        return redirect('game')
+
+    return await render('select_time.html', times=TIME_OPTIONS)
+
+
+async def game(request):
+    """
+    Game page; its Start and Stop buttons call /start and /stop.
+    """
+    if 'username' not in request.session or 'chosen_time' not in request.session:
+        return redirect('login')
+
+    return await render('game.html', chosen_time=request.session['chosen_time'])
+
+
+async def start(request):
+    """
+    POST: start the server-side timer for the session's game.
+    """
+    if request.method != 'POST':
+        return Response(b'Method Not Allowed', status=405, content_type='text/plain')
+    if 'username' not in request.session or 'chosen_time' not in request.session:
+        return json_response({'error': 'log in and choose a time first'}, 401)
+    if parse_time(request.session['chosen_time']) is None:
+        return json_response({'error': 'chosen_time is not a valid game length'}, 400)
+
+    request.session['timer'] = timers.start(request.session['username'],
+                                            request.session['chosen_time'])
+    return json_response({'started': True})
+
+
+async def stop(request):
+    """
+    POST: stop the session's timer, score it on the server and save it.
+    """
+    if request.method != 'POST':
+        return Response(b'Method Not Allowed', status=405, content_type='text/plain')
+    if 'username' not in request.session:
+        return json_response({'error': 'log in first'}, 401)
+
+    result = timers.stop(request.session.pop('timer', None), request.session['username'])
+    if result is None:
+        return json_response({'error': 'no running game'}, 409)
+
+    elapsed, chosen_time = result
+    distance = round(abs(chosen_time - elapsed), 2)
+
+    score_writer.submit([request.session['username'], chosen_time, distance])
+    await store.add_score(request.session['username'], chosen_time, distance)
+    return json_response({'elapsed': round(elapsed, 2), 'distance': distance})
+
+
+def requested_time(request):
+    """
+    Read the optional ?time= leaderboard filter.
+
+    Returns:
+        tuple: (chosen_time, valid); valid is False if it is not a game length.
+    """
+    try:
+        chosen_time = float(request.args['time'])
+    except (KeyError, ValueError):
+        return None, True
+    return chosen_time, chosen_time in TIME_OPTIONS
+
+
+async def leaderboard(request):
+    """
+    Display the top scores, closest guesses first, overall or for one
+    game length with ?time=<seconds>.
+    """
+    chosen_time, valid = requested_time(request)
+    if not valid:
+        return Response(b'Not Found', status=404, content_type='text/plain')
+    results = await store.top_scores(chosen_time=chosen_time)
+    return await render('leaderboard.html', results=results,
+                        times=TIME_OPTIONS, chosen_time=chosen_time)
+
+
+async def user_stats(request, username):
+    """
+    A player's games played, mean and best distance, and personal best
+    per game length.
+    """
+    stats = await store.user_stats(username) if username and '/' not in username else None
+    if stats is None:
+        return Response(b'Not Found', status=404, content_type='text/plain')
+    return await render('user_stats.html', stats=stats)
+
+
+HANDLERS = {
+    ROUTES['login']: login,
+    ROUTES['select_time']: select_time,
+    ROUTES['game']: game,
+    ROUTES['start']: start,
+    ROUTES['stop']: stop,
+    ROUTES['leaderboard']: leaderboard,
+}
+
+_static_cache = {}
+
+
+def _read_file(path):
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+async def static_file(path):
+    """
+    Serve a file from static/, cached in memory after the first read.
+    """
+    name = os.path.normpath(path[len('/static/'):])
+    if name.startswith('..') or os.path.isabs(name):
+        return Response(b'Not Found', status=404, content_type='text/plain')
+    if name not in _static_cache:
+        full_path = os.path.join(STATIC_DIR, name)
+        if not os.path.isfile(full_path):
+            return Response(b'Not Found', status=404, content_type='text/plain')
+        data = await asyncio.to_thread(_read_file, full_path)
+        content_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        _static_cache[name] = (data, content_type)
+    data, content_type = _static_cache[name]
+    return Response(data, content_type=content_type)
+
+
+# ---------------------------
+# ASGI Entry Point
+# ---------------------------
+async def app(scope, receive, send):
+    """
+    ASGI application callable.
+    """
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                store.close()
+                score_writer.close()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    if scope['type'] != 'http':
+        return
+
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body'):
+            break
+
+    request = Request(scope, body)
+    if request.path.startswith('/static/'):
+        response = await static_file(request.path)
+    elif request.path.startswith(STATS_PREFIX):
+        if request.method != 'GET':
+            response = Response(b'Method Not Allowed', status=405, content_type='text/plain')
+        else:
+            response = await user_stats(request, request.path[len(STATS_PREFIX):])
+    elif request.path in HANDLERS:
+        if request.method not in ('GET', 'POST'):
+            response = Response(b'Method Not Allowed', status=405, content_type='text/plain')
+        else:
+            response = await HANDLERS[request.path](request)
+    else:
+        response = Response(b'Not Found', status=404, content_type='text/plain')
+    await response.send(send, request)
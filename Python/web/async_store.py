@@ -0,0 +1,91 @@
+"""
+Async Leaderboard Store
+Author: Jace Claassen
+Description:
+    Connection-pooled async access to the same SQLite leaderboard database
+    used by LeaderboardStore. A fixed pool of connections is checked out
+    through an asyncio.Queue and each query runs on a worker thread, so
+    the event loop never blocks on disk I/O. The database runs in WAL
+    mode, which lets readers proceed while a write is in progress.
+"""
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+from leaderboard_store import (
+    LeaderboardStore, insert_scores, read_user_stats, read_version, select_top
+)
+
+
+class AsyncLeaderboardStore:
+    """
+    Pooled async wrapper over the leaderboard database.
+    """
+
+    def __init__(self, db_file, top_k=5, pool_size=8):
+        """
+        Open the connection pool. The schema is created (if needed)
+        through LeaderboardStore so both stores always agree on it.
+
+        Args:
+            db_file (str): Path to the SQLite database file.
+            top_k (int): Number of rows shown on the leaderboard.
+            pool_size (int): Connections (and worker threads) in the pool.
+        """
+        LeaderboardStore(db_file, top_k=top_k)
+        self.db_file = db_file
+        self.top_k = top_k
+        self._executor = ThreadPoolExecutor(max_workers=pool_size,
+                                            thread_name_prefix='sqlite-pool')
+        self._pool = asyncio.Queue()
+        self._connections = []
+        for _ in range(pool_size):
+            conn = sqlite3.connect(db_file, check_same_thread=False, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._connections.append(conn)
+            self._pool.put_nowait(conn)
+
+    async def _run(self, func, *args):
+        """
+        Check out a connection and run func(conn, *args) on the pool's threads.
+        """
+        conn = await self._pool.get()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, conn, *args)
+        finally:
+            self._pool.put_nowait(conn)
+
+    async def add_score(self, username, chosen_time, distance):
+        """
+        Insert a single score. Returns True if it entered the top K.
+        """
+        return await self._run(insert_scores, [(username, chosen_time, distance)], self.top_k)
+
+    async def top_scores(self, limit=None, chosen_time=None):
+        """
+        Return the closest guesses first, overall or for one chosen_time.
+        """
+        return await self._run(select_top, self.top_k if limit is None else limit, chosen_time)
+
+    async def version(self, chosen_time=None):
+        """
+        Return (version, modified unix time) of a top K.
+        """
+        return await self._run(read_version, chosen_time)
+
+    async def user_stats(self, username):
+        """
+        Return a player's running aggregates and per-bucket bests, or None.
+        """
+        return await self._run(read_user_stats, username)
+
+    def close(self):
+        """
+        Close every pooled connection and stop the worker threads.
+        """
+        self._executor.shutdown(wait=True)
+        for conn in self._connections:
+            conn.close()
@@ -0,0 +1,291 @@
+"""
+Score Log Compaction
+Author: Jace Claassen
+Description:
+    Keeps the game_data.csv history log from growing without bound.
+
+    rotate_csv()   - once the live CSV passes a size threshold, rename it
+                     to game_data.csv.<ns>.rotated and start a fresh one
+                     (under the same lock ScoreWriter appends with).
+    compact()      - roll each rotated file into a compressed, columnar
+                     segment file and delete the rotated file.
+    iter_history() - stream every row ever recorded (segments, then
+                     rotated files, then the live CSV), one segment in
+                     memory at a time, for full-history exports.
+
+    Segment format (little-endian):
+        header:  magic b"TGSG", version (u16), row count (u32)
+        columns: usernames (JSON list of distinct names),
+                 username index per row (u32 array),
+                 chosen_time (f64 array), distance (f64 array)
+        Each column is stored as a u32 length followed by a zlib blob.
+
+    After compaction the SQLite store only needs the top K per time
+    bucket (prune_scores()); per-user aggregates live in their own tables.
+
+    How to Run:
+    Terminal: python3 compaction.py                      (rotate, compact, prune)
+    Terminal: python3 compaction.py --export history.csv (stream the full history)
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+
+from leaderboard_store import LeaderboardStore
+from score_writer import csv_lock
+
+SEGMENT_MAGIC = b'TGSG'
+SEGMENT_VERSION = 1
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+CSV_HEADER = ['username', 'chosen_time', 'distance']
+
+_HEADER = struct.Struct('<4sHI')
+_LENGTH = struct.Struct('<I')
+
+
+# ---------------------------
+# Paths
+# ---------------------------
+def segment_dir_for(csv_file):
+    """Default segment directory: <csv_file>.segments next to the log."""
+    return csv_file + '.segments'
+
+
+def rotated_files(csv_file):
+    """Rotated logs awaiting compaction, oldest first."""
+    paths = glob.glob(glob.escape(csv_file) + '.*.rotated')
+    return sorted(paths, key=_stamp)
+
+
+def segment_files(segment_dir):
+    """Segment files in segment_dir, oldest first."""
+    paths = glob.glob(os.path.join(glob.escape(segment_dir), 'seg-*.tgs'))
+    return sorted(paths, key=_stamp)
+
+
+def _stamp(path):
+    """Rotation timestamp (ns) embedded in a rotated or segment file name."""
+    name = os.path.basename(path)
+    return int(name.rsplit('.', 2)[-2] if name.endswith('.rotated') else name[4:-4])
+
+
+# ---------------------------
+# Rotation
+# ---------------------------
+def rotate_csv(csv_file, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Rotate the live CSV if it is larger than max_bytes.
+
+    Args:
+        csv_file (str): Path to the live history log.
+        max_bytes (int): Size threshold in bytes.
+
+    Returns:
+        str | None: Path of the rotated file, or None if not rotated.
+    """
+    if not os.path.exists(csv_file) or os.path.getsize(csv_file) <= max_bytes:
+        return None
+    with csv_lock(csv_file + '.lock'):
+        # Re-check under the lock in case another process rotated first
+        if not os.path.exists(csv_file) or os.path.getsize(csv_file) <= max_bytes:
+            return None
+        rotated = f'{csv_file}.{time.time_ns()}.rotated'
+        os.replace(csv_file, rotated)
+        with open(csv_file, 'w', newline='') as file:
+            csv.writer(file).writerow(CSV_HEADER)
+    return rotated
+
+
+# ---------------------------
+# Segments
+# ---------------------------
+def read_csv_rows(csv_file):
+    """
+    Yield (username, chosen_time, distance) from a history CSV, skipping
+    the header and malformed rows.
+    """
+    with open(csv_file, 'r', newline='') as file:
+        for row in csv.DictReader(file):
+            try:
+                yield row['username'], float(row['chosen_time']), float(row['distance'])
+            except (KeyError, TypeError, ValueError):
+                continue  # Skip malformed rows
+
+
+def _column_bytes(values):
+    """Little-endian bytes of an array column."""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _column_array(typecode, data):
+    """Array column decoded from little-endian bytes."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def write_segment(path, rows):
+    """
+    Write rows to a columnar, zlib-compressed segment file atomically.
+
+    Args:
+        path (str): Destination segment path.
+        rows (iterable): (username, chosen_time, distance) tuples.
+
+    Returns:
+        int: Number of rows written.
+    """
+    names = {}
+    name_index = array('I')
+    chosen_times = array('d')
+    distances = array('d')
+    for username, chosen_time, distance in rows:
+        name_index.append(names.setdefault(username, len(names)))
+        chosen_times.append(chosen_time)
+        distances.append(distance)
+
+    columns = [
+        json.dumps(list(names)).encode('utf-8'),
+        _column_bytes(name_index),
+        _column_bytes(chosen_times),
+        _column_bytes(distances),
+    ]
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION, len(distances)))
+        for column in columns:
+            blob = zlib.compress(column, 6)
+            file.write(_LENGTH.pack(len(blob)))
+            file.write(blob)
+    os.replace(tmp_path, path)
+    return len(distances)
+
+
+def read_segment(path):
+    """
+    Yield (username, chosen_time, distance) rows from one segment file.
+
+    Raises:
+        ValueError: If the file is not a segment of a supported version.
+    """
+    with open(path, 'rb') as file:
+        magic, version, count = _HEADER.unpack(file.read(_HEADER.size))
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            raise ValueError(f'{path} is not a version {SEGMENT_VERSION} score segment')
+        columns = []
+        for _ in range(4):
+            (size,) = _LENGTH.unpack(file.read(_LENGTH.size))
+            columns.append(zlib.decompress(file.read(size)))
+
+    names = json.loads(columns[0])
+    name_index = _column_array('I', columns[1])
+    chosen_times = _column_array('d', columns[2])
+    distances = _column_array('d', columns[3])
+    if not len(name_index) == len(chosen_times) == len(distances) == count:
+        raise ValueError(f'{path} is truncated')
+    for i in range(count):
+        yield names[name_index[i]], chosen_times[i], distances[i]
+
+
+def compact(csv_file, segment_dir=None):
+    """
+    Roll every rotated log into a segment file, then delete the log.
+    A segment is named after its rotated file, so a job interrupted
+    between the two steps never writes the same rows twice.
+
+    Args:
+        csv_file (str): Path to the live history log.
+        segment_dir (str, optional): Defaults to <csv_file>.segments.
+
+    Returns:
+        int: Number of rows compacted.
+    """
+    segment_dir = segment_dir or segment_dir_for(csv_file)
+    os.makedirs(segment_dir, exist_ok=True)
+    total = 0
+    for rotated in rotated_files(csv_file):
+        segment = os.path.join(segment_dir, f'seg-{_stamp(rotated)}.tgs')
+        if not os.path.exists(segment):
+            total += write_segment(segment, read_csv_rows(rotated))
+        os.remove(rotated)
+    return total
+
+
+def iter_history(csv_file, segment_dir=None):
+    """
+    Stream the full score history in recording order: compacted segments,
+    rotated logs not yet compacted, then the live CSV.
+
+    Yields:
+        tuple: (username, chosen_time, distance)
+    """
+    segment_dir = segment_dir or segment_dir_for(csv_file)
+    # List rotated logs before segments so a concurrent compact() can
+    # only move a log into a segment we have already seen
+    rotated = rotated_files(csv_file)
+    segments = segment_files(segment_dir)
+    for segment in segments:
+        yield from read_segment(segment)
+    for path in rotated:
+        segment = os.path.join(segment_dir, f'seg-{_stamp(path)}.tgs')
+        if segment in segments:
+            continue
+        if os.path.exists(path):
+            yield from read_csv_rows(path)
+        else:
+            yield from read_segment(segment)  # Compacted while we were reading
+    if os.path.exists(csv_file):
+        yield from read_csv_rows(csv_file)
+
+
+# ---------------------------
+# Command Line
+# ---------------------------
+def main():
+    parser = argparse.ArgumentParser(description='Rotate and compact the score history log.')
+    parser.add_argument('--csv', default='game_data.csv', help='live history log')
+    parser.add_argument('--db', default='game_data.db', help='leaderboard database')
+    parser.add_argument('--max-bytes', type=int, default=DEFAULT_MAX_BYTES,
+                        help='rotate the live log once it is larger than this')
+    parser.add_argument('--top-k', type=int, default=5, help='rows kept per leaderboard')
+    parser.add_argument('--export', metavar='FILE',
+                        help='stream the full history to FILE instead of compacting')
+    args = parser.parse_args()
+
+    if args.export:
+        count = 0
+        with open(args.export, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(CSV_HEADER)
+            for row in iter_history(args.csv):
+                writer.writerow(row)
+                count += 1
+        print(f"Exported {count} rows to {args.export}")
+        return
+
+    # Make sure the rows about to be rotated away are in the store first
+    store = LeaderboardStore(args.db, top_k=args.top_k)
+    store.migrate_csv(args.csv)
+
+    rotated = rotate_csv(args.csv, args.max_bytes)
+    if rotated:
+        print(f"Rotated {args.csv} -> {rotated}")
+    print(f"Compacted {compact(args.csv)} rows into {segment_dir_for(args.csv)}")
+    print(f"Pruned {store.prune_scores()} rows outside the top {args.top_k}")
+
+
+if __name__ == '__main__':
+    main()
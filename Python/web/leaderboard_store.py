@@ -0,0 +1,397 @@
+"""
+Leaderboard Store
+Author: Jace Claassen
+Description:
+    SQLite-backed score storage for the Time Guess Game.
+    Scores live in an indexed table so the leaderboard can read the top K
+    rows straight off the distance index instead of parsing and sorting the
+    whole CSV history on every page view.
+
+    Leaderboards are also partitioned by chosen_time: an index on
+    (chosen_time, distance) gives each time bucket its own O(K) top-K read.
+    Per-user aggregates (games, total and best distance, best per bucket)
+    are updated incrementally inside every insert, so personal stats never
+    rescan the history.
+
+    The store also keeps a version counter per leaderboard (global and per
+    bucket) that only changes when a new score actually enters that top K,
+    so callers can cache the rendered leaderboard and answer repeat views
+    with 304 Not Modified.
+
+    Existing game_data.csv files are imported once by migrate_csv().
+    Once the full history has been compacted into segment files (see
+    compaction.py), prune_scores() drops every row that is not in some
+    top K, keeping the hot table small.
+"""
+
+import csv
+import os
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS scores (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        username    TEXT    NOT NULL,
+        chosen_time REAL    NOT NULL,
+        distance    REAL    NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_scores_distance ON scores (distance);
+    CREATE INDEX IF NOT EXISTS idx_scores_bucket ON scores (chosen_time, distance);
+    CREATE TABLE IF NOT EXISTS user_stats (
+        username       TEXT PRIMARY KEY,
+        games          INTEGER NOT NULL,
+        total_distance REAL    NOT NULL,
+        best_distance  REAL    NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS user_bests (
+        username      TEXT NOT NULL,
+        chosen_time   REAL NOT NULL,
+        best_distance REAL NOT NULL,
+        PRIMARY KEY (username, chosen_time)
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        key   TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+"""
+
+
+def insert_scores(conn, rows, top_k):
+    """
+    Insert rows in one transaction, update the per-user aggregates, and
+    bump the version of every leaderboard (global and per chosen_time)
+    that one of them made it into. Shared by the sync and async stores.
+
+    Args:
+        conn (sqlite3.Connection): Open connection (not inside a transaction).
+        rows (list[tuple]): (username, chosen_time, distance) tuples.
+        top_k (int): Leaderboard size.
+
+    Returns:
+        bool: True if the global top K changed.
+    """
+    rows = [(username, float(chosen_time), float(distance))
+            for username, chosen_time, distance in rows]
+    if not rows:
+        return False
+
+    # Best new distance per time bucket
+    bucket_best = {}
+    for _, chosen_time, distance in rows:
+        bucket_best[chosen_time] = min(distance, bucket_best.get(chosen_time, distance))
+
+    with conn:
+        conn.execute('BEGIN IMMEDIATE')
+        # Current K-th best distances; None while a board has fewer than K rows
+        cutoff = _cutoff(conn, top_k)
+        bucket_cutoffs = {t: _cutoff(conn, top_k, t) for t in bucket_best}
+
+        _insert_rows(conn, rows)
+
+        changed = cutoff is None or min(bucket_best.values()) < cutoff
+        if changed:
+            _bump_version(conn)
+        for chosen_time, best in bucket_best.items():
+            bucket_cutoff = bucket_cutoffs[chosen_time]
+            if bucket_cutoff is None or best < bucket_cutoff:
+                _bump_version(conn, chosen_time)
+    return changed
+
+
+def _insert_rows(conn, rows):
+    """Insert score rows and fold them into the per-user aggregates."""
+    conn.executemany(
+        'INSERT INTO scores (username, chosen_time, distance) VALUES (?, ?, ?)',
+        rows
+    )
+    conn.executemany(
+        'INSERT INTO user_stats (username, games, total_distance, best_distance) '
+        'VALUES (?, 1, ?, ?) '
+        'ON CONFLICT (username) DO UPDATE SET '
+        '    games = games + 1, '
+        '    total_distance = total_distance + excluded.total_distance, '
+        '    best_distance = MIN(best_distance, excluded.best_distance)',
+        [(username, distance, distance) for username, _, distance in rows]
+    )
+    conn.executemany(
+        'INSERT INTO user_bests (username, chosen_time, best_distance) VALUES (?, ?, ?) '
+        'ON CONFLICT (username, chosen_time) DO UPDATE SET '
+        '    best_distance = MIN(best_distance, excluded.best_distance)',
+        rows
+    )
+
+
+def _cutoff(conn, top_k, chosen_time=None):
+    """Return the K-th best distance (overall or for one bucket), or None."""
+    if chosen_time is None:
+        row = conn.execute(
+            'SELECT distance FROM scores ORDER BY distance LIMIT 1 OFFSET ?',
+            (top_k - 1,)
+        ).fetchone()
+    else:
+        row = conn.execute(
+            'SELECT distance FROM scores WHERE chosen_time = ? '
+            'ORDER BY distance LIMIT 1 OFFSET ?',
+            (chosen_time, top_k - 1)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def _version_keys(chosen_time=None):
+    """Meta keys holding the version and modified time of one leaderboard."""
+    suffix = '' if chosen_time is None else f':{float(chosen_time):g}'
+    return 'leaderboard_version' + suffix, 'leaderboard_modified' + suffix
+
+
+def _bump_version(conn, chosen_time=None):
+    """Advance a leaderboard's version and record when it changed."""
+    version_key, modified_key = _version_keys(chosen_time)
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES (?, '1') "
+        "ON CONFLICT (key) DO UPDATE SET value = CAST(value AS INTEGER) + 1",
+        (version_key,)
+    )
+    conn.execute(
+        'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+        (modified_key, str(time.time()))
+    )
+
+
+def select_top(conn, limit, chosen_time=None):
+    """
+    Return the `limit` closest guesses, overall or for one chosen_time,
+    read off the matching index.
+    """
+    if chosen_time is None:
+        rows = conn.execute(
+            'SELECT username, chosen_time, distance FROM scores '
+            'ORDER BY distance LIMIT ?',
+            (limit,)
+        )
+    else:
+        rows = conn.execute(
+            'SELECT username, chosen_time, distance FROM scores '
+            'WHERE chosen_time = ? ORDER BY distance LIMIT ?',
+            (float(chosen_time), limit)
+        )
+    return [dict(row) for row in rows]
+
+
+def read_version(conn, chosen_time=None):
+    """
+    Return (version, modified unix time) of a leaderboard; (0, 0.0) if it
+    has never changed.
+    """
+    version_key, modified_key = _version_keys(chosen_time)
+    values = dict(conn.execute(
+        'SELECT key, value FROM meta WHERE key IN (?, ?)',
+        (version_key, modified_key)
+    ).fetchall())
+    return int(values.get(version_key, 0)), float(values.get(modified_key, 0))
+
+
+def read_user_stats(conn, username):
+    """
+    Return a player's running aggregates and per-bucket bests, or None.
+    """
+    stats = conn.execute(
+        'SELECT username, games, total_distance, best_distance FROM user_stats '
+        'WHERE username = ?',
+        (username,)
+    ).fetchone()
+    if stats is None:
+        return None
+    bests = conn.execute(
+        'SELECT chosen_time, best_distance FROM user_bests '
+        'WHERE username = ? ORDER BY chosen_time',
+        (username,)
+    )
+    return {
+        'username': stats['username'],
+        'games': stats['games'],
+        'mean_distance': stats['total_distance'] / stats['games'],
+        'best_distance': stats['best_distance'],
+        'bests': [dict(row) for row in bests],
+    }
+
+
+class LeaderboardStore:
+    """
+    Indexed leaderboard storage backed by an embedded SQLite database.
+
+    Each thread gets its own connection, since sqlite3 connections
+    cannot be shared between the threads Flask serves requests on.
+    """
+
+    def __init__(self, db_file, top_k=5):
+        """
+        Open (or create) the leaderboard database.
+
+        Args:
+            db_file (str): Path to the SQLite database file.
+            top_k (int): Number of rows shown on the leaderboard.
+        """
+        self.db_file = db_file
+        self.top_k = top_k
+        self._local = threading.local()
+        conn = self._connect()
+        # WAL lets readers in other worker processes run alongside a write
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(SCHEMA)
+        self._backfill_aggregates()
+
+    def _connect(self):
+        """
+        Return this thread's connection, opening it on first use.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def add_score(self, username, chosen_time, distance):
+        """
+        Insert a single score.
+
+        Args:
+            username (str): Player name.
+            chosen_time (float): Target time in seconds.
+            distance (float): How far off the player was, in seconds.
+
+        Returns:
+            bool: True if the score entered the top K.
+        """
+        return insert_scores(self._connect(), [(username, chosen_time, distance)], self.top_k)
+
+    def add_scores(self, rows):
+        """
+        Insert many scores in a single transaction.
+
+        Args:
+            rows (list[tuple]): (username, chosen_time, distance) tuples.
+
+        Returns:
+            bool: True if any of them entered the top K.
+        """
+        return insert_scores(self._connect(), rows, self.top_k)
+
+    def top_scores(self, limit=None, chosen_time=None):
+        """
+        Return the closest guesses first, read off the distance index.
+
+        Args:
+            limit (int, optional): Number of rows. Defaults to top_k.
+            chosen_time (float, optional): Only this game length.
+
+        Returns:
+            list[dict]: Rows with username, chosen_time and distance.
+        """
+        return select_top(self._connect(), self.top_k if limit is None else limit, chosen_time)
+
+    def version(self, chosen_time=None):
+        """
+        Return (version, modified unix time) of a top K (overall or one
+        chosen_time). The version only changes when that top K does.
+        """
+        return read_version(self._connect(), chosen_time)
+
+    def user_stats(self, username):
+        """
+        Return a player's games, mean and best distance, and best per
+        chosen_time, or None if they have no scores.
+        """
+        return read_user_stats(self._connect(), username)
+
+    def _backfill_aggregates(self):
+        """
+        Build the per-user aggregates from existing scores exactly once,
+        for databases created before the aggregates existed.
+        """
+        conn = self._connect()
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'aggregates_backfilled'").fetchone():
+            return
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'aggregates_backfilled'").fetchone():
+                return
+            conn.execute(
+                'INSERT OR REPLACE INTO user_stats (username, games, total_distance, best_distance) '
+                'SELECT username, COUNT(*), SUM(distance), MIN(distance) FROM scores GROUP BY username'
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO user_bests (username, chosen_time, best_distance) '
+                'SELECT username, chosen_time, MIN(distance) FROM scores '
+                'GROUP BY username, chosen_time'
+            )
+            conn.execute("INSERT INTO meta (key, value) VALUES ('aggregates_backfilled', '1')")
+
+    def migrate_csv(self, csv_file):
+        """
+        Import an existing game_data.csv into the store exactly once.
+        The import is recorded in the meta table, so later calls for the
+        same file are a no-op. Malformed rows are skipped.
+
+        Args:
+            csv_file (str): Path to the legacy CSV file.
+
+        Returns:
+            int: Number of rows imported (0 if already migrated).
+        """
+        key = 'csv_migrated:' + os.path.abspath(csv_file)
+        conn = self._connect()
+        if conn.execute('SELECT 1 FROM meta WHERE key = ?', (key,)).fetchone():
+            return 0
+
+        rows = []
+        if os.path.exists(csv_file):
+            with open(csv_file, 'r', newline='') as file:
+                for row in csv.DictReader(file):
+                    try:
+                        rows.append((row['username'],
+                                     float(row['chosen_time']),
+                                     float(row['distance'])))
+                    except (KeyError, TypeError, ValueError):
+                        continue  # Skip malformed rows
+
+        with conn:
+            # Re-check under the write lock in case another process got here first
+            conn.execute('BEGIN IMMEDIATE')
+            if conn.execute('SELECT 1 FROM meta WHERE key = ?', (key,)).fetchone():
+                return 0
+            _insert_rows(conn, rows)
+            conn.execute('INSERT INTO meta (key, value) VALUES (?, ?)', (key, str(len(rows))))
+            if rows:
+                _bump_version(conn)
+                for chosen_time in {row[1] for row in rows}:
+                    _bump_version(conn, chosen_time)
+        return len(rows)
+
+    def prune_scores(self):
+        """
+        Delete every score that is not in the top K of its chosen_time.
+        The global top K is a subset of the per-bucket ones, and the
+        per-user aggregates live in their own tables, so no leaderboard
+        or stats page changes. The full history stays in the CSV and its
+        compacted segments.
+
+        Returns:
+            int: Number of rows deleted.
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            cursor = conn.execute(
+                'DELETE FROM scores WHERE id NOT IN ('
+                '    SELECT id FROM ('
+                '        SELECT id, ROW_NUMBER() OVER ('
+                '            PARTITION BY chosen_time ORDER BY distance, id'
+                '        ) AS rank FROM scores'
+                '    ) WHERE rank <= ?'
+                ')',
+                (self.top_k,)
+            )
+        return cursor.rowcount
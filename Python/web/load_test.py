@@ -0,0 +1,124 @@
+"""
+Time Guess Game Load Test
+Author: Jace Claassen
+Description:
+    Dependency-free HTTP load generator for comparing the Flask app with
+    the ASGI app. Each simulated player opens its own connection per
+    request (Connection: close), so both servers are measured the same way.
+
+    Scenarios:
+        leaderboard - GET /leaderboard
+        play        - log in, pick a time, then repeatedly POST /start
+                      and /stop (each timed pair counts as one request)
+
+    How to Run:
+    Terminal 1: python3 app.py                       (Flask, port 5000)
+    Terminal 2: uvicorn asgi_app:app --port 8000     (ASGI)
+    Terminal 3: python3 load_test.py http://127.0.0.1:5000 http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from urllib.parse import urlencode, urlsplit
+
+
+async def http_request(host, port, method, path, body=b'', cookie=None):
+    """
+    Send one HTTP/1.1 request and return (status, headers, body).
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    lines = [f'{method} {path} HTTP/1.1', f'Host: {host}:{port}', 'Connection: close',
+             f'Content-Length: {len(body)}']
+    if body:
+        lines.append('Content-Type: application/x-www-form-urlencoded')
+    if cookie:
+        lines.append(f'Cookie: {cookie}')
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+
+    head, _, payload = raw.partition(b'\r\n\r\n')
+    head_lines = head.decode('latin-1').split('\r\n')
+    status = int(head_lines[0].split()[1])
+    headers = {}
+    for line in head_lines[1:]:
+        name, _, value = line.partition(':')
+        headers.setdefault(name.strip().lower(), value.strip())
+    return status, headers, payload
+
+
+async def player(host, port, scenario, requests, latencies, errors):
+    """
+    One simulated player making `requests` timed requests.
+    """
+    cookie = None
+    if scenario == 'play':
+        # Log in and pick a time; the session cookie carries the state
+        _, headers, _ = await http_request(host, port, 'POST', '/',
+                                           urlencode({'username': f'load{random.randrange(10**6)}'}).encode())
+        cookie = headers.get('set-cookie', '').split(';')[0]
+        _, headers, _ = await http_request(host, port, 'POST', '/select_time',
+                                           urlencode({'time': 10}).encode(), cookie)
+        cookie = headers.get('set-cookie', '').split(';')[0] or cookie
+
+    for _ in range(requests):
+        start = time.perf_counter()
+        try:
+            if scenario == 'play':
+                # The timer token travels in the session cookie
+                status, headers, _ = await http_request(host, port, 'POST', '/start', cookie=cookie)
+                cookie = headers.get('set-cookie', '').split(';')[0] or cookie
+                if status < 400:
+                    status, headers, _ = await http_request(host, port, 'POST', '/stop', cookie=cookie)
+                    cookie = headers.get('set-cookie', '').split(';')[0] or cookie
+            else:
+                status, _, _ = await http_request(host, port, 'GET', '/leaderboard')
+            if status >= 400:
+                errors.append(status)
+        except OSError as exc:
+            errors.append(exc)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run_load(url, scenario, concurrency, requests):
+    """
+    Run `concurrency` players against url and return summary statistics.
+    """
+    parts = urlsplit(url)
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(player(parts.hostname, parts.port or 80, scenario,
+                                  requests, latencies, errors)
+                           for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': len(latencies) / wall,
+        'p50': statistics.median(latencies),
+        'p99': latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the Time Guess Game.')
+    parser.add_argument('urls', nargs='+', help='base URLs to test, e.g. http://127.0.0.1:5000')
+    parser.add_argument('--scenario', choices=('leaderboard', 'play'), default='play')
+    parser.add_argument('--concurrency', type=int, default=200, help='simultaneous players')
+    parser.add_argument('--requests', type=int, default=20, help='requests per player')
+    args = parser.parse_args()
+
+    print(f"{'url':<28}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for url in args.urls:
+        result = asyncio.run(run_load(url, args.scenario, args.concurrency, args.requests))
+        print(f"{url:<28}{result['requests']:>10}{result['errors']:>8}{result['rps']:>10.1f}"
+              f"{result['p50'] * 1000:>10.1f}{result['p99'] * 1000:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+"""
+Metrics
+Author: Jace Claassen
+Description:
+    Dependency-free request instrumentation for the Time Guess Game,
+    exposed in the Prometheus text format.
+
+    instrument_app() hooks a Flask app to record:
+        - request latency histograms per route, method and status
+        - response bytes per route
+        - template render time per template (Flask's render signals)
+    InstrumentedStore times every leaderboard store call and counts the
+    rows it reads and writes. Anything else can be exported through
+    Registry.collector() callbacks that are read at scrape time.
+
+    Opt-in profiling: with a slow threshold set, a sample of requests
+    runs under cProfile and the profile is dumped (.prof, readable with
+    pstats or snakeviz) whenever the request was slower than the threshold.
+"""
+
+import cProfile
+import os
+import random
+import threading
+import time
+from bisect import bisect_left
+
+from flask import g, request, template_rendered, before_render_template
+
+# Seconds; tuned for a small web app (sub-millisecond cache hits to slow disk)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _format_labels(labels):
+    """Render a label dict as {a="1",b="2"} with Prometheus escaping."""
+    if not labels:
+        return ''
+    parts = []
+    for name, value in labels:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{name}="{value}"')
+    return '{' + ','.join(parts) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# ---------------------------
+# Metric Types
+# ---------------------------
+class Counter:
+    """
+    Monotonic counter with labels.
+    """
+
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels[name] for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(labels[name] for name in self.label_names), 0)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            labels = _format_labels(zip(self.label_names, key))
+            lines.append(f'{self.name}{labels} {_format_value(value)}')
+        return lines
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram with labels, as Prometheus expects.
+    """
+
+    def __init__(self, name, help_text, label_names=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (+Inf last), sum, count]
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels[name] for name in self.label_names)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, **labels):
+        """Context manager that observes the duration of its block."""
+        return _Timer(self, labels)
+
+    def count(self, **labels):
+        series = self._series.get(tuple(labels[name] for name in self.label_names))
+        return series[2] if series else 0
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+        for key, (counts, total, count) in items:
+            base = list(zip(self.label_names, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (None,), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound is None else repr(bound)
+                lines.append(f'{self.name}_bucket{_format_labels(base + [("le", le)])} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(base)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(base)} {count}')
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Registry:
+    """
+    A set of metrics rendered together on /metrics.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, help_text, label_names=()):
+        metric = Counter(name, help_text, label_names)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, help_text, label_names=(), buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, help_text, label_names, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, func):
+        """
+        Register func() -> iterable of (name, type, help, value) read at
+        scrape time, for values another object already keeps (e.g. the
+        score writer's byte counts). Usable as a decorator.
+        """
+        self._collectors.append(func)
+        return func
+
+    def render(self):
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for func in self._collectors:
+            for name, kind, help_text, value in func():
+                lines.extend([f'# HELP {name} {help_text}', f'# TYPE {name} {kind}',
+                              f'{name} {_format_value(value)}'])
+        return '\n'.join(lines) + '\n'
+
+
+# ---------------------------
+# Storage Instrumentation
+# ---------------------------
+class InstrumentedStore:
+    """
+    Wraps a LeaderboardStore, timing every method call and counting the
+    rows read (returned) and written (passed in).
+    """
+
+    WRITES = {'add_score': 1, 'add_scores': None, 'migrate_csv': None, 'prune_scores': None}
+
+    def __init__(self, store, registry):
+        self._store = store
+        self._seconds = registry.histogram(
+            'storage_operation_seconds', 'Leaderboard store call latency.', ('operation',))
+        self._rows = registry.counter(
+            'storage_rows_total', 'Rows read from or written to the leaderboard store.',
+            ('operation', 'direction'))
+
+    def __getattr__(self, name):
+        attr = getattr(self._store, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with self._seconds.time(operation=name):
+                result = attr(*args, **kwargs)
+            if name in self.WRITES:
+                rows = self.WRITES[name]
+                if rows is None:
+                    rows = len(args[0]) if name == 'add_scores' else result or 0
+                self._rows.inc(rows, operation=name, direction='write')
+            elif isinstance(result, list):
+                self._rows.inc(len(result), operation=name, direction='read')
+            elif result is not None:
+                self._rows.inc(1, operation=name, direction='read')
+            return result
+
+        return call
+
+
+# ---------------------------
+# Flask Integration
+# ---------------------------
+def instrument_app(app, registry, slow_ms=None, profile_rate=0.1, profile_dir='profiles'):
+    """
+    Record request latency, response size and render time for a Flask app.
+
+    Args:
+        app (Flask): The app to instrument.
+        registry (Registry): Where the metrics are registered.
+        slow_ms (float, optional): Enables profiling; requests slower than
+            this are dumped to profile_dir.
+        profile_rate (float): Fraction of requests run under the profiler.
+        profile_dir (str): Directory for .prof dumps.
+    """
+    latency = registry.histogram(
+        'http_request_duration_seconds', 'Request latency.', ('route', 'method', 'status'))
+    response_bytes = registry.counter(
+        'http_response_bytes_total', 'Response body bytes sent.', ('route',))
+    render_seconds = registry.histogram(
+        'template_render_seconds', 'Jinja template render time.', ('template',))
+    profiles = registry.counter(
+        'slow_request_profiles_total', 'Profiles dumped for slow requests.', ('route',))
+
+    def route_label():
+        return request.url_rule.rule if request.url_rule else 'unmatched'
+
+    @app.before_request
+    def start_request():
+        g.metrics_start = time.perf_counter()
+        g.metrics_profiler = None
+        if slow_ms is not None and random.random() < profile_rate:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                return  # Another profiler is active (Python 3.12+ allows one)
+            g.metrics_profiler = profiler
+
+    @app.after_request
+    def finish_request(response):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return response
+        elapsed = time.perf_counter() - start
+        route = route_label()
+        latency.observe(elapsed, route=route, method=request.method, status=response.status_code)
+        if not response.direct_passthrough:
+            response_bytes.inc(response.calculate_content_length() or 0, route=route)
+
+        profiler = g.pop('metrics_profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            if elapsed * 1000 >= slow_ms:
+                os.makedirs(profile_dir, exist_ok=True)
+                name = route.strip('/').replace('/', '_').replace('<', '').replace('>', '') or 'root'
+                profiler.dump_stats(os.path.join(
+                    profile_dir, f'{name}-{time.strftime("%Y%m%d-%H%M%S")}-{elapsed * 1000:.0f}ms.prof'))
+                profiles.inc(route=route)
+        return response
+
+    @app.teardown_request
+    def abandon_profile(exc):
+        # after_request is skipped on unhandled errors; never leave a profiler running
+        profiler = g.pop('metrics_profiler', None)
+        if profiler is not None:
+            profiler.disable()
+
+    def render_started(sender, template, context, **extra):
+        g.setdefault('metrics_renders', []).append(time.perf_counter())
+
+    def render_finished(sender, template, context, **extra):
+        starts = g.get('metrics_renders')
+        if starts:
+            render_seconds.observe(time.perf_counter() - starts.pop(),
+                                   template=template.name or 'inline')
+
+    # weak=False: the receivers are closures that would otherwise be collected
+    before_render_template.connect(render_started, app, weak=False)
+    template_rendered.connect(render_finished, app, weak=False)
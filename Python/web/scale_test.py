@@ -0,0 +1,85 @@
+"""
+Time Guess Game Worker Scaling Test
+Author: Jace Claassen
+Description:
+    Starts wsgi:app under gunicorn with 1, 2, 4, ... workers, drives each
+    with load_test.py and prints throughput relative to one worker.
+    Every run uses a fresh scratch directory, so the real game_data files
+    are never touched. Throughput can only scale up to the number of CPU
+    cores on the machine.
+
+    How to Run:
+    Terminal: python3 scale_test.py --workers 1 2 4 8 --scenario play
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from load_test import run_load
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f'server did not start on port {port}')
+
+
+def run_workers(workers, scenario, concurrency, requests):
+    """
+    Run one load test against `workers` gunicorn workers.
+    """
+    port = free_port()
+    with tempfile.TemporaryDirectory() as scratch:
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-w', str(workers), '-b', f'127.0.0.1:{port}',
+             '--chdir', scratch, '--pythonpath', BASE_DIR, '--log-level', 'warning',
+             '--backlog', '4096', 'wsgi:app'],
+            env={**os.environ, 'SECRET_KEY': 'scale-test'},
+        )
+        try:
+            wait_for_port(port)
+            return asyncio.run(run_load(f'http://127.0.0.1:{port}', scenario, concurrency, requests))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure throughput across worker counts.')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--scenario', choices=('leaderboard', 'play'), default='leaderboard')
+    parser.add_argument('--concurrency', type=int, default=64, help='simultaneous players')
+    parser.add_argument('--requests', type=int, default=50, help='requests per player')
+    args = parser.parse_args()
+
+    print(f"CPU cores: {os.cpu_count()}")
+    print(f"{'workers':>8}{'requests':>10}{'errors':>8}{'req/s':>10}{'speedup':>9}{'p50 ms':>10}{'p99 ms':>10}")
+    baseline = None
+    for workers in args.workers:
+        result = run_workers(workers, args.scenario, args.concurrency, args.requests)
+        baseline = baseline or result['rps']
+        print(f"{workers:>8}{result['requests']:>10}{result['errors']:>8}{result['rps']:>10.1f}"
+              f"{result['rps'] / baseline:>8.2f}x{result['p50'] * 1000:>10.1f}{result['p99'] * 1000:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
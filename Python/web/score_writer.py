@@ -0,0 +1,162 @@
+"""
+Score Writer
+Author: Jace Claassen
+Description:
+    Write-behind sink for the game_data.csv history log.
+    Request handlers hand rows to a bounded queue and return immediately;
+    a background thread group-commits them in batches. Each batch is
+    written with a single write() while holding an exclusive lock on
+    <csv_file>.lock, so rows from concurrent worker processes never
+    interleave and log rotation never races a write.
+"""
+
+import atexit
+import csv
+import io
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, writes are still serialised per process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def csv_lock(lock_file):
+    """
+    Hold an exclusive cross-process lock on lock_file for the with-block.
+    Used by both the writer and log rotation.
+    """
+    with open(lock_file, 'a') as lock:
+        if fcntl:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+class ScoreWriter:
+    """
+    Background, batched CSV appender.
+
+    Rows are flushed when a batch fills up or flush_interval seconds have
+    passed since the first queued row, whichever comes first. When the
+    queue is full, submit() blocks, which pushes back on request threads
+    instead of growing memory without bound.
+    """
+
+    def __init__(self, csv_file, batch_size=100, flush_interval=0.5, max_queue=10000):
+        """
+        Start the writer thread.
+
+        Args:
+            csv_file (str): CSV file rows are appended to.
+            batch_size (int): Maximum rows written per batch.
+            flush_interval (float): Maximum seconds a row waits in the queue.
+            max_queue (int): Queue capacity before submit() blocks.
+        """
+        self.csv_file = csv_file
+        self.lock_file = csv_file + '.lock'
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stop = object()  # Sentinel that tells the thread to exit
+        self._closed = False
+        # Running totals, read by /metrics (only the writer thread updates them)
+        self.rows_written = 0
+        self.bytes_written = 0
+        self.batches_written = 0
+        self._thread = threading.Thread(target=self._run, name='score-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, row):
+        """
+        Queue a row for writing.
+
+        Args:
+            row (list): CSV row, e.g. [username, chosen_time, distance].
+        """
+        if self._closed:
+            raise RuntimeError('ScoreWriter is closed')
+        self._queue.put(list(row))
+
+    def flush(self):
+        """
+        Block until every row queued so far has been written.
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+        Flush outstanding rows and stop the writer thread.
+        Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._stop)
+        self._thread.join()
+
+    def _run(self):
+        """
+        Writer loop: collect a batch, write it, repeat until stopped.
+        """
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch = []
+            if item is self._stop:
+                stopping = True
+            else:
+                batch.append(item)
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if item is self._stop:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+            try:
+                if batch:
+                    self._write_batch(batch)
+            except OSError:
+                # Keep the thread alive so later batches and flush() still work
+                logger.exception('Failed to write %d score rows', len(batch))
+            finally:
+                # One task_done per item taken off the queue (rows plus sentinel)
+                for _ in range(len(batch) + (1 if stopping else 0)):
+                    self._queue.task_done()
+
+    def _write_batch(self, rows):
+        """
+        Append rows to the CSV in a single locked write.
+
+        Args:
+            rows (list[list]): Rows to write.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        data = buffer.getvalue()
+
+        with csv_lock(self.lock_file):
+            with open(self.csv_file, 'a', newline='') as file:
+                file.write(data)
+        self.rows_written += len(rows)
+        self.bytes_written += len(data.encode('utf-8'))
+        self.batches_written += 1
@@ -0,0 +1,166 @@
+"""
+Quantile Sketch
+Author: Jace Claassen
+Description:
+    A KLL quantile sketch (Karnin, Lang & Liberty) for percentiles over
+    streams too large to hold in memory.
+
+    Values go into a stack of "compactors". Level h holds items that each
+    stand for 2**h original values. When a level fills up it is sorted and
+    every other item (starting at a random offset) is promoted to the
+    level above, halving its size. Capacities shrink by a factor of 2/3
+    per level below the top, so the whole sketch stays around 3k items
+    however many values it has seen, with rank error of roughly 1.7/k.
+
+    Sketches are mergeable: merging two sketches level by level gives the
+    same guarantees as one sketch fed both streams, so partial results
+    from worker processes (or from earlier runs) combine exactly like the
+    counts and sums next to them.
+"""
+
+import math
+import random
+
+
+class KLLSketch:
+    """
+    Mergeable, constant-memory quantile sketch.
+    """
+
+    def __init__(self, k=200):
+        """
+        Args:
+            k (int): Accuracy parameter; the top compactor holds k items.
+        """
+        self.k = k
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.compactors = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def _capacity(self, level):
+        """Items level may hold before it is compacted."""
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _grow(self):
+        self.compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def add(self, value):
+        """Add one value."""
+        self.compactors[0].append(value)
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def _compress(self):
+        """Compact full levels, lowest first, until the sketch fits again."""
+        for level in range(len(self.compactors)):
+            items = self.compactors[level]
+            if len(items) < self._capacity(level):
+                continue
+            if level + 1 == len(self.compactors):
+                self._grow()
+            items.sort()
+            # An odd item out stays behind so weights still add up exactly
+            keep = [items.pop()] if len(items) % 2 else []
+            self.compactors[level + 1].extend(items[random.getrandbits(1)::2])
+            self.compactors[level] = keep
+            self._size = sum(len(c) for c in self.compactors)
+            if self._size < self._max_size:
+                break
+
+    def merge(self, other):
+        """
+        Fold another sketch into this one.
+
+        Args:
+            other (KLLSketch): Sketch of a disjoint part of the stream.
+
+        Returns:
+            KLLSketch: self, for chaining.
+        """
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._size = sum(len(c) for c in self.compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def quantiles(self, fractions):
+        """
+        Estimate several quantiles in one sort.
+
+        Args:
+            fractions (iterable): Values in [0, 1], e.g. (0.5, 0.9, 0.99).
+
+        Returns:
+            list: Estimated value per fraction (None if the sketch is empty).
+        """
+        fractions = list(fractions)
+        if not self.count:
+            return [None] * len(fractions)
+        weighted = sorted((value, 1 << level)
+                          for level, items in enumerate(self.compactors) for value in items)
+        total = sum(weight for _, weight in weighted)
+        results = []
+        for fraction in fractions:
+            if fraction <= 0:
+                results.append(self.min)
+                continue
+            if fraction >= 1:
+                results.append(self.max)
+                continue
+            target = fraction * total
+            seen = 0
+            for value, weight in weighted:
+                seen += weight
+                if seen >= target:
+                    break
+            results.append(value)
+        return results
+
+    def quantile(self, fraction):
+        """Estimate a single quantile (0.5 is the median)."""
+        return self.quantiles([fraction])[0]
+
+    # ---------------------------
+    # Persistence
+    # ---------------------------
+    def to_dict(self):
+        """JSON-serialisable state."""
+        return {'k': self.k, 'count': self.count,
+                'min': self.min if self.count else None,
+                'max': self.max if self.count else None,
+                'compactors': self.compactors}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a sketch saved with to_dict()."""
+        sketch = cls(data['k'])
+        sketch.count = data['count']
+        if sketch.count:
+            sketch.min, sketch.max = data['min'], data['max']
+        sketch.compactors = [list(items) for items in data['compactors']] or [[]]
+        sketch._size = sum(len(c) for c in sketch.compactors)
+        sketch._max_size = sum(sketch._capacity(h) for h in range(len(sketch.compactors)))
+        return sketch
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"KLLSketch(k={self.k}, count={self.count}, stored={self._size})"
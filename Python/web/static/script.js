@@ -163,7 +163,7 @@ function showLeaderboard() {
     gameSection.classList.add('hidden');
     leaderboardSection.classList.remove('hidden');
 
-    fetch('/leaderboard')
+    fetch('/api/leaderboard')
         .then(res => res.json())
         .then(data => {
             const table = document.getElementById('leaderboard-table');
@@ -0,0 +1,223 @@
+"""
+Game Timers
+Author: Jace Claassen
+Description:
+    Server-side timing for the Time Guess Game. /start records a
+    time.monotonic_ns() timestamp and /stop measures against it, so the
+    score no longer depends on a client-reported time (easy to fake, and
+    skewed by the page's submit delay).
+
+    Running timers live in an in-memory table keyed by a random token:
+        - O(1) start and stop (dict insert / pop)
+        - bounded: past max_timers the oldest timer is evicted
+        - TTL: timers older than ttl seconds are swept periodically;
+          since monotonic start times only grow, the table is in expiry
+          order and a sweep only touches the entries it evicts
+
+    SharedTimerTable keeps the same table in SQLite for multi-worker
+    deployments, where /start and /stop may land on different processes.
+"""
+
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class TimerTable:
+    """
+    Bounded, TTL-evicted table of running game timers.
+    Safe to share between request threads.
+    """
+
+    def __init__(self, ttl=1800, max_timers=100000, sweep_interval=60):
+        """
+        Args:
+            ttl (float): Seconds before an unfinished timer is abandoned.
+            max_timers (int): Most timers kept at once.
+            sweep_interval (float): Seconds between sweeps of expired timers.
+        """
+        self.ttl_ns = int(ttl * NS_PER_SECOND)
+        self.max_timers = max_timers
+        self.sweep_interval_ns = int(sweep_interval * NS_PER_SECOND)
+        # token -> (start_ns, username, chosen_time), oldest first
+        self._timers = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic_ns() + self.sweep_interval_ns
+
+    def start(self, username, chosen_time):
+        """
+        Start a timer for one game.
+
+        Args:
+            username (str): Player the timer belongs to.
+            chosen_time (float): Target time in seconds.
+
+        Returns:
+            str: Token to pass to stop().
+        """
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            now = time.monotonic_ns()
+            if now >= self._next_sweep:
+                self._sweep(now)
+            while len(self._timers) >= self.max_timers:
+                self._timers.popitem(last=False)
+            self._timers[token] = (now, username, chosen_time)
+        return token
+
+    def stop(self, token, username):
+        """
+        Stop a timer and measure it. Each token can only be stopped once.
+
+        Args:
+            token (str): Token returned by start().
+            username (str): Player stopping the timer; must match.
+
+        Returns:
+            tuple | None: (elapsed seconds, chosen_time), or None if the
+            timer is unknown, expired or belongs to someone else.
+        """
+        now = time.monotonic_ns()
+        with self._lock:
+            timer = self._timers.pop(token, None)
+        if timer is None:
+            return None
+        start_ns, owner, chosen_time = timer
+        if owner != username or now - start_ns > self.ttl_ns:
+            return None
+        return (now - start_ns) / NS_PER_SECOND, chosen_time
+
+    def sweep(self):
+        """
+        Drop every expired timer now.
+
+        Returns:
+            int: Number of timers dropped.
+        """
+        with self._lock:
+            return self._sweep(time.monotonic_ns())
+
+    def _sweep(self, now):
+        """Evict expired timers from the front of the table (lock held)."""
+        dropped = 0
+        timers = self._timers
+        while timers:
+            start_ns = next(iter(timers.values()))[0]
+            if now - start_ns <= self.ttl_ns:
+                break
+            timers.popitem(last=False)
+            dropped += 1
+        self._next_sweep = now + self.sweep_interval_ns
+        return dropped
+
+    def __len__(self):
+        return len(self._timers)
+
+
+class SharedTimerTable:
+    """
+    TimerTable kept in SQLite so every worker process on the host sees the
+    same timers. time.monotonic_ns() reads CLOCK_MONOTONIC, which all
+    processes on one machine share, so a start recorded by one worker can
+    be stopped by another.
+    """
+
+    def __init__(self, db_file, ttl=1800, max_timers=100000, sweep_interval=60):
+        """
+        Args:
+            db_file (str): SQLite database shared by the workers.
+            ttl (float): Seconds before an unfinished timer is abandoned.
+            max_timers (int): Most timers kept after a sweep.
+            sweep_interval (float): Seconds between sweeps of expired timers.
+        """
+        self.db_file = db_file
+        self.ttl_ns = int(ttl * NS_PER_SECOND)
+        self.max_timers = max_timers
+        self.sweep_interval_ns = int(sweep_interval * NS_PER_SECOND)
+        self._local = threading.local()
+        self._next_sweep = time.monotonic_ns() + self.sweep_interval_ns
+        self._connect().executescript("""
+            CREATE TABLE IF NOT EXISTS timers (
+                token       TEXT    PRIMARY KEY,
+                start_ns    INTEGER NOT NULL,
+                username    TEXT    NOT NULL,
+                chosen_time REAL    NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_timers_start ON timers (start_ns);
+        """)
+
+    def _connect(self):
+        """
+        Return this thread's connection, opening it on first use.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def start(self, username, chosen_time):
+        """
+        Start a timer for one game. Returns the token to pass to stop().
+        """
+        token = secrets.token_urlsafe(16)
+        now = time.monotonic_ns()
+        if now >= self._next_sweep:
+            self._sweep(now)
+        with self._connect() as conn:
+            conn.execute('INSERT INTO timers (token, start_ns, username, chosen_time) '
+                         'VALUES (?, ?, ?, ?)', (token, now, username, chosen_time))
+        return token
+
+    def stop(self, token, username):
+        """
+        Stop a timer and measure it. Each token can only be stopped once.
+
+        Returns:
+            tuple | None: (elapsed seconds, chosen_time), or None if the
+            timer is unknown, expired or belongs to someone else.
+        """
+        if token is None:
+            return None
+        now = time.monotonic_ns()
+        conn = self._connect()
+        with conn:
+            # Claim the row under the write lock so two workers can't both stop it
+            conn.execute('BEGIN IMMEDIATE')
+            timer = conn.execute('SELECT start_ns, username, chosen_time FROM timers '
+                                 'WHERE token = ?', (token,)).fetchone()
+            conn.execute('DELETE FROM timers WHERE token = ?', (token,))
+        if timer is None:
+            return None
+        start_ns, owner, chosen_time = timer
+        # start_ns > now only for rows left over from before a reboot
+        if owner != username or not 0 <= now - start_ns <= self.ttl_ns:
+            return None
+        return (now - start_ns) / NS_PER_SECOND, chosen_time
+
+    def sweep(self):
+        """
+        Drop every expired timer now. Returns the number dropped.
+        """
+        return self._sweep(time.monotonic_ns())
+
+    def _sweep(self, now):
+        """Delete expired timers, then the oldest beyond max_timers."""
+        self._next_sweep = now + self.sweep_interval_ns
+        with self._connect() as conn:
+            dropped = conn.execute('DELETE FROM timers WHERE start_ns < ?',
+                                   (now - self.ttl_ns,)).rowcount
+            dropped += conn.execute(
+                'DELETE FROM timers WHERE token IN ('
+                '    SELECT token FROM timers ORDER BY start_ns DESC LIMIT -1 OFFSET ?'
+                ')',
+                (self.max_timers,)
+            ).rowcount
+        return dropped
+
+    def __len__(self):
+        return self._connect().execute('SELECT COUNT(*) FROM timers').fetchone()[0]
@@ -0,0 +1,57 @@
+"""
+Time Guess Game WSGI Entry Point
+Author: Jace Claassen
+Description:
+    Production entry point for running app.py under a multi-worker WSGI
+    server such as gunicorn. Compared with `python3 app.py` it:
+
+        - takes the session secret from SECRET_KEY, or generates one
+          into secret_key once so every worker signs cookies the same way
+        - keeps running games in SQLite (SHARED_TIMERS), since /start and
+          /stop may be served by different workers
+
+    Everything else is already safe to share between workers:
+        - one-time setup (CSV header, CSV import) runs under a file lock
+        - CSV appends are batched and flock-ed by each worker's ScoreWriter
+        - the leaderboard database runs in WAL mode with a busy timeout
+        - each worker's leaderboard cache is invalidated by the version
+          counters stored in that database
+
+    Do not use --preload: the score writer thread and SQLite connections
+    have to be created inside each worker, not inherited across fork().
+    /metrics reports on the worker that served the request.
+
+    How to Run:
+    Terminal: SECRET_KEY=... gunicorn -w 4 -b 127.0.0.1:8000 wsgi:app
+    Scaling:  python3 scale_test.py --workers 1 2 4 8
+"""
+
+import os
+import secrets
+
+from score_writer import csv_lock
+
+SECRET_KEY_FILE = 'secret_key'
+
+
+def load_secret_key():
+    """
+    Return SECRET_KEY from the environment, or the key in SECRET_KEY_FILE,
+    creating it (readable only by this user) if no worker has yet.
+    """
+    if os.environ.get('SECRET_KEY'):
+        return os.environ['SECRET_KEY']
+    with csv_lock(SECRET_KEY_FILE + '.lock'):
+        if not os.path.exists(SECRET_KEY_FILE):
+            fd = os.open(SECRET_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'w') as file:
+                file.write(secrets.token_hex(32))
+        with open(SECRET_KEY_FILE, 'r') as file:
+            return file.read().strip()
+
+
+# app.py reads its configuration from the environment at import time
+os.environ['SECRET_KEY'] = load_secret_key()
+os.environ.setdefault('SHARED_TIMERS', '1')
+
+from app import app  # noqa: E402
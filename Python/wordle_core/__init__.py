@@ -0,0 +1,6 @@
+"""
+Wordle Core
+Author: Jace
+
+Shared, UI-free Wordle logic used by both the console and GUI games.
+"""
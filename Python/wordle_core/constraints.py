@@ -0,0 +1,206 @@
+"""
+Wordle Constraints
+Author: Jace
+
+Description:
+Everything the feedback so far has revealed about the answer, kept in a
+form that makes "could this word still be the answer?" cheap to ask:
+
+    allowed[i]      26-bit mask of letters still possible at position i
+    min_counts[c]   the answer has at least this many of letter c
+    max_counts[c]   ...and at most this many (exact once a gray shows up)
+
+Each guess is folded in once by apply(), so a consistency check is five
+bit tests plus a count check for the few letters feedback has mentioned,
+no matter how many guesses came before.
+
+Hard mode ("every guess must use all revealed hints") is checked against
+two precomputed masks: the word packed 5 bits per letter (as in
+wordle_core.packed) and ANDed with a green field mask, and the word's
+26-bit letter set tested against the required-letter mask.
+
+CandidateSet keeps the words that are still possible and narrows them
+after every guess, so each turn only rescans the survivors of the last.
+"""
+
+from wordle_core.packed import BITS_PER_LETTER, pack
+from wordle_core.scoring import CORRECT, PRESENT, WORD_LENGTH, decode, prepare
+
+ALL_LETTERS = (1 << 26) - 1
+_LETTER_FIELD = (1 << BITS_PER_LETTER) - 1
+_ORDINALS = ("1st", "2nd", "3rd", "4th", "5th", "6th", "7th", "8th")
+
+
+def letter_mask(word):
+    """Return a 26-bit mask of the letters in word."""
+    mask = 0
+    for c in prepare(word)[0]:
+        mask |= 1 << c
+    return mask
+
+
+class Constraints:
+    """
+    Accumulated per-position letter masks and letter-count bounds.
+    """
+
+    def __init__(self, length=WORD_LENGTH):
+        """
+        Args:
+            length (int): Word length.
+        """
+        self.length = length
+        self.allowed = [ALL_LETTERS] * length
+        self.min_counts = [0] * 26
+        self.max_counts = [length] * 26
+        self.greens = [None] * length  # Letter code fixed at each position, if known
+        self.required = 0               # Mask of letters known to be in the answer
+        self.green_mask = 0             # Packed-word bits covering green positions
+        self.green_value = 0            # Packed green letters under green_mask
+        self._bounded = []              # Letters with a non-trivial count bound
+        self._repeated = []             # Letters known to appear more than once
+
+    def apply(self, guess, pattern):
+        """
+        Fold the feedback for one guess into the constraints.
+
+        Args:
+            guess (str): Guessed word.
+            pattern (int): Its base-3 feedback pattern.
+        """
+        codes = prepare(guess)[0]
+        found = [0] * 26  # Green + yellow occurrences of each letter
+        grayed = 0        # Letters with at least one gray tile
+
+        for i, (c, digit) in enumerate(zip(codes, decode(pattern, self.length))):
+            bit = 1 << c
+            if digit == CORRECT:
+                self.allowed[i] = bit
+                self.greens[i] = c
+                shift = (self.length - 1 - i) * BITS_PER_LETTER
+                self.green_mask |= _LETTER_FIELD << shift
+                self.green_value |= c << shift
+                found[c] += 1
+            else:
+                self.allowed[i] &= ~bit
+                if digit == PRESENT:
+                    found[c] += 1
+                else:
+                    grayed |= bit
+
+        for c in set(codes):
+            if found[c] > self.min_counts[c]:
+                self.min_counts[c] = found[c]
+            if grayed >> c & 1 and found[c] < self.max_counts[c]:
+                # A gray tile means the answer has no copies beyond those found
+                self.max_counts[c] = found[c]
+                if found[c] == 0:
+                    for i in range(self.length):
+                        self.allowed[i] &= ~(1 << c)
+            if self.min_counts[c]:
+                self.required |= 1 << c
+
+        self._bounded = [c for c in range(26)
+                         if self.min_counts[c] or self.max_counts[c] < self.length]
+        self._repeated = [c for c in self._bounded if self.min_counts[c] > 1]
+
+    def is_consistent(self, word):
+        """
+        Return True if word could still be the answer.
+
+        Args:
+            word (str): Lowercase word.
+        """
+        if len(word) != self.length or not (word.isascii() and word.isalpha() and word.islower()):
+            return False
+        codes, counts = prepare(word)
+        allowed = self.allowed
+        for i, c in enumerate(codes):
+            if not allowed[i] >> c & 1:
+                return False
+        for c in self._bounded:
+            if not self.min_counts[c] <= counts[c] <= self.max_counts[c]:
+                return False
+        return True
+
+    # ----------------------------
+    # Hard mode
+    # ----------------------------
+    def satisfies_hard_mode(self, word):
+        """
+        Return True if word keeps every green in place and uses every
+        revealed letter (as many times as it has been revealed).
+
+        Args:
+            word (str): Lowercase a-z word of the right length.
+        """
+        if pack(word) & self.green_mask != self.green_value:
+            return False
+        if letter_mask(word) & self.required != self.required:
+            return False
+        if self._repeated:
+            counts = prepare(word)[1]
+            return all(counts[c] >= self.min_counts[c] for c in self._repeated)
+        return True
+
+    def hard_mode_error(self, word):
+        """
+        Explain why word breaks hard mode, or return None if it doesn't.
+
+        Args:
+            word (str): Lowercase a-z word of the right length.
+
+        Returns:
+            str | None: Message such as "2nd letter must be R".
+        """
+        if self.satisfies_hard_mode(word):
+            return None
+        codes, counts = prepare(word)
+        for i, c in enumerate(self.greens):
+            if c is not None and codes[i] != c:
+                return f"{_ORDINALS[i]} letter must be {chr(65 + c)}"
+        for c in range(26):
+            if counts[c] < self.min_counts[c]:
+                if self.min_counts[c] > 1:
+                    return f"Guess must contain {chr(65 + c)} {self.min_counts[c]} times"
+                return f"Guess must contain {chr(65 + c)}"
+        return None
+
+
+class CandidateSet:
+    """
+    The words that are still possible, narrowed incrementally.
+    """
+
+    def __init__(self, words, length=WORD_LENGTH):
+        """
+        Args:
+            words (Sequence[str]): Possible answers. Not copied until the
+                first guess narrows them.
+            length (int): Word length.
+        """
+        self.constraints = Constraints(length)
+        self._words = words
+
+    def update(self, guess, pattern):
+        """
+        Apply one guess's feedback and drop the words it rules out.
+
+        Args:
+            guess (str): Guessed word.
+            pattern (int): Its base-3 feedback pattern.
+        """
+        self.constraints.apply(guess, pattern)
+        is_consistent = self.constraints.is_consistent
+        self._words = [w for w in self._words if is_consistent(w)]
+
+    def is_consistent(self, word):
+        """Return True if word fits every guess so far."""
+        return self.constraints.is_consistent(word)
+
+    def remaining(self):
+        """Return the words still possible."""
+        return self._words
+
+    def __len__(self):
+        return len(self._words)
@@ -0,0 +1,292 @@
+"""
+Wordle Difficulty Index
+Author: Jace
+
+Description:
+Rates every answer by how many guesses a reference player needs to solve
+it, so games can be drawn from an easy, medium or hard tier instead of
+uniformly.
+
+The reference player is deterministic and uses only the shared feedback
+logic: it opens with one of a few fixed openers (the words whose distinct
+letters are most common across the list), then always guesses the
+remaining candidate with the most common letters among the candidates,
+narrowing with CandidateSet after each guess. A word's rating is its
+mean solve length over those openers.
+
+Ratings are cached on disk together with the openers they were made
+with, one small binary file per word length and opener set:
+
+    header | openers (packed words) | rated words (packed) | ratings (f32)
+
+When the word list grows, the cached index sharing the most words with
+it is reused: only the new words are simulated, against the current list
+and the saved openers, and existing ratings are kept. Tiers are thirds
+of the current list sorted by rating, built once per list and held in
+memory, so drawing a target is a single random choice.
+
+Usage:
+    python -m wordle_core.difficulty words.txt          # offline rebuild
+    index = get_difficulty_index(words)
+    index.choice("hard")
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import random
+import struct
+import sys
+from array import array
+from collections import Counter
+
+from wordle_core.constraints import CandidateSet
+from wordle_core.packed import pack, unpack
+from wordle_core.scoring import WORD_LENGTH, all_correct, score
+from wordle_core.words import DEFAULT_CACHE_DIR, as_word_list, load_word_list
+
+TIERS = ("easy", "medium", "hard")
+OPENERS = 4  # Openers averaged over per rating
+
+INDEX_MAGIC = b"WDIF"
+INDEX_VERSION = 1
+# magic, version, word length, opener count, rated word count
+_HEADER = struct.Struct("<4sHHHI")
+
+_INDEXES = {}
+
+
+class DifficultyIndex:
+    """
+    Ratings and easy/medium/hard tiers for one word list.
+    """
+
+    def __init__(self, words, ratings):
+        """
+        Args:
+            words (Sequence[str]): The word list the tiers are drawn from.
+            ratings (dict): Mean solve length per word; must cover words.
+        """
+        ranked = sorted(dict.fromkeys(words), key=lambda word: (ratings[word], word))
+        cuts = [len(ranked) * i // len(TIERS) for i in range(len(TIERS) + 1)]
+        self.words = tuple(ranked)
+        self.ratings = {word: ratings[word] for word in ranked}
+        self.tiers = {name: tuple(ranked[cuts[i]:cuts[i + 1]]) for i, name in enumerate(TIERS)}
+        self._tier_of = {word: name for name, tier in self.tiers.items() for word in tier}
+
+    def tier(self, name):
+        """
+        Return the words in a tier.
+
+        Raises:
+            ValueError: If name is not one of TIERS.
+        """
+        if name not in self.tiers:
+            raise ValueError(f"difficulty must be one of {', '.join(TIERS)}")
+        return self.tiers[name]
+
+    def tier_of(self, word):
+        """Return the tier a word is in, or None if it is not in the list."""
+        return self._tier_of.get(word)
+
+    def choice(self, name, rng=random):
+        """
+        Draw a target from a tier in O(1). Lists too short to fill every
+        tier (fewer than len(TIERS) words) draw from the whole list.
+
+        Raises:
+            ValueError: If name is not one of TIERS, or the list is empty.
+        """
+        words = self.tier(name) or self.words
+        if not words:
+            raise ValueError("no words to draw a target from")
+        return rng.choice(words)
+
+    def __repr__(self):
+        sizes = ", ".join(f"{name}={len(words)}" for name, words in self.tiers.items())
+        return f"DifficultyIndex({sizes})"
+
+
+# ----------------------------
+# Reference player
+# ----------------------------
+def letter_score(words):
+    """Return a key that ranks words by how common their distinct letters are."""
+    freq = Counter(ch for word in words for ch in set(word))
+    return lambda word: (sum(freq[ch] for ch in set(word)), word)
+
+
+def pick_openers(words, count=OPENERS):
+    """Return the count words with the most common distinct letters."""
+    return sorted(words, key=letter_score(words), reverse=True)[:count]
+
+
+def solve_length(answer, opener, words, length=WORD_LENGTH):
+    """
+    Guesses the reference player needs to find answer after opening with opener.
+
+    Args:
+        answer (str): Target word.
+        opener (str): First guess.
+        words (Sequence[str]): Possible answers (and guesses).
+        length (int): Word length.
+
+    Returns:
+        int: Number of guesses, including the winning one.
+    """
+    solved = all_correct(length)
+    candidates = CandidateSet(words, length)
+    guess, turns = opener, 1
+    while True:
+        pattern = score(guess, answer)
+        if pattern == solved:
+            return turns
+        candidates.update(guess, pattern)
+        remaining = candidates.remaining()
+        guess = max(remaining, key=letter_score(remaining))
+        turns += 1
+
+
+def rate_words(answers, words, openers, length=WORD_LENGTH):
+    """
+    Rate answers by mean solve length over the openers.
+
+    Returns:
+        dict: word -> rating.
+    """
+    return {answer: sum(solve_length(answer, opener, words, length) for opener in openers)
+            / len(openers)
+            for answer in answers}
+
+
+# ----------------------------
+# Disk cache
+# ----------------------------
+def _cache_path(length, openers, cache_dir):
+    digest = hashlib.sha256("\n".join(openers).encode("ascii")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"difficulty-v{INDEX_VERSION}-{length}-{digest}.bin")
+
+
+def _find_index(words, length, cache_dir):
+    """
+    Return (openers, ratings) of the cached index sharing the most words
+    with words and whose openers are all still in it, or None.
+    """
+    pattern = os.path.join(glob.escape(cache_dir), f"difficulty-v{INDEX_VERSION}-{length}-*.bin")
+    best, best_overlap = None, 0
+    for path in glob.glob(pattern):
+        cached = _read_index(path, length)
+        if cached is None or not all(opener in words for opener in cached[0]):
+            continue
+        overlap = sum(1 for word in cached[1] if word in words)
+        if overlap > best_overlap:
+            best, best_overlap = cached, overlap
+    return best
+
+
+def _codes(words, length):
+    """Packed words as an array wide enough for the length."""
+    return array("I" if length <= 6 else "Q", (pack(word) for word in words))
+
+
+def _read_index(path, length):
+    """
+    Return (openers, ratings) from a cached index, or None if missing or invalid.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, version, word_length, opener_count, count = _HEADER.unpack(header)
+            if (magic, version, word_length) != (INDEX_MAGIC, INDEX_VERSION, length):
+                return None
+            codes = _codes((), length)
+            codes.frombytes(f.read((opener_count + count) * codes.itemsize))
+            ratings = array("f")
+            ratings.frombytes(f.read())
+    except (OSError, ValueError):
+        return None
+    if len(codes) != opener_count + count or len(ratings) != count:
+        return None
+    if sys.byteorder == "big":
+        codes.byteswap()
+        ratings.byteswap()
+    words = [unpack(code, length) for code in codes]
+    return words[:opener_count], dict(zip(words[opener_count:], ratings))
+
+
+def _write_index(path, length, openers, ratings):
+    """Write the index atomically; failures only cost a re-rating next time."""
+    codes = _codes(list(openers) + list(ratings), length)
+    values = array("f", ratings.values())
+    if sys.byteorder == "big":
+        codes.byteswap()
+        values.byteswap()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, length, len(openers), len(ratings)))
+            f.write(codes.tobytes())
+            f.write(values.tobytes())
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def get_difficulty_index(words, length=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Return the difficulty index for a word list, from memory, disk or built.
+    Only words without a cached rating are simulated.
+
+    Args:
+        words (Sequence[str]): Possible answers.
+        length (int, optional): Word length. Defaults to the list's length.
+        cache_dir (str, optional): Cache directory; None disables the disk cache.
+
+    Returns:
+        DifficultyIndex: Ratings and tiers for words.
+    """
+    length = length or getattr(words, "length", WORD_LENGTH)
+    words = as_word_list(words, length)
+    digest = hashlib.sha256("\n".join(sorted(words)).encode("ascii")).digest()
+    index = _INDEXES.get(digest)
+    if index is not None:
+        return index
+
+    cached = _find_index(words, length, cache_dir) if cache_dir else None
+    # Without a matching index, ratings start over with openers for this list
+    openers, ratings = cached if cached else (pick_openers(list(words)), {})
+    missing = [word for word in words if word not in ratings]
+    if missing:
+        ratings.update(rate_words(missing, words, openers, length))
+        if cache_dir:
+            _write_index(_cache_path(length, openers, cache_dir), length, openers, ratings)
+    index = _INDEXES[digest] = DifficultyIndex(words, ratings)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate answers by difficulty and cache the index.")
+    parser.add_argument("words", nargs="?", help="word file (default: the dictionary shard)")
+    parser.add_argument("--length", type=int, default=WORD_LENGTH, help="letters per word")
+    args = parser.parse_args()
+
+    if args.words:
+        words = load_word_list(args.words, args.length)
+    else:
+        from wordle_core.words import load_shard
+        words = load_shard(args.length)
+    index = get_difficulty_index(words, args.length)
+    print(f"{len(words)} words rated into {DEFAULT_CACHE_DIR}")
+    for name in TIERS:
+        tier = index.tier(name)
+        if tier:
+            print(f"{name:<7} {len(tier):6} words, {index.ratings[tier[0]]:.2f}-"
+                  f"{index.ratings[tier[-1]]:.2f} guesses, e.g. {', '.join(tier[:5])}")
+
+
+if __name__ == "__main__":
+    main()
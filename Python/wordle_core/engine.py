@@ -0,0 +1,167 @@
+"""
+Wordle Session Engine
+Author: Jace
+
+Description:
+I/O-free Wordle rules for hosting many games at once. The console and GUI
+games own one game each and talk to input()/print() or Tk; the engine
+only takes words and returns patterns, so any front end (a socket server,
+a web handler, a bot) can drive thousands of sessions through it.
+
+One GameEngine holds the shared, read-only data (word list, dictionary);
+each Session is a small __slots__ object holding only integers:
+
+    target    index of the answer in the engine's word list
+    attempts  guesses used so far
+    history   every guess and its feedback packed into one int; for
+              5 letters 33 bits per turn: 25-bit packed word << 8 | 8-bit
+              pattern (the field widths grow with the word length)
+    state     PLAYING, WON or LOST
+
+Guesses are scored by the same wordle_core.scoring engine as both games.
+"""
+
+import random
+
+from wordle_core.packed import BITS_PER_LETTER, pack, unpack
+from wordle_core.scoring import WORD_LENGTH, all_correct, score
+from wordle_core.schedule import get_schedule
+from wordle_core.words import as_word_list, is_valid_word
+
+PLAYING, WON, LOST = 0, 1, 2
+
+
+class InvalidGuess(ValueError):
+    """A guess the rules do not accept; the message says why."""
+
+
+class Session:
+    """
+    State of one game, integers only.
+    """
+
+    __slots__ = ("target", "attempts", "history", "state")
+
+    def __init__(self, target):
+        self.target = target
+        self.attempts = 0
+        self.history = 0
+        self.state = PLAYING
+
+
+class GameEngine:
+    """
+    Shared rules and word data for any number of sessions.
+    """
+
+    def __init__(self, word_list, dictionary=None, max_attempts=6, length=WORD_LENGTH):
+        """
+        Args:
+            word_list (Sequence[str]): Possible answers.
+            dictionary (Sequence[str], optional): Accepted guesses. Without one,
+                any word of length letters a-z is accepted.
+            max_attempts (int): Guesses per game.
+            length (int): Word length.
+        """
+        self.length = length
+        self.word_list = as_word_list(word_list, length)
+        self.dictionary = as_word_list(dictionary, length) if dictionary else None
+        self.max_attempts = max_attempts
+        self._index = None  # word -> index in word_list, built for puzzle games
+        self._schedule = None  # Puzzle schedule, built on the first puzzle game
+        # History field widths for this length
+        self._solved = all_correct(length)
+        self._pattern_bits = self._solved.bit_length()
+        self._turn_bits = length * BITS_PER_LETTER + self._pattern_bits
+
+    # ----------------------------
+    # Sessions
+    # ----------------------------
+    def new_session(self, rng=random, puzzle=None):
+        """
+        Start a game.
+
+        Args:
+            rng (random.Random): Source of the random target.
+            puzzle (int, optional): Play puzzle #N from the shared schedule instead.
+
+        Returns:
+            Session: The new game.
+        """
+        if puzzle is None:
+            return Session(rng.randrange(len(self.word_list)))
+        if self._index is None:
+            self._index = {word: i for i, word in enumerate(self.word_list)}
+        return Session(self._index[self.schedule().answer(puzzle)])
+
+    def schedule(self):
+        """Return the puzzle schedule for this engine's word list, built once."""
+        if self._schedule is None:
+            self._schedule = get_schedule(self.word_list)
+        return self._schedule
+
+    def target(self, session):
+        """Return the session's answer."""
+        return self.word_list[session.target]
+
+    def guess(self, session, word):
+        """
+        Play one guess.
+
+        Args:
+            session (Session): Game to play in.
+            word (str): Lowercase guess.
+
+        Returns:
+            int: Base-3 feedback pattern.
+
+        Raises:
+            InvalidGuess: If the game is over or the word is not allowed.
+        """
+        if session.state != PLAYING:
+            raise InvalidGuess("game is over")
+        if not is_valid_word(word, self.length):
+            raise InvalidGuess(f"enter exactly {self.length} letters")
+        if self.dictionary is not None and word not in self.dictionary:
+            raise InvalidGuess("not in word list")
+        code = pack(word)
+        if self._guessed(session, code):
+            raise InvalidGuess("already guessed")
+
+        pattern = score(word, self.word_list[session.target])
+        session.history |= ((code << self._pattern_bits) | pattern) << (
+            self._turn_bits * session.attempts)
+        session.attempts += 1
+        if pattern == self._solved:
+            session.state = WON
+        elif session.attempts >= self.max_attempts:
+            session.state = LOST
+        return pattern
+
+    def _guessed(self, session, code):
+        """Return True if the packed word was already guessed this game."""
+        history = session.history
+        turn_bits, pattern_bits = self._turn_bits, self._pattern_bits
+        turn_mask = (1 << turn_bits) - 1
+        for _ in range(session.attempts):
+            if (history & turn_mask) >> pattern_bits == code:
+                return True
+            history >>= turn_bits
+        return False
+
+    def history(self, session):
+        """
+        Decode a session's guesses.
+
+        Returns:
+            list[tuple]: (word, pattern) per turn, oldest first.
+        """
+        turns = []
+        history = session.history
+        turn_bits, pattern_bits = self._turn_bits, self._pattern_bits
+        turn_mask, pattern_mask = (1 << turn_bits) - 1, (1 << pattern_bits) - 1
+        for _ in range(session.attempts):
+            turn = history & turn_mask
+            turns.append((unpack(turn >> pattern_bits, self.length), turn & pattern_mask))
+            history >>= turn_bits
+        return turns
@@ -0,0 +1,115 @@
+"""
+Packed Word Store
+Author: Jace
+
+Description:
+Compact storage for large dictionaries. Each word is packed into one
+integer, 5 bits per letter with the first letter in the highest bits, so
+numeric order matches alphabetical order. Codes are kept sorted in an
+array('I') (array('Q') for words longer than 6 letters):
+
+    5-letter word: 4 bytes, vs. roughly 60 bytes for a str in a list
+
+Membership is a binary search over the sorted codes and words are decoded
+on access, so the store can be handed to the games wherever a word list
+is expected: random.choice() and "guess in dictionary" both work on it.
+
+Usage:
+    store = PackedWordStore.from_file("words.txt")
+    game = Wordle(store)
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+WORD_LENGTH = 5
+BITS_PER_LETTER = 5
+_MASK = (1 << BITS_PER_LETTER) - 1
+
+
+def pack(word):
+    """
+    Pack a lowercase a-z word into an integer.
+
+    Raises:
+        ValueError: If the word contains anything other than a-z.
+    """
+    code = 0
+    for ch in word:
+        value = ord(ch) - 97
+        if not 0 <= value < 26:
+            raise ValueError(f"not a lowercase a-z word: {word!r}")
+        code = (code << BITS_PER_LETTER) | value
+    return code
+
+
+def unpack(code, length=WORD_LENGTH):
+    """Decode an integer produced by pack() back into a word."""
+    letters = []
+    for _ in range(length):
+        letters.append(chr(97 + (code & _MASK)))
+        code >>= BITS_PER_LETTER
+    return "".join(reversed(letters))
+
+
+class PackedWordStore(Sequence):
+    """
+    Sorted, deduplicated words packed one per array slot.
+    """
+
+    def __init__(self, words=(), length=WORD_LENGTH):
+        """
+        Args:
+            words (iterable): Words to store; invalid entries are skipped.
+            length (int): Required word length.
+        """
+        self.length = length
+        codes = set()
+        for word in words:
+            word = word.strip().lower()
+            if len(word) != length:
+                continue
+            try:
+                codes.add(pack(word))
+            except ValueError:
+                continue
+        self._codes = array("I" if length * BITS_PER_LETTER <= 32 else "Q", sorted(codes))
+
+    @classmethod
+    def from_file(cls, filename, length=WORD_LENGTH):
+        """
+        Build a store from a word file without keeping the str list around.
+        """
+        with open(filename, "r") as f:
+            return cls(f, length)
+
+    def __contains__(self, word):
+        if len(word) != self.length:
+            return False
+        try:
+            code = pack(word)
+        except ValueError:
+            return False
+        i = bisect_left(self._codes, code)
+        return i < len(self._codes) and self._codes[i] == code
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [unpack(code, self.length) for code in self._codes[index]]
+        return unpack(self._codes[index], self.length)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        length = self.length
+        return (unpack(code, length) for code in self._codes)
+
+    @property
+    def nbytes(self):
+        """Bytes used by the packed codes."""
+        return len(self._codes) * self._codes.itemsize
+
+    def __repr__(self):
+        return f"PackedWordStore({len(self)} words, length={self.length}, {self.nbytes} bytes)"
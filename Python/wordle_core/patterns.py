@@ -0,0 +1,226 @@
+"""
+Wordle Pattern Matrix
+Author: Jace
+
+Description:
+Builds the feedback pattern for every (guess, answer) pair as a NumPy
+matrix, using the same base-3 encoding as wordle_core.scoring. Up to 5
+letters every pattern fits in uint8; longer words (3**6 = 729 patterns
+and up) use uint16. The matrix is built with vectorised array operations
+over chunks of guesses, then cached on disk in a small versioned binary
+format:
+
+    64-byte header | guess_count x answer_count patterns (row-major)
+
+The header stores a SHA-256 of the word lists, and cache files are named
+after that hash, so a changed word list never loads a stale matrix.
+Cached matrices are reopened with numpy.memmap: the OS page cache holds
+one shared copy for every process that loads the same file.
+
+Usage:
+    python -m wordle_core.patterns words.txt [answers.txt]
+"""
+
+import hashlib
+import os
+import struct
+import sys
+
+import numpy as np
+
+from wordle_core.scoring import MAX_WORD_LENGTH, MIN_WORD_LENGTH, WORD_LENGTH
+from wordle_core.words import load_word_list
+
+MAGIC = b"WPAT"
+FORMAT_VERSION = 1
+HEADER_SIZE = 64
+# magic, format version, word length, guess count, answer count, word-list digest
+_HEADER = struct.Struct("<4sHHII32s")
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
+
+# ----------------------------
+# Encoding helpers
+# ----------------------------
+def pattern_dtype(length=WORD_LENGTH):
+    """Return the smallest unsigned dtype that holds every pattern for a length."""
+    return np.uint8 if 3 ** length <= 256 else np.uint16
+
+
+def encode_words(words, length=WORD_LENGTH):
+    """
+    Convert words to an (n, length) uint8 array of letter codes (a=0 ... z=25).
+    The length is taken from the words; it only matters when words is empty.
+    """
+    if not words:
+        return np.zeros((0, length), dtype=np.uint8)
+    raw = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (raw.reshape(len(words), -1) - ord("a")).astype(np.uint8)
+
+
+def word_list_key(guesses, answers):
+    """
+    Hash the guess and answer lists (order matters) into a 32-byte digest.
+    """
+    h = hashlib.sha256()
+    h.update("\n".join(guesses).encode("ascii"))
+    h.update(b"\0")
+    h.update("\n".join(answers).encode("ascii"))
+    return h.digest()
+
+
+# ----------------------------
+# Matrix builder
+# ----------------------------
+def score_codes(guess_codes, answer_codes):
+    """
+    Vectorised scoring of every guess against every answer.
+
+    Args:
+        guess_codes (np.ndarray): (g, length) letter codes.
+        answer_codes (np.ndarray): (a, length) letter codes.
+
+    Returns:
+        np.ndarray: (g, a) patterns, dtype from pattern_dtype(length).
+    """
+    length = guess_codes.shape[1]
+    G = guess_codes[:, None, :]          # (g, 1, L)
+    A = answer_codes[None, :, :]         # (1, a, L)
+    green = G == A                       # (g, a, L)
+    pattern = np.zeros(green.shape[:2], dtype=np.uint16)
+    yellows = []
+
+    for i in range(length):
+        pattern += green[:, :, i] * np.uint16(2 * 3 ** i)
+
+    for i in range(length):
+        letter = guess_codes[:, i][:, None, None]               # (g, 1, 1)
+        # Copies of this letter in the answer not already used by a green
+        available = ((A == letter) & ~green).sum(axis=2)         # (g, a)
+        # Copies already claimed by earlier yellows of the same letter
+        used = np.zeros_like(available)
+        for k in range(i):
+            same = (guess_codes[:, k] == guess_codes[:, i])[:, None]
+            used += yellows[k] & same
+        yellow = ~green[:, :, i] & (available > used)
+        yellows.append(yellow)
+        pattern += yellow * np.uint16(3 ** i)
+
+    return pattern.astype(pattern_dtype(length), copy=False)
+
+
+def build_pattern_matrix(guesses, answers=None, chunk_size=256):
+    """
+    Compute the full guess x answer pattern matrix.
+
+    Args:
+        guesses (list[str]): Allowed guesses.
+        answers (list[str], optional): Possible answers. Defaults to guesses.
+        chunk_size (int): Guesses scored per vectorised step; bounds memory.
+
+    Returns:
+        np.ndarray: (len(guesses), len(answers)) pattern matrix.
+    """
+    answers = guesses if answers is None else answers
+    guess_codes = encode_words(guesses)
+    answer_codes = encode_words(answers, guess_codes.shape[1])
+    dtype = pattern_dtype(guess_codes.shape[1])
+    matrix = np.empty((len(guesses), len(answers)), dtype=dtype)
+    for start in range(0, len(guesses), chunk_size):
+        stop = start + chunk_size
+        matrix[start:stop] = score_codes(guess_codes[start:stop], answer_codes)
+    return matrix
+
+
+# ----------------------------
+# On-disk cache
+# ----------------------------
+def save_pattern_matrix(path, matrix, key, length=WORD_LENGTH):
+    """
+    Write a matrix in the versioned binary format (little-endian).
+    The file is written under a temporary name and renamed into place,
+    so readers never see a half-written cache.
+    """
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, length,
+                          matrix.shape[0], matrix.shape[1], key)
+    dtype = np.dtype(pattern_dtype(length)).newbyteorder("<")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(np.ascontiguousarray(matrix, dtype=dtype).tobytes())
+    os.replace(tmp_path, path)
+
+
+def load_pattern_matrix(path, key=None):
+    """
+    Memory-map a cached matrix read-only.
+
+    Args:
+        path (str): Cache file.
+        key (bytes, optional): Expected word-list digest.
+
+    Returns:
+        np.memmap: (guesses, answers) pattern matrix.
+
+    Raises:
+        ValueError: If the file is not a compatible pattern cache.
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path}: truncated pattern cache")
+    magic, version, length, rows, cols, digest = _HEADER.unpack_from(header)
+    if (magic != MAGIC or version != FORMAT_VERSION
+            or not MIN_WORD_LENGTH <= length <= MAX_WORD_LENGTH):
+        raise ValueError(f"{path}: unsupported pattern cache format")
+    if key is not None and digest != key:
+        raise ValueError(f"{path}: pattern cache built from a different word list")
+    dtype = np.dtype(pattern_dtype(length)).newbyteorder("<")
+    if os.path.getsize(path) != HEADER_SIZE + rows * cols * dtype.itemsize:
+        raise ValueError(f"{path}: truncated pattern cache")
+    if rows * cols == 0:
+        return np.zeros((rows, cols), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(rows, cols))
+
+
+def cache_path(key, cache_dir=DEFAULT_CACHE_DIR):
+    """Return the cache file path for a word-list digest."""
+    return os.path.join(cache_dir, f"patterns-v{FORMAT_VERSION}-{key.hex()[:16]}.bin")
+
+
+def get_pattern_matrix(guesses, answers=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Load the pattern matrix from cache, building and saving it on a miss.
+
+    Args:
+        guesses (list[str]): Allowed guesses.
+        answers (list[str], optional): Possible answers. Defaults to guesses.
+        cache_dir (str): Directory for cache files.
+
+    Returns:
+        np.ndarray: (guesses, answers) matrix (memory-mapped when cached).
+    """
+    answers = guesses if answers is None else answers
+    key = word_list_key(guesses, answers)
+    path = cache_path(key, cache_dir)
+    try:
+        return load_pattern_matrix(path, key)
+    except (OSError, ValueError):
+        pass  # Missing or stale cache: rebuild below
+
+    matrix = build_pattern_matrix(guesses, answers)
+    os.makedirs(cache_dir, exist_ok=True)
+    length = len(guesses[0]) if len(guesses) else WORD_LENGTH
+    save_pattern_matrix(path, matrix, key, length)
+    return load_pattern_matrix(path, key)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        sys.exit("usage: python -m wordle_core.patterns GUESSES.txt [ANSWERS.txt]")
+    guess_words = load_word_list(sys.argv[1])
+    answer_words = load_word_list(sys.argv[2]) if len(sys.argv) == 3 else guess_words
+    patterns = get_pattern_matrix(guess_words, answer_words)
+    print(f"{patterns.shape[0]} x {patterns.shape[1]} patterns -> "
+          f"{cache_path(word_list_key(guess_words, answer_words))}")
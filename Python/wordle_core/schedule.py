@@ -0,0 +1,179 @@
+"""
+Wordle Puzzle Schedule
+Author: Jace
+
+Description:
+Deterministic "puzzle #N" answers, so every instance of the games serves
+the same daily puzzle without talking to each other.
+
+The schedule is the word list shuffled by a keyed permutation: words are
+ordered by HMAC-SHA256(key, word). Anyone with the same key and word list
+gets the same order, and without the key the order cannot be predicted
+from the (public) word list. The key comes from the WORDLE_SCHEDULE_KEY
+environment variable; without it a built-in public key is used, which
+keeps games reproducible but lets anyone with the source work out
+future answers.
+
+The permutation is built once per (key, word list), cached on disk as a
+header plus an array of uint32 indices into the sorted word list, and
+held in memory, so answer(n) is a single index lookup. Puzzle numbers
+count days from EPOCH; the schedule wraps around once every word has
+been used.
+
+Usage:
+    schedule = get_schedule(words)
+    schedule.answer(puzzle_number())   # today's answer
+"""
+
+import hashlib
+import hmac
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import date
+
+from wordle_core.words import DEFAULT_CACHE_DIR
+
+EPOCH = date(2026, 1, 14)  # Puzzle #0
+KEY_ENV = "WORDLE_SCHEDULE_KEY"
+_PUBLIC_KEY = b"wordle-public-schedule"
+
+SCHEDULE_MAGIC = b"WSCH"
+SCHEDULE_VERSION = 1
+# magic, version, word count, HMAC of the sorted word list
+_HEADER = struct.Struct("<4sHI32s")
+
+_SCHEDULES = {}
+
+
+class Schedule(Sequence):
+    """
+    Keyed shuffle of a word list; schedule[n] is the answer to puzzle #n.
+    """
+
+    def __init__(self, words, order):
+        """
+        Args:
+            words (list[str]): Sorted, unique words.
+            order (array): Indices into words, in puzzle order.
+        """
+        self.words = words
+        self.order = order
+
+    def answer(self, number):
+        """Return the answer to puzzle #number (wrapping past the end)."""
+        return self.words[self.order[number % len(self.order)]]
+
+    def __getitem__(self, number):
+        return self.answer(number)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __repr__(self):
+        return f"Schedule({len(self)} puzzles)"
+
+
+def puzzle_number(day=None):
+    """
+    Return the puzzle number for a date (default: today, local time).
+    """
+    return ((day or date.today()) - EPOCH).days
+
+
+def schedule_key(key=None):
+    """Return the HMAC key as bytes: the argument, the environment, or the public key."""
+    key = key if key is not None else os.environ.get(KEY_ENV)
+    if key is None:
+        return _PUBLIC_KEY
+    return key.encode("utf-8") if isinstance(key, str) else key
+
+
+def build_order(words, key):
+    """
+    Order indices of words by HMAC-SHA256(key, word).
+
+    Args:
+        words (list[str]): Sorted, unique words.
+        key (bytes): HMAC key.
+
+    Returns:
+        array: uint32 indices in puzzle order.
+    """
+    digests = [hmac.new(key, word.encode("ascii"), hashlib.sha256).digest() for word in words]
+    return array("I", sorted(range(len(words)), key=digests.__getitem__))
+
+
+# ----------------------------
+# Disk cache
+# ----------------------------
+def _cache_path(digest, cache_dir):
+    return os.path.join(cache_dir, f"schedule-{digest[:8].hex()}.bin")
+
+
+def _read_schedule(path, digest, count):
+    """Return the cached order, or None if missing or for other words/key."""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            if _HEADER.unpack(header) != (SCHEDULE_MAGIC, SCHEDULE_VERSION, count, digest):
+                return None
+            order = array("I")
+            order.frombytes(f.read())
+    except (OSError, ValueError):
+        return None
+    if len(order) != count:
+        return None
+    if sys.byteorder == "big":
+        order.byteswap()
+    return order
+
+
+def _write_schedule(path, digest, order):
+    """Write the order atomically; failures only cost a rebuild next time."""
+    data = array("I", order)
+    if sys.byteorder == "big":
+        data.byteswap()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(SCHEDULE_MAGIC, SCHEDULE_VERSION, len(order), digest))
+            f.write(data.tobytes())
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def get_schedule(words, key=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Return the puzzle schedule for a word list, from memory, disk or built.
+
+    Args:
+        words (iterable): Possible answers; order and duplicates don't matter.
+        key (str | bytes, optional): HMAC key. Defaults to WORDLE_SCHEDULE_KEY.
+        cache_dir (str, optional): Cache directory; None disables the disk cache.
+
+    Returns:
+        Schedule: The shared schedule.
+    """
+    key = schedule_key(key)
+    words = sorted(set(words))
+    # The digest covers key and words; it names the cache without revealing the key
+    digest = hmac.new(key, "\n".join(words).encode("ascii"), hashlib.sha256).digest()
+    schedule = _SCHEDULES.get(digest)
+    if schedule is not None:
+        return schedule
+
+    path = _cache_path(digest, cache_dir) if cache_dir else None
+    order = _read_schedule(path, digest, len(words)) if path else None
+    if order is None:
+        order = build_order(words, key)
+        if path:
+            _write_schedule(path, digest, order)
+    schedule = _SCHEDULES[digest] = Schedule(words, order)
+    return schedule
@@ -0,0 +1,146 @@
+"""
+Wordle Feedback Scoring
+Author: Jace
+
+Description:
+One feedback engine shared by the console and GUI Wordle games.
+
+Feedback is encoded as a single integer in base 3, one digit per letter
+position (position 0 is the least significant digit):
+    0 = absent, 1 = present (wrong spot), 2 = correct
+For 5-letter words every pattern fits in 0-242, with 242 meaning solved;
+in general a length-L word has 3**L patterns and 3**L - 1 means solved.
+Any length from MIN_WORD_LENGTH to MAX_WORD_LENGTH is supported.
+
+Each word is prepared once into a tuple of letter codes and a 26-slot
+letter-count vector, so scoring a pair is two short passes over small
+tuples with no string searching. The console's list of strings and the
+GUI's emoji string are thin adapters over the integer pattern.
+"""
+
+from functools import lru_cache
+
+ABSENT, PRESENT, CORRECT = 0, 1, 2
+WORD_LENGTH = 5  # The classic game
+MIN_WORD_LENGTH, MAX_WORD_LENGTH = 4, 8
+NUM_PATTERNS = 3 ** WORD_LENGTH
+ALL_CORRECT = NUM_PATTERNS - 1
+
+_POWERS = tuple(3 ** i for i in range(MAX_WORD_LENGTH))
+_LABELS = ("absent", "present", "correct")
+_EMOJI = ("⬜", "🟨", "🟩")
+
+
+# ----------------------------
+# Word preparation
+# ----------------------------
+@lru_cache(maxsize=1 << 18)  # Bounded: guesses can be arbitrary strings
+def prepare(word):
+    """
+    Convert a word into letter codes and letter counts.
+
+    Args:
+        word (str): Lowercase word.
+
+    Returns:
+        tuple: (codes, counts) where codes holds 0-25 per position and
+        counts is a 26-slot tuple of letter frequencies.
+    """
+    codes = tuple(ord(ch) - 97 for ch in word)
+    counts = [0] * 26
+    for c in codes:
+        counts[c] += 1
+    return codes, tuple(counts)
+
+
+# ----------------------------
+# Scoring
+# ----------------------------
+def score(guess, answer):
+    """
+    Score a guess against an answer.
+    Repeated letters are only marked present as many times as they
+    still occur in the answer after exact matches are taken out.
+
+    Args:
+        guess (str): Guessed word.
+        answer (str): Target word of the same length.
+
+    Returns:
+        int: Base-3 feedback pattern.
+    """
+    g_codes = prepare(guess)[0]
+    a_codes, a_counts = prepare(answer)
+    remaining = list(a_counts)
+    pattern = 0
+    pending = []
+
+    # First pass: exact matches
+    for i, (g, a) in enumerate(zip(g_codes, a_codes)):
+        if g == a:
+            pattern += CORRECT * _POWERS[i]
+            remaining[g] -= 1
+        else:
+            pending.append(i)
+
+    # Second pass: correct letters in wrong positions
+    for i in pending:
+        g = g_codes[i]
+        if remaining[g] > 0:
+            pattern += PRESENT * _POWERS[i]
+            remaining[g] -= 1
+
+    return pattern
+
+
+def num_patterns(length=WORD_LENGTH):
+    """Return how many feedback patterns a word of this length can get."""
+    return 3 ** length
+
+
+def all_correct(length=WORD_LENGTH):
+    """Return the pattern that marks every letter correct."""
+    return 3 ** length - 1
+
+
+def is_solved(pattern, length=WORD_LENGTH):
+    """Return True if the pattern marks every letter correct."""
+    return pattern == 3 ** length - 1
+
+
+# ----------------------------
+# Adapters
+# ----------------------------
+def decode(pattern, length=WORD_LENGTH):
+    """
+    Split a pattern into per-position digits (0 absent, 1 present, 2 correct).
+    """
+    digits = []
+    for _ in range(length):
+        pattern, digit = divmod(pattern, 3)
+        digits.append(digit)
+    return digits
+
+
+def to_feedback(pattern, length=WORD_LENGTH):
+    """
+    Convert a pattern to the console's list of "correct"/"present"/"absent".
+    """
+    return [_LABELS[d] for d in decode(pattern, length)]
+
+
+def from_feedback(feedback):
+    """
+    Convert the console's list of "correct"/"present"/"absent" back to a pattern.
+    """
+    pattern = 0
+    for i, label in enumerate(feedback):
+        pattern += _LABELS.index(label) * 3 ** i
+    return pattern
+
+
+def to_emoji(pattern, length=WORD_LENGTH):
+    """
+    Convert a pattern to the GUI's emoji string (🟩, 🟨, ⬜).
+    """
+    return "".join(_EMOJI[d] for d in decode(pattern, length))
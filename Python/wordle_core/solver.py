@@ -0,0 +1,222 @@
+"""
+Wordle Solver
+Author: Jace
+
+Description:
+Entropy-maximising hint engine built on the cached pattern matrix.
+
+For every allowed guess the solver histograms the feedback patterns it
+would produce over the remaining candidate answers and picks the guess
+with the highest expected information gain (Shannon entropy of that
+histogram). All guesses are scored at once with a single bincount over a
+slice of the pattern matrix, and after each move the candidate set is
+narrowed by one vectorised comparison on the guessed row, so later turns
+only touch the answers that are still possible.
+
+The opening move does not depend on the game, so the ranking of all
+guesses over the full answer list is computed once per word list and
+cached both in memory and next to the pattern cache. Its top entries
+double as the probe shortlist scored on later turns alongside the
+remaining candidates.
+"""
+
+import os
+
+import numpy as np
+
+from wordle_core.patterns import (
+    DEFAULT_CACHE_DIR, encode_words, get_pattern_matrix, score_codes, word_list_key
+)
+from wordle_core.scoring import NUM_PATTERNS, num_patterns
+
+_SOLVERS = {}
+_OPENINGS = {}
+
+
+class Solver:
+    """
+    Shared, read-only solver for one (guesses, answers) word list pair.
+    Per-game progress lives in SolverState objects created by new_state().
+    """
+
+    def __init__(self, guesses, answers=None, cache_dir=DEFAULT_CACHE_DIR,
+                 chunk_size=2048, shortlist_size=256):
+        """
+        Args:
+            guesses (list[str]): Words the solver may suggest.
+            answers (list[str], optional): Possible answers. Defaults to guesses.
+            cache_dir (str): Where pattern and opening caches are stored.
+            chunk_size (int): Guesses histogrammed per step; bounds memory.
+            shortlist_size (int): Strong openers kept as non-candidate probes.
+        """
+        self.guesses = list(guesses)
+        self.answers = list(guesses if answers is None else answers)
+        self.cache_dir = cache_dir
+        self.chunk_size = chunk_size
+        self.shortlist_size = shortlist_size
+        self.key = word_list_key(self.guesses, self.answers)
+        self.matrix = get_pattern_matrix(self.guesses, self.answers, cache_dir)
+        self.guess_index = {w: i for i, w in enumerate(self.guesses)}
+        # Guess row for each answer (-1 if the answer is not a valid guess),
+        # used to prefer guesses that could still win outright
+        self.answer_to_guess = np.array(
+            [self.guess_index.get(w, -1) for w in self.answers], dtype=np.int64
+        )
+        self._answer_codes = encode_words(self.answers)
+        self.length = self._answer_codes.shape[1]
+        self.num_patterns = num_patterns(self.length)
+
+    # ----------------------------
+    # Scoring
+    # ----------------------------
+    def entropies(self, candidates, guess_rows=None):
+        """
+        Expected information (bits) of guesses over the candidates.
+
+        Uses H = log2(n) - sum(c * log2(c)) / n over the pattern counts c,
+        with c * log2(c) read from a lookup table.
+
+        Args:
+            candidates (np.ndarray): Indices into self.answers.
+            guess_rows (np.ndarray, optional): Guess indices to score.
+                Defaults to every guess.
+
+        Returns:
+            np.ndarray: Entropy per scored guess.
+        """
+        if guess_rows is None:
+            guess_rows = np.arange(len(self.guesses))
+        total = len(candidates)
+        counts = np.arange(total + 1, dtype=np.float64)
+        c_log_c = counts * np.log2(np.maximum(counts, 1))
+
+        patterns = self.num_patterns
+        # Longer words have more patterns per histogram; keep each chunk's
+        # histograms the size they are for 5 letters
+        chunk_size = max(1, self.chunk_size * NUM_PATTERNS // patterns)
+        result = np.empty(len(guess_rows), dtype=np.float64)
+        for start in range(0, len(guess_rows), chunk_size):
+            rows = guess_rows[start:start + chunk_size]
+            block = self.matrix[np.ix_(rows, candidates)].astype(np.int64)
+            # One histogram per guess row via offset bincount
+            block += (np.arange(len(rows), dtype=np.int64) * patterns)[:, None]
+            hist = np.bincount(block.ravel(), minlength=len(rows) * patterns)
+            spread = c_log_c[hist].reshape(len(rows), patterns).sum(axis=1)
+            result[start:start + len(rows)] = np.log2(total) - spread / total
+        return result
+
+    def best_guess(self, candidates):
+        """
+        Pick the guess with the highest expected information gain.
+
+        After the opening, only the cached shortlist of strong openers plus
+        the remaining candidates are scored, which keeps each move to a
+        few milliseconds on large dictionaries. Ties go to guesses that are
+        themselves possible answers.
+
+        Args:
+            candidates (np.ndarray): Indices into self.answers.
+
+        Returns:
+            str: Suggested next guess.
+        """
+        if len(candidates) == 0:
+            raise ValueError("no candidate answers remain")
+        if len(candidates) <= 2:
+            return self.answers[candidates[0]]
+        if len(candidates) == len(self.answers):
+            return self.opening_guess()
+
+        playable = self.answer_to_guess[candidates]
+        playable = playable[playable >= 0]
+        rows = np.union1d(self._shortlist(), playable)
+        scores = self.entropies(candidates, rows)
+        scores[np.isin(rows, playable)] += 1e-6
+        return self.guesses[int(rows[np.argmax(scores)])]
+
+    def opening_guess(self):
+        """
+        Best first guess for this word list, cached in memory and on disk.
+        """
+        return self.guesses[self._shortlist()[0]]
+
+    def _shortlist(self):
+        """
+        Guess indices ranked by entropy over all answers, best first.
+        Computed once per word list and cached next to the pattern matrix.
+        """
+        if self.key in _OPENINGS:
+            return _OPENINGS[self.key]
+
+        path = os.path.join(self.cache_dir, f"openers-{self.key.hex()[:16]}.txt")
+        try:
+            with open(path, "r") as f:
+                rows = np.array([self.guess_index[w] for w in f.read().split()], dtype=np.int64)
+        except (OSError, KeyError):
+            rows = np.zeros(0, dtype=np.int64)
+        if len(rows) == 0:
+            scores = self.entropies(np.arange(len(self.answers)))
+            rows = np.argsort(-scores, kind="stable")[:self.shortlist_size]
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write("\n".join(self.guesses[i] for i in rows))
+            os.replace(tmp_path, path)  # Atomic, so concurrent workers never read half a file
+
+        _OPENINGS[self.key] = rows
+        return rows
+
+    def pattern_row(self, guess, candidates):
+        """
+        Patterns of a guess against the candidates.
+        Words outside the guess list are scored on the fly.
+        """
+        index = self.guess_index.get(guess)
+        if index is not None:
+            return np.asarray(self.matrix[index, candidates])
+        return score_codes(encode_words([guess], self.length),
+                           self._answer_codes[candidates])[0]
+
+    def new_state(self):
+        """Start tracking a new game."""
+        return SolverState(self)
+
+
+class SolverState:
+    """
+    Remaining candidate answers for one game, narrowed after every guess.
+    """
+
+    def __init__(self, solver):
+        self.solver = solver
+        self.candidates = np.arange(len(solver.answers))
+
+    def update(self, guess, pattern):
+        """
+        Keep only the candidates that would have produced this feedback.
+
+        Args:
+            guess (str): Word that was played.
+            pattern (int): Feedback pattern it received.
+        """
+        row = self.solver.pattern_row(guess, self.candidates)
+        self.candidates = self.candidates[row == pattern]
+
+    def hint(self):
+        """Return the best next guess."""
+        return self.solver.best_guess(self.candidates)
+
+    def remaining(self):
+        """Return the words that are still possible answers."""
+        return [self.solver.answers[i] for i in self.candidates]
+
+
+def get_solver(guesses, answers=None):
+    """
+    Return a shared Solver for the word lists, building it on first use.
+    """
+    answers = guesses if answers is None else answers
+    key = word_list_key(guesses, answers)
+    if key not in _SOLVERS:
+        _SOLVERS[key] = Solver(guesses, answers)
+    return _SOLVERS[key]
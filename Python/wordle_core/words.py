@@ -0,0 +1,288 @@
+"""
+Wordle Word Lists
+Author: Jace
+
+Description:
+Loading and validation of word lists shared by the Wordle games and tools.
+
+A word file is read and parsed in a single pass: every line is stripped
+and lowercased, entries of the wrong length or with non a-z characters
+are dropped, and duplicates are removed while keeping first-seen order. The result is a
+WordList: an ordered, indexable sequence (so random.choice works on it)
+backed by a frozenset for O(1) dictionary checks.
+
+Parsed lists are cached in a compact binary sidecar (header plus the
+newline-separated words), keyed by the source file's path, size and
+modification time, so later startups skip parsing entirely.
+
+Dictionaries for other word lengths are stored as one file per length
+(dictionary/words-<length>.txt). WordShards loads each shard on first
+use and keeps it, so supporting a length costs nothing until a game is
+played at that length.
+"""
+
+import hashlib
+import os
+import re
+import string
+import struct
+import threading
+from collections.abc import Sequence
+
+from wordle_core.packed import PackedWordStore
+from wordle_core.scoring import MAX_WORD_LENGTH, MIN_WORD_LENGTH
+
+WORD_LENGTH = 5
+_ALPHABET = frozenset(string.ascii_lowercase)
+
+SIDECAR_MAGIC = b"WLST"
+SIDECAR_VERSION = 1
+# magic, version, word length, word count, source size, source mtime (ns)
+_SIDECAR_HEADER = struct.Struct("<4sHHIQQ")
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+SHARD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dictionary")
+
+
+class WordList(Sequence):
+    """
+    Deduplicated, validated word list with O(1) membership tests.
+    The membership index is built on the first lookup, so loading a list
+    that is only used for random.choice never pays for it.
+    """
+
+    def __init__(self, words=(), length=WORD_LENGTH):
+        """
+        Args:
+            words (iterable): Candidate words; invalid entries are skipped.
+            length (int): Required word length.
+        """
+        self.length = length
+        self.rejected = 0  # Entries dropped for bad length or characters
+        unique = {}
+        for word in words:
+            word = word.strip().lower()
+            if not word:
+                continue
+            if is_valid_word(word, length):
+                unique.setdefault(word, None)
+            else:
+                self.rejected += 1
+        self._words = tuple(unique)
+        self._index = None
+
+    @classmethod
+    def from_text(cls, text, length=WORD_LENGTH):
+        """
+        Parse a whole word file in one pass.
+        Validation and deduplication run in C (regex scan plus dict.fromkeys)
+        rather than a Python loop per line.
+
+        Args:
+            text (str): File contents, one word per line.
+            length (int): Required word length.
+
+        Returns:
+            WordList: Valid words in first-seen order.
+        """
+        lines = text.lower().split()
+        valid = re.findall(rf"^[a-z]{{{length}}}$", "\n".join(lines), re.MULTILINE)
+        word_list = cls._from_trusted(dict.fromkeys(valid), length)
+        word_list.rejected = len(lines) - len(valid)
+        return word_list
+
+    @classmethod
+    def _from_trusted(cls, words, length):
+        """Build from words already known to be valid and unique (cache loads)."""
+        word_list = cls.__new__(cls)
+        word_list.length = length
+        word_list.rejected = 0
+        word_list._words = tuple(words)
+        word_list._index = None
+        return word_list
+
+    def __contains__(self, word):
+        if self._index is None:
+            self._index = frozenset(self._words)
+        return word in self._index
+
+    def __getitem__(self, index):
+        return self._words[index]
+
+    def __len__(self):
+        return len(self._words)
+
+    def __iter__(self):
+        return iter(self._words)
+
+    def __repr__(self):
+        return f"WordList({len(self)} words, length={self.length})"
+
+
+def as_word_list(words, length=WORD_LENGTH):
+    """
+    Return words as a WordList, reusing it (or a PackedWordStore) as-is.
+    """
+    if isinstance(words, (WordList, PackedWordStore)) and words.length == length:
+        return words
+    return WordList(words, length)
+
+
+def is_valid_word(word, length=WORD_LENGTH):
+    """
+    Check that word has the right length and only letters a-z.
+    """
+    return len(word) == length and _ALPHABET.issuperset(word)
+
+
+# ----------------------------
+# Binary sidecar cache
+# ----------------------------
+def _sidecar_path(filename, length, cache_dir):
+    """Return the sidecar path for a source file."""
+    digest = hashlib.sha1(os.path.abspath(filename).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"words-{digest}-{length}.bin")
+
+
+def _read_sidecar(path, length, stat):
+    """
+    Load a sidecar if it matches the source file's size and mtime.
+
+    Returns:
+        WordList or None: None when the sidecar is missing, stale or corrupt.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_SIDECAR_HEADER.size)
+            if len(header) != _SIDECAR_HEADER.size:
+                return None
+            magic, version, word_length, count, size, mtime = _SIDECAR_HEADER.unpack(header)
+            if (magic, version, word_length, size, mtime) != (
+                    SIDECAR_MAGIC, SIDECAR_VERSION, length, stat.st_size, stat.st_mtime_ns):
+                return None
+            payload = f.read()
+    except OSError:
+        return None
+    try:
+        text = payload.decode("ascii")
+    except UnicodeDecodeError:
+        return None  # Corrupt sidecar: re-parse the source instead
+    # Words are trusted from here on, so a damaged payload must not get through
+    if count and not re.fullmatch(rf"(?:[a-z]{{{length}}}\n)*[a-z]{{{length}}}", text):
+        return None
+    words = text.split("\n") if count else []
+    if len(words) != count:
+        return None
+    return WordList._from_trusted(words, length)
+
+
+def _write_sidecar(path, word_list, stat):
+    """Write a sidecar atomically; failures only cost the next startup a parse."""
+    header = _SIDECAR_HEADER.pack(SIDECAR_MAGIC, SIDECAR_VERSION, word_list.length,
+                                  len(word_list), stat.st_size, stat.st_mtime_ns)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write("\n".join(word_list).encode("ascii"))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+# ----------------------------
+# Loading
+# ----------------------------
+def load_word_list(filename="words.txt", length=WORD_LENGTH, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Load a validated, deduplicated word list, using the binary sidecar when fresh.
+
+    Args:
+        filename (str): Path to the word file, one word per line.
+        length (int): Required word length.
+        cache_dir (str, optional): Sidecar directory; None disables caching.
+
+    Returns:
+        WordList: Words in first-seen order.
+    """
+    stat = os.stat(filename)
+    sidecar = _sidecar_path(filename, length, cache_dir) if cache_dir else None
+    if sidecar:
+        cached = _read_sidecar(sidecar, length, stat)
+        if cached is not None:
+            return cached
+
+    with open(filename, "r") as f:
+        word_list = WordList.from_text(f.read(), length)
+
+    if sidecar:
+        _write_sidecar(sidecar, word_list, stat)
+    return word_list
+
+
+# ----------------------------
+# Length shards
+# ----------------------------
+def shard_path(length, directory=SHARD_DIR):
+    """Return the word file holding the dictionary for one word length."""
+    return os.path.join(directory, f"words-{length}.txt")
+
+
+class WordShards:
+    """
+    Per-length dictionaries, each loaded on first use and then kept.
+    Loading is thread-safe, so a GUI can fetch a shard in the background.
+    """
+
+    def __init__(self, directory=SHARD_DIR, files=None, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Args:
+            directory (str): Folder with the words-<length>.txt shards.
+            files (dict, optional): Word file to use instead for some lengths.
+            cache_dir (str, optional): Sidecar directory; None disables caching.
+        """
+        self.directory = directory
+        self.files = dict(files or {})
+        self.cache_dir = cache_dir
+        self._shards = {}
+        self._lock = threading.Lock()
+
+    def path(self, length):
+        """Return the word file for a length."""
+        return self.files.get(length) or shard_path(length, self.directory)
+
+    def __getitem__(self, length):
+        """
+        Return the WordList for a length, loading it on first use.
+
+        Raises:
+            KeyError: If there is no word file for that length.
+        """
+        shard = self._shards.get(length)
+        if shard is not None:
+            return shard
+        with self._lock:
+            if length not in self._shards:
+                try:
+                    self._shards[length] = load_word_list(self.path(length), length, self.cache_dir)
+                except FileNotFoundError:
+                    raise KeyError(f"no {length}-letter dictionary") from None
+            return self._shards[length]
+
+    def available(self):
+        """Return the lengths that have a word file, without loading any."""
+        return [length for length in range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1)
+                if os.path.exists(self.path(length))]
+
+    def loaded(self):
+        """Return the lengths loaded so far."""
+        return sorted(self._shards)
+
+
+_SHARDS = WordShards()
+
+
+def load_shard(length):
+    """Return the shared dictionary for a word length (loaded on first use)."""
+    return _SHARDS[length]